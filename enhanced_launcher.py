@@ -3,6 +3,7 @@
 # This file is currently disabled to remove startup banners
 # If you need enhanced terminal features, run setup_requirements.py first
 
+import multiprocessing
 import os
 import sys
 
@@ -21,6 +22,7 @@ def show_enhanced_title():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     print("Starting Pokemon Platinum...")
     
     # Setup terminal environment
@@ -1,4 +1,8 @@
+import multiprocessing
+
 from platinum.cli import run
 
 if __name__ == "__main__":
+    # Pool workers of the frozen exe must not start the game (see platinum.battle.mcts)
+    multiprocessing.freeze_support()
     run()
\ No newline at end of file
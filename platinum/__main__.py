@@ -1,4 +1,7 @@
+import multiprocessing
+
 from .cli import run
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     run()
\ No newline at end of file
@@ -0,0 +1,237 @@
+"""Ability hooks compiled per battler.
+
+Abilities register handlers for a few hook points:
+
+* ``attack``       ``fn(user, target, move, field, crit) -> float``: multiplier on
+  the attacking stat, for the attacker's ability (Guts, Huge Power, Blaze...).
+* ``defense``      ``fn(user, target, move, field) -> float``: multiplier on the
+  hit's damage, for the defender's ability (Thick Fat, Filter...).
+* ``switch_in``    ``fn(core, battler, foe, field)``: on entering battle.
+* ``end_of_turn``  ``fn(core, battler, field)``: after status/weather damage.
+* ``contact``      ``fn(core, attacker, defender, move)``: defender reacts to a
+  damaging contact move (Static, Rough Skin...).
+
+:func:`ability_hooks` resolves an ability name into an immutable
+:class:`AbilityHooks` (cached per name). Each :class:`Battler` keeps a
+reference in ``battler.ability_hooks``, refreshed by ``Battler.attach_hooks``
+when it enters battle; a suppressed ability (Gastro Acid) swaps in
+:data:`NO_ABILITY_HOOKS`. The hot path iterates these tuples, so battlers
+whose ability has no battle effect pay nothing per hit.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple
+
+from . import timers
+from .events import FieldChange, StatStage
+
+if TYPE_CHECKING:
+    from .core import BattleCore, Battler
+
+HOOK_POINTS = ("attack", "defense", "switch_in", "end_of_turn", "contact")
+
+# ability -> hook point -> handler
+ABILITIES: Dict[str, Dict[str, Callable]] = {}
+
+# STAB multiplier overrides
+STAB_MULTIPLIER: Dict[str, float] = {"adaptability": 2.0}
+
+# Abilities that keep full Attack while burned
+IGNORES_BURN_CUT = frozenset({"guts"})
+
+def register_ability(name: str, point: str) -> Callable[[Callable], Callable]:
+    if point not in HOOK_POINTS:
+        raise ValueError(f"Unknown ability hook point: {point}")
+
+    def deco(fn: Callable) -> Callable:
+        ABILITIES.setdefault(name, {})[point] = fn
+        _compile.cache_clear()
+        return fn
+    return deco
+
+@dataclass(frozen=True, slots=True)
+class AbilityHooks:
+    name: Optional[str] = None
+    attack: Tuple[Callable, ...] = ()
+    defense: Tuple[Callable, ...] = ()
+    switch_in: Tuple[Callable, ...] = ()
+    end_of_turn: Tuple[Callable, ...] = ()
+    contact: Tuple[Callable, ...] = ()
+    stab: float = 1.5
+    ignore_burn_cut: bool = False
+
+    def __reduce__(self):
+        # Handlers may be closures; pickle/deepcopy by name and recompile (shared, cached)
+        return (ability_hooks, (self.name,))
+
+NO_ABILITY_HOOKS = AbilityHooks()
+
+def ability_hooks(name: Optional[str]) -> AbilityHooks:
+    """Compiled hooks for ability ``name`` (NO_ABILITY_HOOKS if it has no battle effect)."""
+    return _compile(str(name or "").strip().lower().replace(" ", "-").replace("_", "-"))
+
+@lru_cache(maxsize=None)
+def _compile(key: str) -> AbilityHooks:
+    table = ABILITIES.get(key, {})
+    stab = STAB_MULTIPLIER.get(key, 1.5)
+    burn = key in IGNORES_BURN_CUT
+    if not table and stab == 1.5 and not burn:
+        return NO_ABILITY_HOOKS
+    return AbilityHooks(key, *((table[p],) if p in table else () for p in HOOK_POINTS), stab=stab,
+                        ignore_burn_cut=burn)
+
+def _boost(core: "BattleCore", b: "Battler", attr: str, stat: str, change: int):
+    cur = getattr(b.stages, attr)
+    new = max(-6, min(6, cur + change))
+    if new != cur:
+        setattr(b.stages, attr, new)
+        core._emit(StatStage, b, stat, change)
+
+def _heal_sixteenth(core: "BattleCore", b: "Battler", ability: str, text: str):
+    if 0 < (b.current_hp or 0) < b.stats["hp"]:
+        core.apply_heal(b, max(1, b.stats["hp"] // 16), cause='ability', meta={'ability': ability})
+        core._msg(text.format(name=b.name))
+
+# ---------------------------------------------------------------- damage calc
+
+@register_ability("guts", "attack")
+def _guts(user, target, move, field, crit) -> float:
+    return 1.5 if move.category == "physical" and user.status != "none" else 1.0
+
+def _huge_power(user, target, move, field, crit) -> float:
+    return 2.0 if move.category == "physical" else 1.0
+
+register_ability("huge-power", "attack")(_huge_power)
+register_ability("pure-power", "attack")(_huge_power)
+
+@register_ability("hustle", "attack")
+def _hustle(user, target, move, field, crit) -> float:
+    return 1.5 if move.category == "physical" else 1.0
+
+def _pinch(move_type: str) -> Callable:
+    def hook(user, target, move, field, crit) -> float:
+        return 1.5 if move.type == move_type and (user.current_hp or 0) * 3 <= user.stats["hp"] else 1.0
+    return hook
+
+for _name, _type in (("blaze", "fire"), ("overgrow", "grass"), ("torrent", "water"), ("swarm", "bug")):
+    register_ability(_name, "attack")(_pinch(_type))
+
+@register_ability("technician", "attack")
+def _technician(user, target, move, field, crit) -> float:
+    return 1.5 if 0 < move.power <= 60 else 1.0
+
+@register_ability("reckless", "attack")
+def _reckless(user, target, move, field, crit) -> float:
+    return 1.2 if move.recoil_ratio else 1.0
+
+@register_ability("solar-power", "attack")
+def _solar_power(user, target, move, field, crit) -> float:
+    return 1.5 if move.category == "special" and field.weather == "sun" else 1.0
+
+@register_ability("thick-fat", "defense")
+def _thick_fat(user, target, move, field) -> float:
+    return 0.5 if move.type in ("fire", "ice") else 1.0
+
+@register_ability("heatproof", "defense")
+def _heatproof(user, target, move, field) -> float:
+    return 0.5 if move.type == "fire" else 1.0
+
+@register_ability("dry-skin", "defense")
+def _dry_skin(user, target, move, field) -> float:
+    return 1.25 if move.type == "fire" else 1.0
+
+@register_ability("marvel-scale", "defense")
+def _marvel_scale(user, target, move, field) -> float:
+    return 1 / 1.5 if move.category == "physical" and target.status != "none" else 1.0
+
+def _filter(user, target, move, field) -> float:
+    from .core import _TYPE_CHART
+    eff = 1.0
+    row = _TYPE_CHART.get(move.type, {})
+    for t in target.types:
+        eff *= row.get(t, 1.0)
+    return 0.75 if eff > 1 else 1.0
+
+register_ability("filter", "defense")(_filter)
+register_ability("solid-rock", "defense")(_filter)
+
+# ---------------------------------------------------------------- switch-in
+
+@register_ability("intimidate", "switch_in")
+def _intimidate(core, b, foe, field):
+    if foe is None or (foe.current_hp or 0) <= 0:
+        return
+    core._msg(f"{b.name}'s Intimidate cuts {foe.name}'s Attack!")
+    _boost(core, foe, "attack", "attack", -1)
+
+def _weather_setter(weather: str) -> Callable:
+    def hook(core, b, foe, field):
+        if field.weather != weather:
+            # Ability weather lasts until replaced: no timer
+            field.weather = weather
+            timers.stop(field, "weather")
+            core._emit(FieldChange, weather, True)
+    return hook
+
+for _name, _weather in (("drizzle", "rain"), ("drought", "sun"), ("sand-stream", "sand"), ("snow-warning", "hail")):
+    register_ability(_name, "switch_in")(_weather_setter(_weather))
+
+# ---------------------------------------------------------------- end of turn
+
+@register_ability("speed-boost", "end_of_turn")
+def _speed_boost(core, b, field):
+    if (b.current_hp or 0) > 0:
+        _boost(core, b, "speed", "speed", 1)
+
+@register_ability("rain-dish", "end_of_turn")
+def _rain_dish(core, b, field):
+    if field.weather == "rain":
+        _heal_sixteenth(core, b, "rain-dish", "{name} restored HP with Rain Dish!")
+
+@register_ability("ice-body", "end_of_turn")
+def _ice_body(core, b, field):
+    if field.weather == "hail":
+        _heal_sixteenth(core, b, "ice-body", "{name} restored HP with Ice Body!")
+
+@register_ability("shed-skin", "end_of_turn")
+def _shed_skin(core, b, field):
+    if b.status != "none" and (b.current_hp or 0) > 0 and core.rng.randint(1, 100) <= 30:
+        core._msg(f"{b.name} shed its skin!")
+        core._cure_status(b, announce=False)
+
+@register_ability("hydration", "end_of_turn")
+def _hydration(core, b, field):
+    if field.weather == "rain" and b.status != "none" and (b.current_hp or 0) > 0:
+        core._msg(f"{b.name}'s Hydration cured its status!")
+        core._cure_status(b, announce=False)
+
+# ---------------------------------------------------------------- contact
+
+@register_ability("rough-skin", "contact")
+def _rough_skin(core, attacker, defender, move):
+    core.apply_damage(attacker, max(1, defender.stats['hp'] // 16), cause='ability', meta={'ability': 'rough-skin'})
+    core._msg(f"{attacker.name} is hurt by Rough Skin!")
+
+def _contact_status(code: str, text: str) -> Callable:
+    def hook(core, attacker, defender, move):
+        if attacker.status == 'none' and core.rng.randint(1, 100) <= 30:
+            attacker.status = code
+            core._msg(text.format(name=attacker.name))
+    return hook
+
+register_ability("static", "contact")(_contact_status('par', "{name} is paralyzed by Static!"))
+register_ability("flame-body", "contact")(_contact_status('brn', "{name} is burned by Flame Body!"))
+register_ability("poison-point", "contact")(_contact_status('psn', "{name} is poisoned by Poison Point!"))
+
+@register_ability("effect-spore", "contact")
+def _effect_spore(core, attacker, defender, move):
+    if attacker.status == 'none' and core.rng.randint(1, 100) <= 30:
+        code = core.rng.choice(('psn', 'par', 'slp'))
+        if core._apply_status(attacker, code):
+            core._msg(f"{attacker.name} was affected by Effect Spore!")
+
+__all__ = [
+    "ABILITIES", "AbilityHooks", "HOOK_POINTS", "IGNORES_BURN_CUT", "NO_ABILITY_HOOKS", "STAB_MULTIPLIER",
+    "ability_hooks", "register_ability",
+]
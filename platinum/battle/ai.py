@@ -0,0 +1,449 @@
+"""Search-based opponent AI for trainer battles.
+
+:class:`ExpectimaxAI` picks the enemy's move with a depth-limited
+expectimax over both sides' move choices. Each turn of the search tree
+expands:
+
+* turn order (priority, effective speed, a coin flip on ties);
+* chance nodes for full paralysis, thawing, accuracy, crits, secondary
+  ailments and a few damage-roll buckets of ``BattleCore``'s 0.85-1.0 roll;
+* end-of-turn chip (poison, burn, toxic, sand/hail) and Leftovers.
+
+The player's reply is modelled as a blend of their best reply and their
+average reply (``AIProfile.caution``), since the two sides choose
+simultaneously. The model only covers the two active battlers; switching,
+field effects started mid-search and special-case moves are ignored.
+
+States are flat int tuples hashed with Zobrist keys, so children update the
+hash incrementally and the transposition table is keyed by one int.
+Iterative deepening runs until the per-turn budget is spent and keeps the
+best move of the deepest completed iteration; depth 1 always completes.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+import random
+import time
+
+from .core import (
+    BattleCore, Battler, Move, FieldState, stage_multiplier_stat, stage_multiplier_acc_eva,
+    _CRIT_TABLE, _DEF_WEATHER_IMMUNITY,
+)
+from .session import BattleSession
+
+@dataclass(frozen=True)
+class AIProfile:
+    budget_ms: float = 40.0      # wall-clock search budget per decision
+    max_depth: int = 2           # turns searched ahead at most
+    roll_buckets: int = 2        # damage-roll quantiles per non-crit hit
+    caution: float = 0.5         # weight of the player's best reply vs. their average reply
+    tt_size: int = 200_000       # transposition table entries before it is cleared
+
+# Trainer id prefix -> search profile; ``route`` is the default tier
+TRAINER_PROFILES: Dict[str, AIProfile] = {
+    "route": AIProfile(budget_ms=40, max_depth=1),
+    "rival": AIProfile(budget_ms=120, max_depth=2),
+    "gym_leader": AIProfile(budget_ms=400, max_depth=3, roll_buckets=3),
+    "elite_four": AIProfile(budget_ms=800, max_depth=4, roll_buckets=3, caution=0.7),
+    "champion": AIProfile(budget_ms=1200, max_depth=4, roll_buckets=3, caution=0.7),
+}
+
+def profile_for_trainer(trainer_id: Optional[str]) -> AIProfile:
+    """Search profile for a trainer id such as ``gym_leader_roark`` or ``rival_barry_1``."""
+    tid = (trainer_id or "").lower()
+    for prefix, profile in TRAINER_PROFILES.items():
+        if tid.startswith(prefix):
+            return profile
+    return TRAINER_PROFILES["route"]
+
+# ---------------------------------------------------------------- state layout
+# Per side: hp, seven stat stages, status code, toxic counter, sleep counter
+_HP, _ATK, _DEF, _SPA, _SPD, _SPE, _ACC, _EVA, _STATUS, _TOX, _SLP = range(11)
+_W = 11
+_STATUS_CODES = {"none": 0, "psn": 1, "brn": 2, "par": 3, "slp": 4, "frz": 5, "tox": 6}
+_NONE, _PSN, _BRN, _PAR, _SLP_S, _FRZ, _TOX_S = range(7)
+_AILMENTS = {"paralysis": _PAR, "burn": _BRN, "poison": _PSN, "toxic": _TOX_S, "sleep": _SLP_S, "freeze": _FRZ}
+_STAGE_SLOTS = {"attack": _ATK, "defense": _DEF, "sp-atk": _SPA, "special-attack": _SPA, "sp-def": _SPD,
+                "special-defense": _SPD, "speed": _SPE, "accuracy": _ACC, "evasion": _EVA}
+# Sleep inflicted inside the search lasts the mean of BattleCore's randint(2, 5)
+_MODEL_SLEEP_TURNS = 3
+
+WIN = 2.0
+LOSS = -2.0
+
+class _Zobrist:
+    """Random 64-bit keys per (slot, value); a state's hash is the XOR of its keys."""
+    __slots__ = ("_rng", "_keys")
+
+    def __init__(self, slots: int, seed: int = 0x5EED):
+        self._rng = random.Random(seed)
+        self._keys: List[Dict[int, int]] = [{} for _ in range(slots)]
+
+    def key(self, slot: int, value: int) -> int:
+        table = self._keys[slot]
+        k = table.get(value)
+        if k is None:
+            k = table[value] = self._rng.getrandbits(64)
+        return k
+
+    def hash(self, vals: Tuple[int, ...]) -> int:
+        h = 0
+        for i, v in enumerate(vals):
+            h ^= self.key(i, v)
+        return h
+
+class _Timeout(Exception):
+    pass
+
+@dataclass
+class SearchStats:
+    depth: int = 0               # deepest completed iteration
+    nodes: int = 0
+    tt_hits: int = 0
+    elapsed_ms: float = 0.0
+    value: float = 0.0
+
+    @property
+    def nodes_per_sec(self) -> float:
+        return self.nodes / (self.elapsed_ms / 1000) if self.elapsed_ms > 0 else 0.0
+
+def _side_vals(b: Battler) -> List[int]:
+    st = b.stages
+    return [int(b.current_hp or 0), st.attack, st.defense, st.sp_atk, st.sp_def, st.speed, st.accuracy, st.evasion,
+            _STATUS_CODES.get(b.status, _NONE), int(b.toxic_stage), int(b.sleep_turns)]
+
+def _usable(b: Battler) -> List[int]:
+    return [i for i, m in enumerate(b.moves) if m.max_pp == 0 or m.pp > 0]
+
+class ExpectimaxAI:
+    """Enemy move selection by iterative-deepening expectimax.
+
+    One instance is meant to live for a whole battle so its transposition
+    table carries over between turns.
+    """
+
+    def __init__(self, profile: Optional[AIProfile] = None, core: Optional[BattleCore] = None):
+        self.profile = profile or TRAINER_PROFILES["route"]
+        self.core = core or BattleCore(rng=None, sink=lambda _e: None)
+        self.zobrist = _Zobrist(2 * _W)
+        self.tt: Dict[int, Tuple[int, float]] = {}
+        self._ctx: Optional[tuple] = None
+        self.last = SearchStats()
+        q = self.profile.roll_buckets
+        self._rolls = [0.85 + 0.15 * (i + 0.5) / q for i in range(q)]
+
+    @classmethod
+    def for_trainer(cls, trainer_id: Optional[str]) -> "ExpectimaxAI":
+        return cls(profile_for_trainer(trainer_id))
+
+    # ------------------------------------------------------------- public API
+    def choose(self, session: BattleSession) -> int:
+        """Index into the enemy active's moves; 0 when nothing is usable (Struggle)."""
+        return self.choose_move(session.enemy.active(), session.player.active(), session.field)
+
+    def choose_move(self, me: Battler, foe: Battler, field: Optional[FieldState] = None) -> int:
+        start = time.perf_counter()
+        mine, theirs = _usable(me), _usable(foe)
+        self.last = SearchStats()
+        if len(mine) <= 1:
+            return mine[0] if mine else 0
+        self._setup(me, foe, field or FieldState(), mine, theirs)
+        vals = tuple(_side_vals(me) + _side_vals(foe))
+        h = self.zobrist.hash(vals)
+        deadline = start + self.profile.budget_ms / 1000
+        order = list(mine)
+        best, best_val = order[0], 0.0
+        for depth in range(1, self.profile.max_depth + 1):
+            try:
+                scored = self._root(vals, h, depth, order, None if depth == 1 else deadline)
+            except _Timeout:
+                break
+            # Stable sort keeps move-index order among equal values
+            scored.sort(key=lambda t: -t[1])
+            best, best_val = scored[0]
+            order = [m for m, _ in scored]
+            self.last.depth = depth
+            if abs(best_val) >= WIN or time.perf_counter() >= deadline:
+                break
+        self.last.elapsed_ms = (time.perf_counter() - start) * 1000
+        self.last.value = best_val
+        return best
+
+    # --------------------------------------------------------------- search
+    def _setup(self, me: Battler, foe: Battler, field: FieldState, mine: List[int], theirs: List[int]):
+        self._b = (me, foe)
+        self._moves = ([(i, me.moves[i]) for i in mine], [(i, foe.moves[i]) for i in theirs])
+        self._max_hp = (int(me.stats["hp"]), int(foe.stats["hp"]))
+        self._field = field
+        self._trick = 'trick-room' in field.timers or me.trick_room_active or foe.trick_room_active
+        self._hit_cache: Dict[tuple, float] = {}
+        # TT values are only valid for the same battlers, movesets and static field
+        ctx = (id(me), id(foe), tuple(mine), tuple(theirs), field.weather, field.reflect, field.light_screen, self._trick)
+        if ctx != self._ctx or len(self.tt) > self.profile.tt_size:
+            self.tt.clear()
+            self._ctx = ctx
+
+    def _root(self, vals, h, depth, order, deadline) -> List[Tuple[int, float]]:
+        moves0 = dict(self._moves[0])
+        return [(mi, self._reply_value(vals, h, moves0[mi], depth, deadline)) for mi in order]
+
+    def _reply_value(self, vals, h, mv0: Move, depth: int, deadline) -> float:
+        qs = []
+        for _, mv1 in self._moves[1]:
+            q = 0.0
+            for p, cv, ch in self._turn(vals, h, mv0, mv1):
+                q += p * self._value(cv, ch, depth - 1, deadline)
+            qs.append(q)
+        c = self.profile.caution
+        return c * min(qs) + (1 - c) * sum(qs) / len(qs)
+
+    def _value(self, vals, h, depth: int, deadline) -> float:
+        self.last.nodes += 1
+        if deadline is not None and self.last.nodes & 63 == 0 and time.perf_counter() > deadline:
+            raise _Timeout
+        hp0, hp1 = vals[_HP], vals[_W + _HP]
+        if hp0 <= 0 or hp1 <= 0:
+            return 0.0 if hp0 <= 0 and hp1 <= 0 else (LOSS if hp0 <= 0 else WIN)
+        if depth == 0:
+            return self._evaluate(vals)
+        hit = self.tt.get(h)
+        if hit is not None and hit[0] >= depth:
+            self.last.tt_hits += 1
+            return hit[1]
+        best = max(self._reply_value(vals, h, mv0, depth, deadline) for _, mv0 in self._moves[0])
+        self.tt[h] = (depth, best)
+        return best
+
+    def _evaluate(self, vals) -> float:
+        a, d = vals[:_W], vals[_W:]
+        score = a[_HP] / self._max_hp[0] - d[_HP] / self._max_hp[1]
+        score += 0.03 * (max(a[_ATK], a[_SPA]) + a[_SPE] - max(d[_ATK], d[_SPA]) - d[_SPE])
+        score += 0.02 * (a[_DEF] + a[_SPD] - d[_DEF] - d[_SPD])
+        score += 0.1 * ((d[_STATUS] != _NONE) - (a[_STATUS] != _NONE))
+        return score
+
+    # -------------------------------------------------------------- model
+    def _set(self, vals: list, h: int, slot: int, value: int) -> int:
+        old = vals[slot]
+        if old != value:
+            z = self.zobrist
+            h ^= z.key(slot, old) ^ z.key(slot, value)
+            vals[slot] = value
+        return h
+
+    def _speed(self, vals, s: int) -> float:
+        b = self._b[s]
+        spd = b.stats["speed"] * stage_multiplier_stat(vals[s * _W + _SPE])
+        return spd * 0.25 if vals[s * _W + _STATUS] == _PAR else spd
+
+    def _turn(self, vals, h, mv0: Move, mv1: Move) -> List[Tuple[float, tuple, int]]:
+        """Distribution over states after one full turn, merged by hash."""
+        if mv0.priority != mv1.priority:
+            orders = [(1.0, (0, 1) if mv0.priority > mv1.priority else (1, 0))]
+        else:
+            s0, s1 = self._speed(vals, 0), self._speed(vals, 1)
+            if s0 == s1:
+                orders = [(0.5, (0, 1)), (0.5, (1, 0))]
+            else:
+                orders = [(1.0, (0, 1) if (s0 > s1) ^ self._trick else (1, 0))]
+        moves = (mv0, mv1)
+        out: Dict[int, list] = {}
+        for po, (first, second) in orders:
+            for p1, v1, h1 in self._act(vals, h, first, moves[first]):
+                for p2, v2, h2 in self._act(v1, h1, second, moves[second]):
+                    v3, h3 = self._end_of_turn(v2, h2)
+                    acc = out.get(h3)
+                    if acc is None:
+                        out[h3] = [po * p1 * p2, v3]
+                    else:
+                        acc[0] += po * p1 * p2
+        return [(p, v, hh) for hh, (p, v) in out.items()]
+
+    def _act(self, vals, h, a: int, mv: Move) -> List[Tuple[float, tuple, int]]:
+        A, D = a * _W, (1 - a) * _W
+        if vals[A + _HP] <= 0 or vals[D + _HP] <= 0:
+            return [(1.0, vals, h)]
+        status = vals[A + _STATUS]
+        if status == _SLP_S:
+            v = list(vals)
+            left = max(0, v[A + _SLP] - 1)
+            h = self._set(v, h, A + _SLP, left)
+            if left > 0:
+                return [(1.0, tuple(v), h)]
+            h = self._set(v, h, A + _STATUS, _NONE)
+            return self._execute(tuple(v), h, a, mv)
+        if status == _FRZ:
+            v = list(vals)
+            hh = self._set(v, h, A + _STATUS, _NONE)
+            return [(0.8, vals, h)] + [(0.2 * p, cv, ch) for p, cv, ch in self._execute(tuple(v), hh, a, mv)]
+        if status == _PAR:
+            return [(0.25, vals, h)] + [(0.75 * p, cv, ch) for p, cv, ch in self._execute(vals, h, a, mv)]
+        return self._execute(vals, h, a, mv)
+
+    def _hit_chance(self, vals, a: int, mv: Move) -> float:
+        if mv.accuracy is None:
+            return 1.0
+        mult = stage_multiplier_acc_eva(vals[a * _W + _ACC]) / stage_multiplier_acc_eva(vals[(1 - a) * _W + _EVA])
+        return min(1.0, max(0.0, mv.accuracy * mult / 100))
+
+    def _execute(self, vals, h, a: int, mv: Move) -> List[Tuple[float, tuple, int]]:
+        p_hit = self._hit_chance(vals, a, mv)
+        if p_hit <= 0:
+            return [(1.0, vals, h)]
+        if mv.category == "status" or mv.power <= 0:
+            landed = self._status_move(vals, h, a, mv)
+        else:
+            landed = self._damaging_move(vals, h, a, mv)
+        if p_hit >= 1:
+            return landed
+        return [(1 - p_hit, vals, h)] + [(p_hit * p, cv, ch) for p, cv, ch in landed]
+
+    def _status_move(self, vals, h, a: int, mv: Move) -> List[Tuple[float, tuple, int]]:
+        A, D = a * _W, (1 - a) * _W
+        target = self._b[1 - a]
+        if self.core.get_effectiveness(mv.type, target.types) == 0.0:
+            return [(1.0, vals, h)]
+        v = list(vals)
+        for sc in mv.stat_changes:
+            slot = _STAGE_SLOTS.get(str(sc.get("stat")).replace("_", "-").lower())
+            change = int(sc.get("change", 0) or 0)
+            if slot is None or change == 0:
+                continue
+            base = A if change > 0 else D
+            h = self._set(v, h, base + slot, max(-6, min(6, v[base + slot] + change)))
+        code = _AILMENTS.get(mv.ailment or "")
+        if code is None or not self._can_afflict(v, 1 - a, code):
+            return [(1.0, tuple(v), h)]
+        chance = (mv.ailment_chance or 100) / 100
+        plain = tuple(v)
+        hh = self._afflict(v, h, 1 - a, code)
+        if chance >= 1:
+            return [(1.0, tuple(v), hh)]
+        return [(1 - chance, plain, h), (chance, tuple(v), hh)]
+
+    def _can_afflict(self, vals, s: int, code: int) -> bool:
+        if vals[s * _W + _STATUS] != _NONE or vals[s * _W + _HP] <= 0:
+            return False
+        types = self._b[s].types
+        if code == _BRN and "fire" in types:
+            return False
+        if code in (_PSN, _TOX_S) and ("poison" in types or "steel" in types):
+            return False
+        if code == _FRZ and "ice" in types:
+            return False
+        return True
+
+    def _afflict(self, v: list, h: int, s: int, code: int) -> int:
+        h = self._set(v, h, s * _W + _STATUS, code)
+        if code == _SLP_S:
+            h = self._set(v, h, s * _W + _SLP, _MODEL_SLEEP_TURNS)
+        elif code == _TOX_S:
+            h = self._set(v, h, s * _W + _TOX, 0)
+        return h
+
+    def _hit(self, a: int, mv: Move, atk_stage: int, def_stage: int, burned: bool, crit: bool) -> float:
+        """Pre-roll damage of one hit with STAB and effectiveness; mirrors BattleCore.hit_base."""
+        key = (a, id(mv), atk_stage, def_stage, burned, crit)
+        x = self._hit_cache.get(key)
+        if x is not None:
+            return x
+        user, target = self._b[a], self._b[1 - a]
+        phys = mv.category == "physical"
+        atk = user.stats["atk" if phys else "sp_atk"]
+        dfn = target.stats["def" if phys else "sp_def"]
+        if crit:
+            atk *= stage_multiplier_stat(max(0, atk_stage))
+            dfn *= stage_multiplier_stat(min(0, def_stage))
+        else:
+            atk *= stage_multiplier_stat(atk_stage)
+            dfn *= stage_multiplier_stat(def_stage)
+            if phys and burned and not user.ability_hooks.ignore_burn_cut:
+                atk *= 0.5
+        # Ability multipliers read the battlers' current state (HP, status)
+        for hook in user.ability_hooks.attack:
+            atk *= hook(user, target, mv, self._field, crit)
+        for hook in user.item_hooks.attack:
+            atk *= hook(user, target, mv, self._field, crit)
+        base = (((2 * user.level / 5) + 2) * mv.power * atk / max(1, dfn)) / 50 + 2
+        field = self._field
+        if field.weather == "sun":
+            base *= 1.5 if mv.type == "fire" else (0.5 if mv.type == "water" else 1.0)
+        elif field.weather == "rain":
+            base *= 1.5 if mv.type == "water" else (0.5 if mv.type == "fire" else 1.0)
+        if crit:
+            base *= 2
+        elif (phys and field.reflect) or (mv.category == "special" and field.light_screen):
+            base *= 0.5
+        for hook in target.ability_hooks.defense:
+            base *= hook(user, target, mv, field)
+        for hook in user.item_hooks.damage:
+            base *= hook(user, target, mv, field)
+        x = base * self.core.stab(user, mv) * self.core.get_effectiveness(mv.type, target.types)
+        self._hit_cache[key] = x
+        return x
+
+    def _damaging_move(self, vals, h, a: int, mv: Move) -> List[Tuple[float, tuple, int]]:
+        A, D = a * _W, (1 - a) * _W
+        if self.core.get_effectiveness(mv.type, self._b[1 - a].types) == 0.0:
+            return [(1.0, vals, h)]
+        phys = mv.category == "physical"
+        atk_stage = vals[A + (_ATK if phys else _SPA)]
+        def_stage = vals[D + (_DEF if phys else _SPD)]
+        burned = vals[A + _STATUS] == _BRN
+        hits = int(round(sum(mv.hits) / 2)) if mv.hits else 1
+        c = _CRIT_TABLE.get(max(0, min(int(mv.crit_rate_stage + (1 if mv.high_crit else 0)), 4)), 1 / 16)
+        q = len(self._rolls)
+        branches = [((1 - c) / q, self._hit(a, mv, atk_stage, def_stage, burned, False) * r) for r in self._rolls]
+        branches.append((c, self._hit(a, mv, atk_stage, def_stage, burned, True) * 0.925))
+        out = []
+        code = _AILMENTS.get(mv.ailment or "")
+        p_ail = (mv.ailment_chance or 0) / 100 if code is not None else 0.0
+        for p, x in branches:
+            dmg = int(max(1, x)) * hits
+            v = list(vals)
+            hp_d = max(0, v[D + _HP] - dmg)
+            dealt = v[D + _HP] - hp_d
+            hh = self._set(v, h, D + _HP, hp_d)
+            if dealt > 0 and mv.drain_ratio:
+                num, den = mv.drain_ratio
+                hh = self._set(v, hh, A + _HP, min(self._max_hp[a], v[A + _HP] + max(1, dealt * num // den)))
+            if dealt > 0 and mv.recoil_ratio:
+                num, den = mv.recoil_ratio
+                hh = self._set(v, hh, A + _HP, max(0, v[A + _HP] - max(1, dealt * num // den)))
+            if p_ail > 0 and self._can_afflict(v, 1 - a, code):
+                out.append((p * (1 - p_ail), tuple(v), hh))
+                hh = self._afflict(v, hh, 1 - a, code)
+                out.append((p * p_ail, tuple(v), hh))
+            else:
+                out.append((p, tuple(v), hh))
+        return out
+
+    def _end_of_turn(self, vals, h) -> Tuple[tuple, int]:
+        v = list(vals)
+        weather = self._field.weather
+        immune = _DEF_WEATHER_IMMUNITY.get(weather or "")
+        for s in (0, 1):
+            S = s * _W
+            if v[S + _HP] <= 0:
+                continue
+            mx = self._max_hp[s]
+            b = self._b[s]
+            st = v[S + _STATUS]
+            if st in (_PSN, _BRN):
+                h = self._set(v, h, S + _HP, max(0, v[S + _HP] - max(1, mx // 8)))
+            elif st == _TOX_S:
+                stage = min(15, v[S + _TOX] + 1)
+                h = self._set(v, h, S + _TOX, stage)
+                h = self._set(v, h, S + _HP, max(0, v[S + _HP] - max(1, mx * stage // 16)))
+            if immune is not None and not any(t in immune for t in b.types):
+                h = self._set(v, h, S + _HP, max(0, v[S + _HP] - max(1, mx // 16)))
+            if 0 < v[S + _HP] < mx and b.item_hooks.name == "leftovers":
+                h = self._set(v, h, S + _HP, min(mx, v[S + _HP] + max(1, mx // 16)))
+        return tuple(v), h
+
+def trainer_ai(trainer_id: Optional[str], *, seed: int = 0):
+    """Opponent AI for a trainer: MCTS for Elite Four / Champion, expectimax otherwise."""
+    from .mcts import mcts_for_trainer
+    return mcts_for_trainer(trainer_id, seed=seed) or ExpectimaxAI.for_trainer(trainer_id)
+
+__all__ = ["AIProfile", "ExpectimaxAI", "SearchStats", "TRAINER_PROFILES", "profile_for_trainer", "trainer_ai"]
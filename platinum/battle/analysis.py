@@ -0,0 +1,274 @@
+"""Vectorized team coverage and matchup analysis.
+
+:func:`analyze` takes the player's party and a set of opponents (a trainer
+party or a route's encounter table, see :func:`trainer_opponents` and
+:func:`route_opponents`) and builds, with NumPy broadcasting over
+party x move x opponent:
+
+* ``effectiveness[p, m, o]``: type multiplier of party member ``p``'s move
+  ``m`` against opponent ``o``;
+* ``damage[p, m, o]``: expected damage of that move as a fraction of the
+  opponent's max HP.
+
+The expected damage follows :meth:`BattleCore.hit_base` on a neutral field
+(no stages, status, weather or screens) times the mean damage roll, crit
+chance, STAB (the attacker's ability sets the multiplier), accuracy and mean
+hit count. Abilities other than STAB, held items, fixed-damage moves (see
+:data:`platinum.battle.effects.MOVE_EFFECTS`) and status moves are not
+counted. The same matrices are built in the other direction to rank how
+threatening each opponent is to the party.
+
+Encounter slots are weighted by their share of the encounter table, so a
+route's threat ranking reflects how often each species shows up.
+
+CLI:
+  python -m platinum.battle.analysis --party turtwig:12 --party starly:10 \
+      --trainer gym_leader_roark
+  python -m platinum.battle.analysis --save --route route203 --method grass
+
+Requires NumPy (``pip install platinum-text[sim]``).
+"""
+from __future__ import annotations
+import argparse
+import json
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .batch import _CRIT_P, _NO_TYPE, _TYPE_INDEX, _TYPE_MATRIX
+from .core import Battler
+from .effects import MOVE_EFFECTS
+from .sim import MemberSpec, parse_party, trainer_party
+
+MAX_MOVES = 4
+MEAN_ROLL = 0.925   # mean of the uniform 0.85-1.0 damage roll
+SUPER_EFFECTIVE = 2.0
+
+# ---------------------------------------------------------------------------
+# Opponent sets
+# ---------------------------------------------------------------------------
+def trainer_opponents(trainer_id: str, flags: Iterable[str] = ()) -> Tuple[List[MemberSpec], List[float]]:
+    """Party of ``assets/trainers/<trainer_id>.json``; every member weighs the same."""
+    specs = trainer_party(trainer_id, flags)
+    return specs, [1.0] * len(specs)
+
+def route_opponents(zone: str, method: Optional[str] = None,
+                    time_of_day: Optional[str] = None) -> Tuple[List[MemberSpec], List[float]]:
+    """Species of a zone's encounter table at their mid level, weighted by encounter share.
+
+    ``method`` limits the table to one encounter method; otherwise every
+    method counts equally. Slots restricted to other times of day are
+    dropped when ``time_of_day`` is given.
+    """
+    from platinum.encounters.loader import _resolve_zone, load_encounters
+    table = load_encounters().get(_resolve_zone(zone))
+    if table is None:
+        raise KeyError(f"No encounter table for zone: {zone}")
+    methods = [method] if method else sorted(table.methods)
+    weights: Dict[Tuple[int, int], float] = defaultdict(float)
+    for name in methods:
+        mt = table.methods.get(name)
+        if mt is None:
+            raise KeyError(f"Zone {zone} has no {name} encounters")
+        slots = [s for s in mt.slots if not s.time or not time_of_day or time_of_day in s.time]
+        total = sum(s.weight for s in slots)
+        for s in slots:
+            weights[(s.species, (s.min + s.max) // 2)] += s.weight / total / len(methods)
+    specs = [MemberSpec(sid, level) for sid, level in weights]
+    return specs, list(weights.values())
+
+# ---------------------------------------------------------------------------
+# Matrices
+# ---------------------------------------------------------------------------
+@dataclass
+class _Side:
+    names: List[str]
+    moves: List[List[str]]   # display names per member, padded moves omitted
+    level: np.ndarray        # (N,)
+    atk: np.ndarray          # (N, 2) physical / special attacking stat
+    dfn: np.ndarray          # (N, 2) physical / special defending stat
+    hp: np.ndarray           # (N,)
+    types: np.ndarray        # (N, 2) type indices, _NO_TYPE for padding
+    stab: np.ndarray         # (N,)
+    power: np.ndarray        # (N, M) 0 for padding and non-damaging moves
+    m_type: np.ndarray       # (N, M)
+    special: np.ndarray      # (N, M) 0 physical, 1 special
+    factor: np.ndarray       # (N, M) accuracy x mean hits x expected crit multiplier
+
+def _damaging(m) -> bool:
+    return m.category in ("physical", "special") and (m.power or 0) > 0 and m.slug not in MOVE_EFFECTS
+
+def _side(battlers: Sequence[Battler]) -> _Side:
+    n = len(battlers)
+    s = _Side(
+        names=[b.name for b in battlers], moves=[[m.name for m in b.moves] for b in battlers],
+        level=np.zeros(n), atk=np.zeros((n, 2)), dfn=np.ones((n, 2)), hp=np.ones(n),
+        types=np.full((n, 2), _NO_TYPE, dtype=np.int64), stab=np.ones(n),
+        power=np.zeros((n, MAX_MOVES)), m_type=np.full((n, MAX_MOVES), _NO_TYPE, dtype=np.int64),
+        special=np.zeros((n, MAX_MOVES), dtype=np.int64), factor=np.zeros((n, MAX_MOVES)),
+    )
+    for i, b in enumerate(battlers):
+        st = b.stats
+        s.level[i], s.hp[i], s.stab[i] = b.level, st.hp, b.ability_hooks.stab
+        s.atk[i] = st.atk, st.sp_atk
+        s.dfn[i] = max(1, st.def_), max(1, st.sp_def)
+        for j, t in enumerate(b.types[:2]):
+            s.types[i, j] = _TYPE_INDEX.get(t.lower(), _NO_TYPE)
+        for j, m in enumerate(b.moves[:MAX_MOVES]):
+            if not _damaging(m) or m.type not in _TYPE_INDEX:
+                continue
+            s.power[i, j] = m.power
+            s.m_type[i, j] = _TYPE_INDEX[m.type]
+            s.special[i, j] = m.category == "special"
+            hits = (m.hits[0] + m.hits[1]) / 2 if m.hits else 1.0
+            crit = _CRIT_P[max(0, min(4, m.crit_rate_stage + (1 if m.high_crit else 0)))]
+            s.factor[i, j] = (m.accuracy if m.accuracy is not None else 100) / 100 * hits * (1 + crit)
+    return s
+
+def _matrices(att: _Side, dfn: _Side) -> Tuple[np.ndarray, np.ndarray]:
+    """(effectiveness, expected damage / max HP), both shaped (attackers, moves, defenders)."""
+    eff = (_TYPE_MATRIX[att.m_type[:, :, None], dfn.types[None, None, :, 0]]
+           * _TYPE_MATRIX[att.m_type[:, :, None], dfn.types[None, None, :, 1]])
+    atk = np.take_along_axis(att.atk, att.special, axis=1)                      # (A, M)
+    dfs = dfn.dfn.T[att.special]                                                # (A, M, D)
+    base = ((2 * att.level / 5 + 2)[:, None, None] * att.power[:, :, None] * atk[:, :, None] / dfs) / 50 + 2
+    stab = np.where((att.m_type[:, :, None] == att.types[:, None, :]).any(axis=2), att.stab[:, None], 1.0)
+    dmg = base * MEAN_ROLL * (stab * att.factor)[:, :, None] * eff
+    dmg[att.power == 0] = 0.0
+    eff = np.where((att.power > 0)[:, :, None], eff, np.nan)
+    return eff, dmg / dfn.hp[None, None, :]
+
+# ---------------------------------------------------------------------------
+# Report
+# ---------------------------------------------------------------------------
+@dataclass
+class BestAttacker:
+    opponent: str
+    member: str
+    move: str
+    damage: float        # expected fraction of the opponent's HP per attack
+    hits_to_ko: int
+
+@dataclass
+class Threat:
+    opponent: str
+    weight: float        # share of encounters (1.0 per trainer member)
+    damage: float        # mean over the party of the opponent's best expected damage fraction
+    worst_target: str    # party member it hurts most
+
+@dataclass
+class MatchupReport:
+    party: List[str]
+    opponents: List[str]
+    weights: np.ndarray        # (O,)
+    effectiveness: np.ndarray  # (P, M, O), NaN for non-damaging/padded moves
+    damage: np.ndarray         # (P, M, O) expected fraction of the opponent's max HP
+    incoming: np.ndarray       # (O, M, P) opponents' expected damage fraction against the party
+    party_moves: List[List[str]]
+    best: List[BestAttacker]
+    gaps: List[str]            # opponents no party member hits super-effectively
+    threats: List[Threat]      # most threatening first
+
+    def best_damage(self) -> np.ndarray:
+        """(P, O) best expected damage fraction of each member against each opponent."""
+        return self.damage.max(axis=1)
+
+    def to_dict(self) -> dict:
+        return {
+            "party": self.party, "opponents": self.opponents, "weights": self.weights.tolist(),
+            "best_damage": self.best_damage().round(4).tolist(),
+            "best": [asdict(b) for b in self.best], "gaps": self.gaps, "threats": [asdict(t) for t in self.threats],
+        }
+
+    def format(self) -> str:
+        best = self.best_damage()
+        width = max([len(n) for n in self.party] + [6])
+        lines = ["Best expected damage (% of opponent HP per attack, * = super effective):",
+                 " " * (width + 2) + " ".join(f"{o[:12]:>12}" for o in self.opponents)]
+        se = np.nan_to_num(self.effectiveness, nan=0.0).max(axis=1) >= SUPER_EFFECTIVE
+        for p, name in enumerate(self.party):
+            cells = [f"{best[p, o]:>11.0%}{'*' if se[p, o] else ' '}" for o in range(len(self.opponents))]
+            lines.append(f"{name:<{width}}  " + " ".join(cells))
+        lines.append("Best attacker per opponent:")
+        for b in self.best:
+            lines.append(f"  {b.opponent:<14} {b.member} / {b.move}: {b.damage:.0%} per attack, {b.hits_to_ko}HKO")
+        lines.append("Coverage gaps (no super-effective move): " + (", ".join(self.gaps) or "none"))
+        lines.append("Threats:")
+        for t in self.threats:
+            lines.append(f"  {t.opponent:<14} weight {t.weight:5.1%}  {t.damage:5.0%} of party HP per attack, "
+                         f"worst vs {t.worst_target}")
+        return "\n".join(lines)
+
+def _label(specs: Sequence[MemberSpec], battlers: Sequence[Battler]) -> List[str]:
+    return [f"{b.name} L{s.level}" for s, b in zip(specs, battlers)]
+
+def analyze(party: Sequence[MemberSpec], opponents: Sequence[MemberSpec],
+            weights: Optional[Sequence[float]] = None) -> MatchupReport:
+    if not party or not opponents:
+        raise ValueError("Party and opponents must not be empty")
+    ours = [s.build() for s in party]
+    theirs = [s.build() for s in opponents]
+    a, b = _side(ours), _side(theirs)
+    eff, dmg = _matrices(a, b)
+    _, incoming = _matrices(b, a)
+    w = np.ones(len(theirs)) if weights is None else np.asarray(weights, dtype=np.float64)
+    names, opp = _label(party, ours), _label(opponents, theirs)
+
+    per_member = dmg.max(axis=1)                                    # (P, O)
+    best_p = per_member.argmax(axis=0)                              # (O,)
+    best_m = dmg.argmax(axis=1)[best_p, np.arange(len(theirs))]     # (O,)
+    best = []
+    for o, (p, m) in enumerate(zip(best_p, best_m)):
+        d = float(per_member[p, o])
+        move = a.moves[p][m] if d > 0 else "-"
+        best.append(BestAttacker(opp[o], names[p], move, d, int(np.ceil(1 / d)) if d > 0 else 0))
+    se_any = (np.nan_to_num(eff, nan=0.0) >= SUPER_EFFECTIVE).any(axis=(0, 1))
+    gaps = [opp[o] for o in np.flatnonzero(~se_any)]
+
+    threat_pm = incoming.max(axis=1)                                # (O, P)
+    score = threat_pm.mean(axis=1)
+    threats = [Threat(opp[o], float(w[o]), float(score[o]), names[int(threat_pm[o].argmax())])
+               for o in np.argsort(-score * w, kind="stable")]
+    return MatchupReport(names, opp, w, eff, dmg, incoming, a.moves, best, gaps, threats)
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+def _save_party() -> List[MemberSpec]:
+    from platinum.system.save import load_latest
+    from platinum.data.species_lookup import species_id
+    state = load_latest()
+    if state is None or not state.party:
+        raise SystemExit("No saved party found")
+    return [MemberSpec(species_id(pm.species), pm.level, tuple(pm.moves[:MAX_MOVES]) or None) for pm in state.party]
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m platinum.battle.analysis", description="Team coverage and matchups")
+    src = ap.add_mutually_exclusive_group(required=True)
+    src.add_argument("--party", action="append", help="species:level[:move,move] | trainer:<id> | config:<id>")
+    src.add_argument("--save", action="store_true", help="use the party from the latest save")
+    opp = ap.add_mutually_exclusive_group(required=True)
+    opp.add_argument("--trainer", help="trainer id (assets/trainers)")
+    opp.add_argument("--route", help="encounter zone (assets/encounters)")
+    ap.add_argument("--method", help="encounter method for --route (default: all)")
+    ap.add_argument("--time", dest="time_of_day", help="time of day for --route slots")
+    ap.add_argument("--flag", action="append", default=[], help="story flag enabling requires_flag members")
+    ap.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = ap.parse_args(argv)
+    party = _save_party() if args.save else parse_party(args.party, args.flag)
+    if args.trainer:
+        opponents, weights = trainer_opponents(args.trainer, args.flag)
+    else:
+        opponents, weights = route_opponents(args.route, args.method, args.time_of_day)
+    report = analyze(party, opponents, weights)
+    print(json.dumps(report.to_dict(), indent=2) if args.json else report.format())
+    return 0
+
+__all__ = [
+    "BestAttacker", "MatchupReport", "Threat", "analyze", "route_opponents", "trainer_opponents",
+]
+
+if __name__ == "__main__":
+    raise SystemExit(main())
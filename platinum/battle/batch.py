@@ -0,0 +1,311 @@
+"""Lock-step NumPy batch engine for massive 1v1 simulation.
+
+Holds K independent single-battler battles as structure-of-arrays state and
+advances every live battle by one turn per vectorized :meth:`BatchBattle.step`.
+
+Supported mechanics mirror :class:`platinum.battle.core.BattleCore` for a
+shared move subset (see :func:`supports_move`): damage formula with stat
+stages, STAB and type effectiveness, accuracy/evasion, crit stages, priority
+and speed ordering (random tiebreak), burn Attack halving, the low-HP type
+boost abilities (Blaze, Overgrow, Torrent, Swarm), and secondary
+burn/poison plus their end-of-turn residual damage. Both sides pick a uniformly
+random move each turn, the same policy as :mod:`platinum.battle.sim`.
+
+Not modelled: other battle abilities (battlers with one are rejected), held items, weather/screens, PP, switching, and any
+move outside the subset. :func:`validate_against_core` checks outcome
+distributions against BattleCore-driven battles.
+
+Requires NumPy (``pip install platinum-text[sim]``).
+"""
+from __future__ import annotations
+import math
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from .core import Battler, Move, _TYPE_CHART, _CRIT_TABLE
+from .effects import MOVE_EFFECTS, RECHARGE_MOVES
+from .abilities import NO_ABILITY_HOOKS
+from .held_items import NO_ITEM_HOOKS
+
+_TYPES: Tuple[str, ...] = tuple(_TYPE_CHART.keys())
+_TYPE_INDEX = {t: i for i, t in enumerate(_TYPES)}
+_NO_TYPE = len(_TYPES)  # padding slot for mono-typed battlers
+
+# Status codes stored in the status array
+ST_NONE, ST_PSN, ST_BRN = 0, 1, 2
+_AILMENT_CODES = {None: ST_NONE, "none": ST_NONE, "poison": ST_PSN, "burn": ST_BRN}
+
+# Stage index layout of the stages array (matches Stages field order)
+S_ATK, S_DEF, S_SPA, S_SPD, S_SPE, S_ACC, S_EVA = range(7)
+
+MAX_MOVES = 4
+
+# Abilities the batch engine models: 1.5x Attack for one type at <= 1/3 HP
+_PINCH_ABILITIES = {"blaze": "fire", "overgrow": "grass", "torrent": "water", "swarm": "bug"}
+DRAW = -1
+
+# Slugs BattleCore special-cases (recharge, fixed damage, forced failure)
+_UNSUPPORTED_SLUGS = frozenset(MOVE_EFFECTS) | RECHARGE_MOVES
+
+def _type_matrix() -> np.ndarray:
+    m = np.ones((_NO_TYPE + 1, _NO_TYPE + 1), dtype=np.float64)
+    for atk, row in _TYPE_CHART.items():
+        for dfn, mult in row.items():
+            m[_TYPE_INDEX[atk], _TYPE_INDEX[dfn]] = mult
+    return m
+
+_TYPE_MATRIX = _type_matrix()
+# Index = stage + 6
+_STAT_MULT = np.array([2 / (2 - s) if s < 0 else (2 + s) / 2 for s in range(-6, 7)], dtype=np.float64)
+_ACC_MULT = np.array([3 / (3 - s) if s < 0 else (3 + s) / 3 for s in range(-6, 7)], dtype=np.float64)
+_CRIT_P = np.array([_CRIT_TABLE[i] for i in range(5)], dtype=np.float64)
+
+def supports_move(move: Move) -> bool:
+    """True if the batch engine resolves ``move`` exactly like BattleCore."""
+    flags = move.flags if isinstance(move.flags, dict) else {}
+    return (
+        move.category in ("physical", "special")
+        and (move.power or 0) > 0
+        and move.type in _TYPE_INDEX
+        and not move.hits and not move.drain_ratio and not move.recoil_ratio
+        and not move.flinch_chance and not move.multi_turn and not move.stat_changes
+        and not move.high_crit
+        and not any(flags.get(k) for k in ('charge', 'recharge', 'semi_invulnerable', 'contact'))
+        and move.ailment in _AILMENT_CODES
+        and move.slug not in _UNSUPPORTED_SLUGS
+    )
+
+@dataclass
+class BatchResult:
+    winner: np.ndarray  # (K,) 0 = player, 1 = enemy, DRAW = draw/stalemate
+    turns: np.ndarray   # (K,) turns played
+
+    @property
+    def battles(self) -> int:
+        return int(self.winner.shape[0])
+
+    @property
+    def win_rate(self) -> float:
+        return float(np.mean(self.winner == 0)) if self.battles else 0.0
+
+    @property
+    def turns_mean(self) -> float:
+        return float(np.mean(self.turns)) if self.battles else 0.0
+
+class BatchBattle:
+    """K lock-step 1v1 battles; side 0 is the player, side 1 the enemy."""
+
+    def __init__(self, pairs: Sequence[Tuple[Battler, Battler]], *, seed: int = 0,
+                 rng: Optional[np.random.Generator] = None):
+        k = len(pairs)
+        if k == 0:
+            raise ValueError("BatchBattle needs at least one battle")
+        self.k = k
+        self.rng = rng or np.random.default_rng(seed)
+        self.level = np.zeros((k, 2), dtype=np.float64)
+        self.max_hp = np.zeros((k, 2), dtype=np.int64)
+        self.hp = np.zeros((k, 2), dtype=np.int64)
+        # atk, def, sp_atk, sp_def, speed
+        self.stats = np.zeros((k, 2, 5), dtype=np.float64)
+        self.stages = np.zeros((k, 2, 7), dtype=np.int64)
+        self.status = np.zeros((k, 2), dtype=np.int8)
+        self.types = np.full((k, 2, 2), _NO_TYPE, dtype=np.int64)
+        self.pinch = np.full((k, 2), -1, dtype=np.int64)  # boosted type index, -1 for none
+        self.n_moves = np.zeros((k, 2), dtype=np.int64)
+        self.m_power = np.zeros((k, 2, MAX_MOVES), dtype=np.float64)
+        self.m_type = np.zeros((k, 2, MAX_MOVES), dtype=np.int64)
+        self.m_phys = np.zeros((k, 2, MAX_MOVES), dtype=bool)
+        self.m_acc = np.full((k, 2, MAX_MOVES), np.inf, dtype=np.float64)  # inf => never misses
+        self.m_prio = np.zeros((k, 2, MAX_MOVES), dtype=np.int64)
+        self.m_crit = np.zeros((k, 2, MAX_MOVES), dtype=np.int64)
+        self.m_ail = np.zeros((k, 2, MAX_MOVES), dtype=np.int8)
+        self.m_ail_chance = np.zeros((k, 2, MAX_MOVES), dtype=np.float64)
+        for i, pair in enumerate(pairs):
+            for s, b in enumerate(pair):
+                self._load(i, s, b)
+        self.turn = np.zeros(k, dtype=np.int64)
+        self.done = np.zeros(k, dtype=bool)
+        self.winner = np.full(k, DRAW, dtype=np.int64)
+
+    @classmethod
+    def replicate(cls, player: Battler, enemy: Battler, k: int, *, seed: int = 0) -> "BatchBattle":
+        """K copies of one matchup (loaded once, then tiled)."""
+        batch = cls([(player, enemy)], seed=seed)
+        for name, arr in vars(batch).items():
+            if isinstance(arr, np.ndarray):
+                setattr(batch, name, np.repeat(arr, k, axis=0))
+        batch.k = k
+        return batch
+
+    def _load(self, i: int, s: int, b: Battler):
+        moves = [m for m in b.moves if m.max_pp == 0 or m.pp > 0]
+        bad = [m.name for m in moves if not supports_move(m)]
+        if bad or not moves:
+            raise ValueError(f"{b.name}: moves outside the batch subset: {bad or 'no usable moves'}")
+        hooks = b.ability_hooks
+        if hooks is not NO_ABILITY_HOOKS and hooks.name not in _PINCH_ABILITIES:
+            raise ValueError(f"{b.name}: ability {hooks.name!r} is not modelled by the batch engine")
+        if b.item_hooks is not NO_ITEM_HOOKS:
+            raise ValueError(f"{b.name}: held item {b.item!r} is not modelled by the batch engine")
+        if hooks.name in _PINCH_ABILITIES:
+            self.pinch[i, s] = _TYPE_INDEX[_PINCH_ABILITIES[hooks.name]]
+        self.level[i, s] = b.level
+        self.max_hp[i, s] = b.stats["hp"]
+        self.hp[i, s] = b.current_hp if b.current_hp is not None else b.stats["hp"]
+        self.stats[i, s] = (b.stats["atk"], b.stats["def"], b.stats["sp_atk"], b.stats["sp_def"], b.stats["speed"])
+        st = b.stages
+        self.stages[i, s] = (st.attack, st.defense, st.sp_atk, st.sp_def, st.speed, st.accuracy, st.evasion)
+        self.status[i, s] = {"psn": ST_PSN, "brn": ST_BRN}.get(b.status, ST_NONE)
+        for j, t in enumerate(b.types[:2]):
+            self.types[i, s, j] = _TYPE_INDEX.get(t.lower(), _NO_TYPE)
+        self.n_moves[i, s] = len(moves[:MAX_MOVES])
+        for j, m in enumerate(moves[:MAX_MOVES]):
+            self.m_power[i, s, j] = m.power
+            self.m_type[i, s, j] = _TYPE_INDEX[m.type]
+            self.m_phys[i, s, j] = m.category == "physical"
+            if m.accuracy is not None:
+                self.m_acc[i, s, j] = m.accuracy
+            self.m_prio[i, s, j] = m.priority
+            self.m_crit[i, s, j] = m.crit_rate_stage
+            self.m_ail[i, s, j] = _AILMENT_CODES[m.ailment]
+            self.m_ail_chance[i, s, j] = m.ailment_chance or 0
+
+    # ------------------------------------------------------------------
+    # Turn resolution
+    # ------------------------------------------------------------------
+    def _act(self, idx: np.ndarray, a: np.ndarray, choice: np.ndarray):
+        """Resolve the move of side ``a`` (per battle) against side ``1 - a``."""
+        rng = self.rng
+        n = idx.shape[0]
+        d = 1 - a
+        mv = choice[np.arange(n), a]
+        hp = self.hp
+        can = (hp[idx, a] > 0) & (hp[idx, d] > 0)
+        # Accuracy
+        acc = self.m_acc[idx, a, mv] * (_ACC_MULT[self.stages[idx, a, S_ACC] + 6] / _ACC_MULT[self.stages[idx, d, S_EVA] + 6])
+        hit = can & (rng.random(n) * 100 < acc)
+        # Crit
+        crit = rng.random(n) < _CRIT_P[np.clip(self.m_crit[idx, a, mv], 0, 4)]
+        phys = self.m_phys[idx, a, mv]
+        atk_raw = np.where(phys, self.stats[idx, a, 0], self.stats[idx, a, 2])
+        def_raw = np.where(phys, self.stats[idx, d, 1], self.stats[idx, d, 3])
+        atk_stage = np.where(phys, self.stages[idx, a, S_ATK], self.stages[idx, a, S_SPA])
+        def_stage = np.where(phys, self.stages[idx, d, S_DEF], self.stages[idx, d, S_SPD])
+        atk_stage = np.where(crit, np.maximum(0, atk_stage), atk_stage)
+        def_stage = np.where(crit, np.minimum(0, def_stage), def_stage)
+        atk_val = atk_raw * _STAT_MULT[atk_stage + 6]
+        def_val = def_raw * _STAT_MULT[def_stage + 6]
+        # BattleCore halves burned physical attackers on non-crit hits only
+        atk_val = np.where(phys & ~crit & (self.status[idx, a] == ST_BRN), atk_val * 0.5, atk_val)
+        mtype = self.m_type[idx, a, mv]
+        pinch = (self.pinch[idx, a] == mtype) & (hp[idx, a] * 3 <= self.max_hp[idx, a])
+        atk_val = np.where(pinch, atk_val * 1.5, atk_val)
+        power = self.m_power[idx, a, mv]
+        base = (((2 * self.level[idx, a] / 5) + 2) * power * atk_val / np.maximum(1, def_val)) / 50 + 2
+        base = np.where(crit, base * 2, base)
+        base *= rng.uniform(0.85, 1.0, n)
+        stab = (self.types[idx, a, 0] == mtype) | (self.types[idx, a, 1] == mtype)
+        base = np.where(stab, base * 1.5, base)
+        eff = _TYPE_MATRIX[mtype, self.types[idx, d, 0]] * _TYPE_MATRIX[mtype, self.types[idx, d, 1]]
+        base *= eff
+        dmg = np.where(hit & (eff > 0), np.maximum(1, base).astype(np.int64), 0)
+        hp[idx, d] = np.maximum(0, hp[idx, d] - dmg)
+        # Secondary burn/poison
+        ail = self.m_ail[idx, a, mv]
+        dt0, dt1 = self.types[idx, d, 0], self.types[idx, d, 1]
+        immune = np.where(ail == ST_BRN, (dt0 == _TYPE_INDEX["fire"]) | (dt1 == _TYPE_INDEX["fire"]),
+                          np.isin(dt0, (_TYPE_INDEX["poison"], _TYPE_INDEX["steel"]))
+                          | np.isin(dt1, (_TYPE_INDEX["poison"], _TYPE_INDEX["steel"])))
+        lands = (dmg > 0) & (ail != ST_NONE) & (self.status[idx, d] == ST_NONE) & ~immune
+        lands &= rng.random(n) * 100 < self.m_ail_chance[idx, a, mv]
+        self.status[idx, d] = np.where(lands, ail, self.status[idx, d])
+
+    def step(self) -> int:
+        """Advance every live battle one turn; returns the number still live."""
+        idx = np.flatnonzero(~self.done)
+        n = idx.shape[0]
+        if n == 0:
+            return 0
+        rng = self.rng
+        choice = (rng.random((n, 2)) * self.n_moves[idx]).astype(np.int64)
+        prio = self.m_prio[idx[:, None], np.arange(2)[None, :], choice]
+        speed = self.stats[idx, :, 4] * _STAT_MULT[self.stages[idx, :, S_SPE] + 6]
+        coin = rng.random(n) < 0.5
+        first = np.where(prio[:, 0] != prio[:, 1], np.where(prio[:, 0] > prio[:, 1], 0, 1),
+                         np.where(speed[:, 0] != speed[:, 1], np.where(speed[:, 0] > speed[:, 1], 0, 1),
+                                  np.where(coin, 0, 1)))
+        self._act(idx, first, choice)
+        self._act(idx, 1 - first, choice)
+        # End of turn residual damage (1/8 max HP for poison and burn)
+        residual = np.maximum(1, self.max_hp[idx] // 8)
+        hurt = self.status[idx] != ST_NONE
+        self.hp[idx] = np.where(hurt, np.maximum(0, self.hp[idx] - residual), self.hp[idx])
+        self.turn[idx] += 1
+        alive = self.hp[idx] > 0
+        ended = ~(alive[:, 0] & alive[:, 1])
+        self.winner[idx] = np.where(alive[:, 0] & ~alive[:, 1], 0, np.where(alive[:, 1] & ~alive[:, 0], 1, DRAW))
+        self.done[idx[ended]] = True
+        return int(n - ended.sum())
+
+    def run(self, max_turns: int = 200) -> BatchResult:
+        """Step until every battle ends or hits ``max_turns`` (stalemate => DRAW)."""
+        # Live battles advance together, so every live battle is at the same turn
+        while int(self.turn[~self.done].max(initial=0)) < max_turns and self.step():
+            pass
+        winner = np.where(self.done, self.winner, DRAW)
+        return BatchResult(winner=winner, turns=self.turn.copy())
+
+# ---------------------------------------------------------------------------
+# Statistical validation against BattleCore
+# ---------------------------------------------------------------------------
+@dataclass
+class ValidationReport:
+    core_battles: int
+    batch_battles: int
+    core_win_rate: float
+    batch_win_rate: float
+    win_rate_z: float
+    core_turns_mean: float
+    batch_turns_mean: float
+    turns_ks: float
+    turns_ks_critical: float
+    z_critical: float
+
+    @property
+    def passed(self) -> bool:
+        return abs(self.win_rate_z) < self.z_critical and self.turns_ks < self.turns_ks_critical
+
+def _ks_statistic(a: np.ndarray, b: np.ndarray) -> float:
+    grid = np.union1d(a, b)
+    cdf_a = np.searchsorted(np.sort(a), grid, side="right") / a.shape[0]
+    cdf_b = np.searchsorted(np.sort(b), grid, side="right") / b.shape[0]
+    return float(np.max(np.abs(cdf_a - cdf_b)))
+
+def validate_against_core(player, enemy, *, core_battles: int = 400, batch_battles: int = 20000, seed: int = 0,
+                          max_turns: int = 200, z_critical: float = 3.29, ks_c: float = 1.95) -> ValidationReport:
+    """Compare win-rate and turn-count distributions with BattleCore battles.
+
+    ``player``/``enemy`` are single :class:`platinum.battle.sim.MemberSpec`
+    whose moves must lie in the batch subset. Uses a two-proportion z-test on
+    win rate and a two-sample KS test on turns; defaults are alpha ~= 0.001.
+    """
+    from .sim import play_battle
+    core_records = [play_battle((player,), (enemy,), seed, i, max_turns) for i in range(core_battles)]
+    core_wins = np.array([r.outcome == "PLAYER_WIN" for r in core_records], dtype=np.float64)
+    core_turns = np.array([r.turns for r in core_records], dtype=np.float64)
+    result = BatchBattle.replicate(player.build(), enemy.build(), batch_battles, seed=seed).run(max_turns)
+    p1, p2 = float(core_wins.mean()), result.win_rate
+    pooled = (core_wins.sum() + (result.winner == 0).sum()) / (core_battles + batch_battles)
+    se = math.sqrt(max(pooled * (1 - pooled), 1e-12) * (1 / core_battles + 1 / batch_battles))
+    n, m = core_battles, batch_battles
+    return ValidationReport(
+        core_battles=n, batch_battles=m,
+        core_win_rate=p1, batch_win_rate=p2, win_rate_z=(p1 - p2) / se,
+        core_turns_mean=float(core_turns.mean()), batch_turns_mean=result.turns_mean,
+        turns_ks=_ks_statistic(core_turns, result.turns.astype(np.float64)),
+        turns_ks_critical=ks_c * math.sqrt((n + m) / (n * m)), z_critical=z_critical,
+    )
+
+__all__ = ["BatchBattle", "BatchResult", "ValidationReport", "supports_move", "validate_against_core", "DRAW"]
@@ -3,10 +3,19 @@
 See patch description in previous attempt; this is the standalone creation.
 """
 from __future__ import annotations
-from dataclasses import dataclass, field
-from typing import Optional, Tuple, Dict, Any, Callable, List
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
+from typing import Optional, Tuple, Dict, Any, Callable, List, Iterator, Mapping, Sequence
 import random
 from .obedience import level_cap_for_badges, disobedience_chance
+from .effects import compile_move
+from .abilities import AbilityHooks, NO_ABILITY_HOOKS, ability_hooks
+from .held_items import ItemHooks, NO_ITEM_HOOKS, item_hooks
+from .timers import clear as clear_timers, expire as expire_timers, rebuild_heap, remaining
+from .memo import DamageMemo
+from .events import (
+    ActionStart, EndOfTurn, EventSink, TextSink, Message, Damage, Heal, Faint, StatusApplied, StatusCured,
+)
 
 _TYPE_CHART: Dict[str, Dict[str, float]] = {
     # Gen IV accurate (no Fairy type)
@@ -36,6 +45,13 @@ _DEF_WEATHER_IMMUNITY = {
 
 _CRIT_TABLE = {0: 1/16, 1: 1/8, 2: 1/4, 3: 1/3, 4: 1/2}
 
+_STAGE_NAME = {"atk": "attack", "def": "defense", "sp_atk": "sp_atk", "sp_def": "sp_def"}
+
+# Damage multiplier while a move hits more than one target (Gen IV doubles)
+SPREAD_MODIFIER = 0.75
+# Move.target values that hit every live foe / every other live battler
+_SPREAD_TARGETS = frozenset({"all-opponents", "all-other-pokemon"})
+
 # ---------------------------------------------------------------------------
 # Stage helpers
 # ---------------------------------------------------------------------------
@@ -53,7 +69,81 @@ def stage_multiplier_acc_eva(stage: int) -> float:
 # ---------------------------------------------------------------------------
 # Data classes
 # ---------------------------------------------------------------------------
-@dataclass
+_STAT_KEYS: Tuple[str, ...] = ("hp", "atk", "def", "sp_atk", "sp_def", "speed")
+# ``def`` is a keyword, so that key is stored in the ``def_`` slot
+_STAT_ATTRS: Dict[str, str] = {k: ("def_" if k == "def" else k) for k in _STAT_KEYS}
+
+class Stats:
+    """Fixed-layout battle stats.
+
+    Keeps the mapping-style access (``stats["hp"]``, ``stats.get("speed")``) the
+    rest of the tree uses while storing values in slots instead of a dict.
+    """
+    __slots__ = ("hp", "atk", "def_", "sp_atk", "sp_def", "speed")
+
+    def __init__(self, hp: int = 1, atk: int = 0, def_: int = 0, sp_atk: int = 0, sp_def: int = 0, speed: int = 0):
+        self.hp = hp
+        self.atk = atk
+        self.def_ = def_
+        self.sp_atk = sp_atk
+        self.sp_def = sp_def
+        self.speed = speed
+
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, int]) -> "Stats":
+        return cls(
+            hp=int(data.get("hp", 1)), atk=int(data.get("atk", 0)), def_=int(data.get("def", 0)),
+            sp_atk=int(data.get("sp_atk", 0)), sp_def=int(data.get("sp_def", 0)), speed=int(data.get("speed", 0)),
+        )
+
+    def __getitem__(self, key: str) -> int:
+        try:
+            return getattr(self, _STAT_ATTRS[key])
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: int):
+        try:
+            setattr(self, _STAT_ATTRS[key], value)
+        except KeyError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        attr = _STAT_ATTRS.get(key)
+        return getattr(self, attr) if attr is not None else default
+
+    def __contains__(self, key: object) -> bool:
+        return key in _STAT_ATTRS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_STAT_KEYS)
+
+    def __len__(self) -> int:
+        return len(_STAT_KEYS)
+
+    def keys(self) -> Tuple[str, ...]:
+        return _STAT_KEYS
+
+    def values(self) -> List[int]:
+        return [getattr(self, _STAT_ATTRS[k]) for k in _STAT_KEYS]
+
+    def items(self) -> List[Tuple[str, int]]:
+        return [(k, getattr(self, _STAT_ATTRS[k])) for k in _STAT_KEYS]
+
+    def to_dict(self) -> Dict[str, int]:
+        return dict(self.items())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Stats):
+            return self.values() == other.values()
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Stats({', '.join(f'{k}={v}' for k, v in self.items())})"
+
+@dataclass(slots=True)
 class Stages:
     attack: int = 0
     defense: int = 0
@@ -63,7 +153,7 @@ class Stages:
     accuracy: int = 0
     evasion: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class Move:
     name: str
     type: str
@@ -86,14 +176,32 @@ class Move:
     multi_turn: Optional[Tuple[int,int]] = None  # charge turns (min,max) if any
     max_pp: int = 0
     pp: int = 0  # current PP; 0 => cannot select (Struggle not yet implemented fully)
+    # Normalized slug and compiled effect handler (see platinum.battle.effects), set on construction
+    slug: str = field(default="", init=False, repr=False, compare=False)
+    effect: Optional[Callable[..., Any]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        compile_move(self)
 
-@dataclass
+    def copy(self) -> "Move":
+        """Copy with its own PP and power; move data and the compiled effect are shared."""
+        c = object.__new__(Move)
+        (c.name, c.type, c.category, c.power, c.accuracy, c.priority, c.crit_rate_stage, c.hits, c.drain_ratio,
+         c.recoil_ratio, c.high_crit, c.flinch_chance, c.ailment, c.ailment_chance, c.stat_changes, c.target,
+         c.flags, c.multi_turn, c.max_pp, c.pp, c.slug, c.effect) = _move_fields(self)
+        return c
+
+# Every Move slot, in __slots__ order (see Move.copy)
+_move_fields = attrgetter(*Move.__slots__)
+
+@dataclass(slots=True)
 class Battler:
     species_id: int
     name: str
     level: int
     types: Tuple[str, ...]
-    stats: Dict[str, int]
+    # Accepts a plain dict for convenience; normalized to Stats in __post_init__
+    stats: Stats
     moves: List[Move] = field(default_factory=list)
     stages: Stages = field(default_factory=Stages)
     status: str = "none"
@@ -114,49 +222,164 @@ class Battler:
     aqua_ring: bool = False
     # If True, the battler's ability is suppressed (e.g., by Gastro Acid)
     ability_suppressed: bool = False
+    # Doubled speed while the Tailwind timer runs
+    tailwind: bool = False
+    # Trick Room is up (set and cleared by its timer, synced on switch-in); inverts turn order
+    trick_room_active: bool = False
+    # Trainer badge count for obedience checks (None => no cap, e.g. wild/trainer-owned)
+    badge_count: Optional[int] = None
+    # Move a Choice item locked the battler into (cleared on switch-in)
+    choice_lock: Optional[Move] = None
+    # Volatile timed effects (see platinum.battle.timers): name -> turn it ends on; cleared on switch-in
+    timers: Dict[str, int] = field(default_factory=dict)
+    timer_heap: list = field(default_factory=list, init=False, repr=False, compare=False)
+    # Compiled ability / held-item hooks (see platinum.battle.abilities, .held_items); refreshed by attach_hooks()
+    ability_hooks: AbilityHooks = field(default=NO_ABILITY_HOOKS, init=False, repr=False, compare=False)
+    item_hooks: ItemHooks = field(default=NO_ITEM_HOOKS, init=False, repr=False, compare=False)
+    # (speed stage, status, item hooks, tailwind, effective speed) behind effective_speed()
+    _speed_cache: tuple = field(default=(None, None, None, False, 0.0), init=False, repr=False, compare=False)
 
     def __post_init__(self):
+        if not isinstance(self.stats, Stats):
+            self.stats = Stats.from_mapping(self.stats)
         # Always normalize current_hp to an int to simplify downstream logic
-        max_hp = int(self.stats.get("hp", 1))
+        max_hp = int(self.stats.hp)
         if self.current_hp is None or self.current_hp <= 0 or self.current_hp > max_hp:
             self.current_hp = max_hp
         # Trim move list to at most 4 like canonical games
         if len(self.moves) > 4:
             self.moves = self.moves[-4:]
-
-@dataclass
+        self.attach_hooks()
+
+    def attach_hooks(self) -> None:
+        """Resolve battle hooks from the current ability (none while it is suppressed) and held item."""
+        self.ability_hooks = NO_ABILITY_HOOKS if self.ability_suppressed else ability_hooks(self.ability)
+        self.item_hooks = item_hooks(self.item)
+
+    def effective_speed(self) -> float:
+        """Speed after stages, held item, Tailwind and paralysis.
+
+        Cached; recomputed only when the speed stage, status, held item or Tailwind changes.
+        """
+        stage, status, hooks, tailwind, value = self._speed_cache
+        if (stage != self.stages.speed or status != self.status or hooks is not self.item_hooks
+                or tailwind != self.tailwind):
+            stage, status, hooks, tailwind = self.stages.speed, self.status, self.item_hooks, self.tailwind
+            value = self.stats.speed * stage_multiplier_stat(stage) * hooks.speed
+            if tailwind:
+                value *= 2
+            if status == "par":
+                value *= 0.25
+            self._speed_cache = (stage, status, hooks, tailwind, value)
+        return value
+
+    def snapshot(self) -> tuple:
+        """Flat tuple of everything a battle can change: scalar state, timers, stages, then move PP.
+
+        Species data, stats and the Move objects themselves are shared, not copied.
+        """
+        st = self.stages
+        return (*_battler_state(self), tuple(self.timers.items()), st.attack, st.defense, st.sp_atk, st.sp_def,
+                st.speed, st.accuracy, st.evasion, *[m.pp for m in self.moves])
+
+    def restore(self, snap: tuple) -> None:
+        for name, value in zip(_BATTLER_STATE, snap):
+            setattr(self, name, value)
+        n = len(_BATTLER_STATE)
+        if snap[n] or self.timers:
+            self.timers = dict(snap[n])
+            rebuild_heap(self)
+        st = self.stages
+        (st.attack, st.defense, st.sp_atk, st.sp_def, st.speed, st.accuracy, st.evasion) = snap[n + 1:n + 8]
+        for m, pp in zip(self.moves, snap[n + 8:]):
+            m.pp = pp
+        self.attach_hooks()
+
+# Mutable per-battle Battler fields captured by Battler.snapshot(), in order
+_BATTLER_STATE: Tuple[str, ...] = (
+    "current_hp", "status", "ability", "item", "sleep_turns", "toxic_stage", "confusion_turns", "flinched",
+    "charging_move", "charging_turns_left", "semi_invulnerable", "must_recharge", "aqua_ring",
+    "ability_suppressed", "tailwind", "trick_room_active", "choice_lock",
+)
+_battler_state = attrgetter(*_BATTLER_STATE)
+# Snapshot slots holding a (shared) Move reference
+MOVE_SLOTS = (_BATTLER_STATE.index("charging_move"), _BATTLER_STATE.index("choice_lock"))
+
+@dataclass(slots=True)
 class FieldState:
     weather: Optional[str] = None
     reflect: bool = False
     light_screen: bool = False
+    # End-of-turn ticks so far; the clock for every timed effect
     turn: int = 0
-    # Durations (in turns) for field effects
-    weather_turns: int = 0
-    reflect_turns: int = 0
-    light_screen_turns: int = 0
-    # Additional field effects
-    trick_room_turns: int = 0
-    mist_turns: int = 0
     stealth_rock: bool = False
+    # Timed field effects (see platinum.battle.timers): name -> turn it ends on.
+    # Weather without a "weather" timer lasts until replaced.
+    timers: Dict[str, int] = field(default_factory=dict)
+    timer_heap: list = field(default_factory=list, init=False, repr=False, compare=False)
 
-class BattleCore:
-    def __init__(self, rng: Optional[random.Random] = None, message_cb: Optional[Callable[[str], None]] = None):
-        self.rng = rng or random.Random()
-        self.message_cb = message_cb
-        # Optional callback for UI to observe HP changes
-        self.hp_change_cb: Optional[Callable[[Battler, int, int, dict], None]] = None
+    def __post_init__(self):
+        if self.timers:
+            rebuild_heap(self)
 
-    def _msg(self, text: str):
-        if self.message_cb: self.message_cb(text)
-        else: print(text)
+    def snapshot(self) -> tuple:
+        return (*_field_state(self), tuple(self.timers.items()))
 
-    def _notify_hp_change(self, target: 'Battler', old_hp: int, new_hp: int, meta: dict):
-        cb = getattr(self, 'hp_change_cb', None)
-        if cb:
-            try:
-                cb(target, int(old_hp), int(new_hp), dict(meta))
-            except Exception:
-                pass
+    def restore(self, snap: tuple) -> None:
+        for name, value in zip(_FIELD_STATE, snap):
+            setattr(self, name, value)
+        if snap[-1] or self.timers:
+            self.timers = dict(snap[-1])
+            rebuild_heap(self)
+
+    def remaining(self, name: str) -> int:
+        """End-of-turn ticks left on timed field effect ``name`` (0 if it has no timer)."""
+        return remaining(self, name, self)
+
+_FIELD_STATE: Tuple[str, ...] = tuple(f.name for f in fields(FieldState) if f.name not in ("timers", "timer_heap"))
+_field_state = attrgetter(*_FIELD_STATE)
+
+class BattleCore:
+    def __init__(self, rng: Optional[random.Random] = None, message_cb: Optional[Callable[[str], None]] = None,
+                 sink: Optional[EventSink] = None):
+        self.rng = rng or random.Random()
+        # Damage multiplier for the action being executed (SPREAD_MODIFIER while it has several targets)
+        self.spread = 1.0
+        # Optional DamageMemo (platinum.battle.memo) for hit_base; search engines turn it on
+        self.damage_memo: Optional[DamageMemo] = None
+        # Event consumer; None drops events without constructing them
+        self.sink: Optional[EventSink] = None
+        self._message_cb: Optional[Callable[[str], None]] = None
+        if sink is not None:
+            self.sink = sink
+        else:
+            self.message_cb = message_cb
+
+    @property
+    def message_cb(self) -> Optional[Callable[[str], None]]:
+        return self._message_cb
+
+    @message_cb.setter
+    def message_cb(self, cb: Optional[Callable[[str], None]]):
+        """Plain-text consumer (legacy API); installs a TextSink, printing when None."""
+        self._message_cb = cb
+        self.sink = TextSink(cb if cb is not None else print)
+
+    @property
+    def caller_sink(self) -> Optional[EventSink]:
+        """``sink`` unless it is the default print-everything TextSink."""
+        sink = self.sink
+        return None if isinstance(sink, TextSink) and sink.cb is print else sink
+
+    def _emit(self, kind, *args):
+        sink = self.sink
+        if sink is not None:
+            sink(kind(*args))
+
+    def _msg(self, text: str, key: Optional[str] = None):
+        sink = self.sink
+        if sink is not None:
+            sink(Message(text, key))
 
     # ------------------------------------------------------------------
     # Mechanics
@@ -186,64 +409,82 @@ class BattleCore:
         chance = move.accuracy * (acc_mod / eva_mod)
         return self.rng.random() * 100 < chance
 
+    def crit_chance(self, move: Move) -> float:
+        crit_stage = move.crit_rate_stage + (1 if move.high_crit else 0)
+        return _CRIT_TABLE.get(max(0, min(int(crit_stage), 4)), 1/16)
+
+    def hit_base(self, user: Battler, target: Battler, move: Move, field: FieldState, crit: bool) -> float:
+        """Deterministic pre-roll damage of one hit (stages, burn, weather, crit, screens)."""
+        atk_stat = "atk" if move.category == "physical" else "sp_atk"
+        def_stat = "def" if move.category == "physical" else "sp_def"
+        atk_stage_val = getattr(user.stages, _STAGE_NAME[atk_stat])
+        def_stage_val = getattr(target.stages, _STAGE_NAME[def_stat])
+        hooks = user.ability_hooks
+        if crit:
+            # Crits ignore the attacker's drops, the defender's boosts, burn and screens
+            atk_val = user.stats[atk_stat] * stage_multiplier_stat(max(0, atk_stage_val))
+            def_val = target.stats[def_stat] * stage_multiplier_stat(min(0, def_stage_val))
+        else:
+            atk_val = user.stats[atk_stat] * stage_multiplier_stat(atk_stage_val)
+            def_val = target.stats[def_stat] * stage_multiplier_stat(def_stage_val)
+            if move.category == "physical" and user.status == "brn" and not hooks.ignore_burn_cut:
+                atk_val *= 0.5
+        for hook in hooks.attack:
+            atk_val *= hook(user, target, move, field, crit)
+        for hook in user.item_hooks.attack:
+            atk_val *= hook(user, target, move, field, crit)
+
+        base = (((2 * user.level / 5) + 2) * move.power * atk_val / max(1, def_val)) / 50 + 2
+
+        if field.weather == "sun":
+            if move.type == "fire": base *= 1.5
+            elif move.type == "water": base *= 0.5
+        elif field.weather == "rain":
+            if move.type == "water": base *= 1.5
+            elif move.type == "fire": base *= 0.5
+
+        if crit:
+            base *= 2
+        elif move.category == "physical" and field.reflect:
+            base *= 0.5
+        elif move.category == "special" and field.light_screen:
+            base *= 0.5
+        if self.spread != 1.0:
+            base *= self.spread
+        for hook in target.ability_hooks.defense:
+            base *= hook(user, target, move, field)
+        for hook in user.item_hooks.damage:
+            base *= hook(user, target, move, field)
+        return base
+
+    def stab(self, user: Battler, move: Move) -> float:
+        return user.ability_hooks.stab if move.type in user.types else 1.0
+
     def calc_damage(self, user: Battler, target: Battler, move: Move, field: FieldState) -> Dict[str, Any]:
         if move.category == "status" or move.power <= 0:
             return {"hits": [], "total": 0, "crit_any": False, "effectiveness": 1.0}
-        atk_stat = "atk" if move.category == "physical" else "sp_atk"
-        def_stat = "def" if move.category == "physical" else "sp_def"
-        stage_name_map = {"atk": "attack", "def": "defense", "sp_atk": "sp_atk", "sp_def": "sp_def"}
 
         hit_count = 1
         if move.hits:
             lo, hi = move.hits
             hit_count = self.rng.randint(lo, hi)
 
+        memo = self.damage_memo
         hit_results: list[dict[str, Any]] = []
         effectiveness: Optional[float] = None
         crit_any = False
 
         for _ in range(hit_count):
-            atk_stage_val = getattr(user.stages, stage_name_map[atk_stat])
-            def_stage_val = getattr(target.stages, stage_name_map[def_stat])
-            atk_mod = stage_multiplier_stat(atk_stage_val)
-            def_mod = stage_multiplier_stat(def_stage_val)
-
-            atk_val = user.stats[atk_stat] * atk_mod
-            def_val = target.stats[def_stat] * def_mod
-
-            if move.category == "physical" and user.status == "brn" and (user.ability or "").lower() != "guts":
-                atk_val *= 0.5
-
-            base = (((2 * user.level / 5) + 2) * move.power * atk_val / max(1, def_val)) / 50 + 2
-
-            if field.weather == "sun":
-                if move.type == "fire": base *= 1.5
-                elif move.type == "water": base *= 0.5
-            elif field.weather == "rain":
-                if move.type == "water": base *= 1.5
-                elif move.type == "fire": base *= 0.5
-
-            crit_stage = move.crit_rate_stage + (1 if move.high_crit else 0)
-            crit = self.roll_crit(crit_stage)
-            if crit:
-                crit_any = True
-                eff_atk_stage = max(0, atk_stage_val)
-                eff_def_stage = min(0, def_stage_val)
-                atk_val_c = user.stats[atk_stat] * stage_multiplier_stat(eff_atk_stage)
-                def_val_c = target.stats[def_stat] * stage_multiplier_stat(eff_def_stage)
-                base = (((2 * user.level / 5) + 2) * move.power * atk_val_c / max(1, def_val_c)) / 50 + 2
-                base *= 2
+            crit = self.rng.random() < self.crit_chance(move)
+            crit_any = crit_any or crit
+            if memo is not None:
+                base = memo.hit_base(self, user, target, move, field, crit)
             else:
-                if move.category == "physical" and field.reflect:
-                    base *= 0.5
-                elif move.category == "special" and field.light_screen:
-                    base *= 0.5
+                base = self.hit_base(user, target, move, field, crit)
 
             base *= self.rng.uniform(0.85, 1.0)
 
-            if move.type in user.types:
-                if (user.ability or "").lower() == "adaptability": base *= 2.0
-                else: base *= 1.5
+            base *= self.stab(user, move)
 
             eff = self.get_effectiveness(move.type, target.types)
             if effectiveness is None: effectiveness = eff
@@ -262,18 +503,23 @@ class BattleCore:
             target.current_hp = int(target.stats.get("hp", 1))
         old = int(target.current_hp)
         target.current_hp = max(0, old - int(amount))
-        self._notify_hp_change(target, old, target.current_hp, {"cause": cause, **(meta or {})})
-        if target.current_hp <= 0:
-            self._msg(f"{target.name} fainted!")
+        if self.sink is not None:
+            self.sink(Damage(target, old, target.current_hp, cause, meta or {}))
+            if target.current_hp <= 0:
+                self.sink(Faint(target))
+        if target.item_hooks.hp_drop and target.current_hp > 0:
+            for hook in target.item_hooks.hp_drop:
+                hook(self, target)
 
     def apply_heal(self, target: Battler, amount: int, *, cause: str = 'other', meta: Optional[dict] = None):
         if target.current_hp is None:
             target.current_hp = int(target.stats.get("hp", 1))
         old = int(target.current_hp)
         target.current_hp = min(int(target.stats.get("hp", 1)), old + int(amount))
-        self._notify_hp_change(target, old, target.current_hp, {"cause": cause, **(meta or {})})
+        self._emit(Heal, target, old, target.current_hp, cause, meta or {})
 
     def end_of_turn(self, battlers: List[Battler], field: FieldState):
+        self._emit(EndOfTurn)
         for b in battlers:
             if b.status == "psn":
                 dmg = max(1, b.stats["hp"] // 8)
@@ -300,532 +546,234 @@ class BattleCore:
                 self.apply_damage(b, dmg, cause='weather', meta={'weather': 'hail'})
                 self._msg(f"{b.name} is pelted by hail!")
 
-            if (b.current_hp is not None and b.current_hp > 0 and
-                (b.item or "").lower() == "leftovers" and b.current_hp < b.stats["hp"]):
-                heal = max(1, b.stats["hp"] // 16)
-                self.apply_heal(b, heal, cause='item', meta={'item': 'leftovers'})
-                self._msg(f"{b.name} restored a little HP with Leftovers.")
+            for hook in b.item_hooks.end_of_turn:
+                hook(self, b, field)
             # Aqua Ring passive heal (1/16 max HP)
             if (b.current_hp is not None and b.current_hp > 0 and b.aqua_ring and b.current_hp < b.stats["hp"]):
                 heal = max(1, b.stats["hp"] // 16)
                 self.apply_heal(b, heal, cause='field', meta={'effect': 'aqua-ring'})
                 self._msg(f"{b.name} restored HP with Aqua Ring!")
+            for hook in b.ability_hooks.end_of_turn:
+                hook(self, b, field)
 
-        # Decrement field effect durations and clear when over
-        if field.weather_turns > 0:
-            field.weather_turns -= 1
-            if field.weather_turns == 0 and field.weather is not None:
-                if field.weather == 'sun': self._msg("The sunlight faded.")
-                elif field.weather == 'rain': self._msg("The rain stopped.")
-                elif field.weather == 'sand': self._msg("The sandstorm subsided.")
-                elif field.weather == 'hail': self._msg("The hail stopped.")
-                field.weather = None
-        if field.reflect_turns > 0:
-            field.reflect_turns -= 1
-            if field.reflect_turns == 0 and field.reflect:
-                field.reflect = False
-                self._msg("Reflect wore off!")
-        if field.light_screen_turns > 0:
-            field.light_screen_turns -= 1
-            if field.light_screen_turns == 0 and field.light_screen:
-                field.light_screen = False
-                self._msg("Light Screen wore off!")
-        if field.trick_room_turns > 0:
-            field.trick_room_turns -= 1
-            # Mark battlers for next turn's turn order inversion
-            active = field.trick_room_turns > 0
-            for b in battlers:
-                setattr(b, '_trick_room_active', active)
-            if not active:
-                self._msg("The twisted dimensions returned to normal!")
-        if field.mist_turns > 0:
-            field.mist_turns -= 1
-            if field.mist_turns == 0:
-                self._msg("The mist faded!")
+        # Advance the clock and end whatever timed effects are due
+        field.turn += 1
+        if field.timer_heap:
+            expire_timers(self, field, field, battlers)
+        for b in battlers:
+            if b.timer_heap:
+                expire_timers(self, b, field, battlers)
+
+    def action_order(self, actions: Sequence[tuple]) -> List[tuple]:
+        """Sort any number of ``(battler, move, ...)`` actions into execution order.
+
+        Extra items (e.g. a chosen target) ride along. One key per actor: (priority, effective speed, tiebreak), descending.
+        Under Trick Room the speed term is negated. Actors whose priority and
+        speed both tie get their tiebreak from a random shuffle of the group;
+        a two-way tie costs a single coin flip.
+        """
+        trick = any(a[0].trick_room_active for a in actions)
+        keys = [(a[1].priority, -a[0].effective_speed() if trick else a[0].effective_speed()) for a in actions]
+        if len(set(keys)) < len(keys):
+            groups: Dict[tuple, List[int]] = {}
+            for i, k in enumerate(keys):
+                groups.setdefault(k, []).append(i)
+            tiebreak = [0] * len(keys)
+            for members in groups.values():
+                # Forward Fisher-Yates, one draw per slot
+                for pos in range(len(members) - 1):
+                    j = pos + int(self.rng.random() * (len(members) - pos))
+                    members[pos], members[j] = members[j], members[pos]
+                for rank, i in enumerate(members):
+                    tiebreak[i] = -rank
+            keys = [(p, s, t) for (p, s), t in zip(keys, tiebreak)]
+        order = sorted(range(len(actions)), key=keys.__getitem__, reverse=True)
+        return [actions[i] for i in order]
 
     def turn_order(self, a: Battler, b: Battler, move_a: Move, move_b: Move) -> List[tuple[Battler, Move]]:
-        if move_a.priority != move_b.priority:
-            return [(a, move_a), (b, move_b)] if move_a.priority > move_b.priority else [(b, move_b), (a, move_a)]
-        speed_a = a.stats["speed"] * stage_multiplier_stat(a.stages.speed)
-        speed_b = b.stats["speed"] * stage_multiplier_stat(b.stages.speed)
-        if a.status == "par": speed_a *= 0.25
-        if b.status == "par": speed_b *= 0.25
-        trick = bool(getattr(a, '_trick_room_active', False) or getattr(b, '_trick_room_active', False))
-        if speed_a != speed_b:
-            if (speed_a > speed_b) ^ trick:
-                return [(a, move_a), (b, move_b)]
-            else:
-                return [(b, move_b), (a, move_a)]
-        return [(a, move_a), (b, move_b)] if self.rng.random() < 0.5 else [(b, move_b), (a, move_a)]
+        return self.action_order(((a, move_a), (b, move_b)))
 
     def single_turn(self, user: Battler, user_move: Move, target: Battler, target_move: Optional[Move], field: FieldState):
         order = self.turn_order(user, target, user_move, target_move or user_move)
         for acting, mv in order:
-            opp = target if acting is user else user
-            if acting.current_hp is None:
-                acting.current_hp = int(acting.stats.get("hp", 1))
-            if acting.current_hp <= 0:
-                continue
-            try:
-                badge_count = int(getattr(acting, 'badge_count', 8))
-            except Exception:
-                badge_count = 8
-            cap = level_cap_for_badges(badge_count)
-            if acting.level > cap:
-                chance = disobedience_chance(acting.level, cap)
-                if self.rng.random() < chance:
-                    # Behavior variants
-                    roll = self.rng.randint(1, 100)
-                    if roll <= 40:
-                        self._msg(f"{acting.name} ignored orders!")
-                    elif roll <= 70 and acting.current_hp < acting.stats['hp']:
-                        # loaf (heal small amount)
-                        heal = max(1, acting.stats['hp']//20)
-                        acting.current_hp = min(acting.stats['hp'], acting.current_hp + heal)
-                        self._msg(f"{acting.name} loafed around and recovered a little HP!")
-                    elif roll <= 85:
-                        self._msg(f"{acting.name} is loafing around!")
-                    else:
-                        # hurt itself in confusion style (1/8 max HP)
-                        dmg = max(1, acting.stats['hp']//8)
-                        self.apply_damage(acting, dmg, cause='self', meta={'reason': 'disobedience'})
-                        self._msg(f"{acting.name} was hurt in its disobedience!")
-                    continue
-            # PP check
-            if mv.pp is not None and mv.max_pp > 0 and mv.pp <= 0:
-                # Skip move (could implement Struggle); for now treat as fail
-                self._msg(f"{acting.name} has no PP left for {mv.name}!")
-                continue
-            # Flinch check
-            if acting.flinched:
-                self._msg(f"{acting.name} flinched and couldn't move!")
-                acting.flinched = False
-                continue
-            # Recharge turn takes precedence over other action checks
-            if getattr(acting, 'must_recharge', False):
-                self._msg(f"{acting.name} must recharge!")
-                acting.must_recharge = False
-                continue
-            # Sleep handling
-            if acting.status == 'slp':
-                if acting.sleep_turns > 0:
-                    acting.sleep_turns -= 1
-                if acting.sleep_turns > 0:
-                    self._msg(f"{acting.name} is fast asleep.")
-                    continue
-                else:
-                    acting.status = 'none'
-                    self._msg(f"{acting.name} woke up!")
-            # Freeze handling (20% thaw each turn)
-            if acting.status == 'frz':
-                if self.rng.randint(1,100) <= 20:
-                    acting.status = 'none'
-                    self._msg(f"{acting.name} thawed out!")
-                else:
-                    self._msg(f"{acting.name} is frozen solid!")
-                    continue
-            # Paralysis action prevention (25%)
-            if acting.status == 'par':
-                if self.rng.randint(1,100) <= 25:
-                    self._msg(f"{acting.name} is fully paralyzed! It can't move!")
-                    continue
-            # Charging logic (two-turn moves with charge flag: Solar Beam, Sky Attack, etc.)
-            if acting.charging_move and acting.charging_move is mv and acting.charging_turns_left > 0:
-                acting.charging_turns_left -= 1
-                if acting.charging_turns_left > 0:
-                    self._msg(f"{acting.name} continues charging {mv.name}!")
-                    continue
-                else:
-                    self._msg(f"{acting.name} unleashes {mv.name}!")
-                    # Clear semi-invulnerable on the attack turn
-                    acting.semi_invulnerable = False
-            elif mv.flags.get('charge') and acting.charging_move is None:
-                # Begin charging: skip damage this turn
-                acting.charging_move = mv
-                acting.charging_turns_left = 1  # simple two-turn assumption
-                self._msg(f"{acting.name} began charging {mv.name}!")
-                # Some moves make the user semi-invulnerable on the charge turn (e.g., Fly/Dig/Bounce/Dive)
-                if bool(mv.flags.get('semi_invulnerable', False)):
-                    acting.semi_invulnerable = True
-                continue
-            if not self.accuracy_check(acting, opp, mv):
-                self._msg(f"{acting.name}'s {mv.name} missed!")
-                if mv.max_pp > 0 and mv.pp > 0:
-                    mv.pp -= 1
-                continue
-            # Special fixed-damage and percent-HP moves handled explicitly
-            try:
-                internal = (mv.flags or {}).get('internal') if isinstance(mv.flags, dict) else None
-                mv_slug = str(internal or mv.name).lower().replace(' ', '-').replace("'", "")
-            except Exception:
-                mv_slug = str(mv.name).lower()
-            special_damage: Optional[int] = None
-            if mv_slug == 'dragon-rage':
-                special_damage = 40
-            elif mv_slug == 'sonic-boom':
-                special_damage = 20
-            elif mv_slug in {'night-shade','seismic-toss'}:
-                special_damage = int(getattr(acting, 'level', 1) or 1)
-            elif mv_slug == 'super-fang':
-                cur = int(opp.current_hp or opp.stats.get('hp', 1))
-                special_damage = max(1, cur // 2)
-            elif mv_slug == 'endeavor':
-                cur_o = int(opp.current_hp or opp.stats.get('hp', 1))
-                cur_u = int(acting.current_hp or acting.stats.get('hp', 1))
-                if cur_o > cur_u:
-                    special_damage = cur_o - cur_u
-                else:
-                    special_damage = 0
-            elif mv_slug == 'psywave':
-                # Simplified fixed damage
-                special_damage = max(1, int((getattr(acting, 'level', 1) or 1) * 0.8))
-            elif mv_slug == 'present':
-                special_damage = 40
-            if special_damage is not None:
-                # Type immunity check still applies
-                try:
-                    eff_chk = self.get_effectiveness(mv.type, opp.types)
-                except Exception:
-                    eff_chk = 1.0
-                if eff_chk == 0.0 or special_damage <= 0:
-                    self._msg("It doesn't affect the target...")
-                else:
-                    self.apply_damage(opp, special_damage, cause='move', meta={'move': mv.name, 'fixed': True})
-                    self._msg(f"{acting.name} used {mv.name}!")
-                if mv.max_pp > 0 and mv.pp > 0:
-                    mv.pp -= 1
-                continue
-            # Reactive or item/team dependent moves that won't work in smoke context
-            if mv_slug in {'counter','mirror-coat','metal-burst','bide','spit-up','natural-gift','fling','beat-up'}:
-                self._msg("But it failed!")
-                if mv.max_pp > 0 and mv.pp > 0:
-                    mv.pp -= 1
-                continue
-            # Temporary fallback base power for complex formula moves when data power is 0/None
-            orig_power = mv.power
-            power_overridden = False
-            if (orig_power or 0) <= 0:
-                fallback_map = {
-                    'grass-knot': 60,
-                    'low-kick': 60,
-                    'gyro-ball': 60,
-                    'crush-grip': 60,
-                    'wring-out': 60,
-                    'punishment': 60,
-                    'magnitude': 70,
-                    'return': 70,
-                    'frustration': 70,
-                    'trump-card': 40,
-                    'flail': 20,
-                    'reversal': 20,
-                }
-                fb = fallback_map.get(mv_slug)
-                if fb is not None:
-                    mv.power = fb
-                    power_overridden = True
-            result = self.calc_damage(acting, opp, mv, field)
-            if mv.category == "status":
-                # Announce the move first (UI overlay will handle wipe + SFX)
-                self._msg(f"{acting.name} used {mv.name}!")
-                # If the move's type has no effect on the target (e.g., Electric vs Ground), it fails
-                try:
-                    eff_chk = self.get_effectiveness(mv.type, opp.types)
-                except Exception:
-                    eff_chk = 1.0
-                if eff_chk == 0.0:
-                    self._msg("It doesn't affect the target...")
-                    if mv.max_pp > 0 and mv.pp > 0:
-                        mv.pp -= 1
-                    continue
-                # Apply simple status/stat changes to opponent or user.
-                applied_any = False
-                # Fallbacks for common Gen IV status moves when stat_changes absent in data
-                fallback_changes: list[dict[str, int | str]] = []
-                try:
-                    internal = mv.flags.get('internal') if isinstance(mv.flags, dict) else None
-                    if isinstance(internal, str) and internal:
-                        base = internal
-                    else:
-                        base = mv.name
-                    mv_slug = str(base).lower().replace(' ', '-').replace("'", "")
-                except Exception:
-                    mv_slug = str(mv.name).lower()
-                if (not mv.stat_changes):
-                    # Simple debuffs
-                    if mv_slug in {'growl'}:
-                        fallback_changes = [{"stat": "attack", "change": -1, "chance": 100}]
-                    elif mv_slug in {'leer','tail-whip'}:
-                        fallback_changes = [{"stat": "defense", "change": -1, "chance": 100}]
-                    elif mv_slug in {'string-shot'}:
-                        fallback_changes = [{"stat": "speed", "change": -1, "chance": 100}]
-                    elif mv_slug in {'cotton-spore'}:
-                        fallback_changes = [{"stat": "speed", "change": -2, "chance": 100}]
-                    # Simple self-buffs
-                    elif mv_slug in {'acid-armor','iron-defense'}:
-                        fallback_changes = [{"stat": "defense", "change": +2, "chance": 100}]
-                    elif mv_slug in {'agility','rock-polish'}:
-                        fallback_changes = [{"stat": "speed", "change": +2, "chance": 100}]
-                    elif mv_slug in {'amnesia'}:
-                        fallback_changes = [{"stat": "sp-def", "change": +2, "chance": 100}]
-                    elif mv_slug in {'barrier','withdraw','harden'}:
-                        fallback_changes = [{"stat": "defense", "change": +1, "chance": 100}]
-                    elif mv_slug in {'howl','meditate','sharpen'}:
-                        fallback_changes = [{"stat": "attack", "change": +1, "chance": 100}]
-                    elif mv_slug in {'swords-dance'}:
-                        fallback_changes = [{"stat": "attack", "change": +2, "chance": 100}]
-                    elif mv_slug in {'nasty-plot'}:
-                        fallback_changes = [{"stat": "sp-atk", "change": +2, "chance": 100}]
-                    elif mv_slug in {'calm-mind'}:
-                        fallback_changes = [{"stat": "sp-atk", "change": +1, "chance": 100}, {"stat": "sp-def", "change": +1, "chance": 100}]
-                    elif mv_slug in {'bulk-up'}:
-                        fallback_changes = [{"stat": "attack", "change": +1, "chance": 100}, {"stat": "defense", "change": +1, "chance": 100}]
-                    elif mv_slug in {'cosmic-power'}:
-                        fallback_changes = [{"stat": "defense", "change": +1, "chance": 100}, {"stat": "sp-def", "change": +1, "chance": 100}]
-                    elif mv_slug in {'charge'}:
-                        fallback_changes = [{"stat": "sp-def", "change": +1, "chance": 100}]
-                changes = mv.stat_changes or fallback_changes
-                # Helper for stat normalization & nice message text
-                def _normalize_stat(s: str) -> str:
-                    s = s.replace("_","-").lower()
-                    if s in ("special-attack","sp-atk","spatk"): return "sp-atk"
-                    if s in ("special-defense","sp-def","spdef"): return "sp-def"
-                    return s
-                def _stat_label(s: str) -> str:
-                    m = {
-                        'attack': 'Attack', 'defense': 'Defense', 'sp-atk': 'Special Attack', 'sp-def': 'Special Defense', 'speed': 'Speed', 'accuracy': 'Accuracy', 'evasion': 'Evasion'
-                    }
-                    return m.get(s, s.title())
-                for sc in changes:
-                    try:
-                        chance = int(sc.get("chance", 100) or 100)  # type: ignore[arg-type]
-                    except Exception:
-                        chance = 100
-                    if self.rng.randint(1,100) <= chance:
-                        stat = _normalize_stat(str(sc.get("stat")))
-                        try:
-                            change_val = int(sc.get("change", 0) or 0)  # type: ignore[arg-type]
-                        except Exception:
-                            change_val = 0
-                        if stat in {"attack","defense","sp-atk","sp-def","speed","accuracy","evasion"} and change_val != 0:
-                            attr = stat.replace("-","_")
-                            target_entity = acting if change_val > 0 else opp
-                            cur = getattr(target_entity.stages, attr)
-                            setattr(target_entity.stages, attr, _clamp_stage(cur + change_val))
-                            # Message with adverbs for ±2/±3
-                            adverb = ""
-                            if abs(change_val) == 2:
-                                adverb = " sharply"
-                            elif abs(change_val) >= 3:
-                                adverb = " drastically"
-                            direction = " rose!" if change_val > 0 else " fell!"
-                            self._msg(f"{target_entity.name}'s {_stat_label(stat)}{adverb}{direction}")
-                            applied_any = True
-                if mv.ailment and mv.ailment not in {"none","unknown"} and opp.status == "none":
-                    if self.rng.randint(1,100) <= (mv.ailment_chance or 100):
-                        status_map = {
-                            'paralysis':'par','burn':'brn','poison':'psn','toxic':'tox','sleep':'slp','freeze':'frz'
-                        }
-                        code = status_map.get(mv.ailment, mv.ailment[:3])
-                        if self._apply_status(opp, code, move_type=mv.type):
-                            applied_any = True
-                # Healing / curing support moves
-                mv_name = mv_slug
-                if mv_name == 'rest':
-                    if acting.current_hp == acting.stats['hp'] and acting.status == 'none':
-                        self._msg(f"But it failed!")
-                    else:
-                        heal_amt = int(acting.stats['hp'] - (acting.current_hp or 0))
-                        if heal_amt > 0:
-                            self.apply_heal(acting, heal_amt, cause='move', meta={'move': 'Rest'})
-                        # Clear status then apply sleep (overwrite existing status even if none)
-                        self._cure_status(acting, announce=False)
-                        self._apply_status(acting, 'slp')
-                        self._msg(f"{acting.name} fell asleep and regained health!")
-                        applied_any = True
-                elif mv_name == 'refresh':
-                    if acting.status in {'brn','par','psn','tox'}:
-                        self._cure_status(acting)
-                        applied_any = True
-                elif mv_name in {'heal-bell','aromatherapy'}:
-                    # Simplified: heals only user in this 1v1 context
-                    if acting.status != 'none':
-                        self._cure_status(acting)
-                        applied_any = True
-                elif mv_name == 'aqua-ring':
-                    if not acting.aqua_ring:
-                        acting.aqua_ring = True
-                        self._msg(f"A veil of water surrounds {acting.name}!")
-                        applied_any = True
-                elif mv_name == 'magnet-rise':
-                    # Simplified: grant temporary levitation
-                    if not hasattr(acting, 'levitate_turns'):
-                        setattr(acting, 'levitate_turns', 0)
-                    if getattr(acting, 'levitate_turns', 0) <= 0:
-                        setattr(acting, 'levitate_turns', 5)
-                        self._msg(f"{acting.name} levitated with electromagnetism!")
-                        applied_any = True
-                elif mv_name == 'gastro-acid':
-                    # Simplified: suppress the target's ability (no duration handling; lasts while active)
-                    if getattr(opp, 'ability', None) and not getattr(opp, 'ability_suppressed', False):
-                        opp.ability_suppressed = True
-                        self._msg(f"{opp.name}'s Ability was suppressed!")
-                        applied_any = True
-                elif mv_name == 'mist':
-                    field.mist_turns = 5
-                    self._msg("A mist shrouded the field!")
-                    applied_any = True
-                elif mv_name == 'haze':
-                    # Reset all battlers' stat changes
-                    for b in (acting, opp):
-                        b.stages = Stages()
-                    self._msg("All stat changes were eliminated!")
-                    applied_any = True
-                elif mv_name == 'trick-room':
-                    field.trick_room_turns = 5
-                    self._msg("The dimensions were twisted!")
-                    applied_any = True
-                elif mv_name == 'stealth-rock':
-                    if not field.stealth_rock:
-                        field.stealth_rock = True
-                        self._msg("Pointed stones float in the air around the foe's team!")
-                        applied_any = True
-                elif mv_name in {'roar','whirlwind','teleport','destiny-bond','grudge'}:
-                    # Not fully simulated here; report a failure message to satisfy smoke
-                    self._msg("But it failed!")
-                elif mv_name == 'sunny-day':
-                    field.weather = 'sun'; field.weather_turns = 5
-                    self._msg("The sunlight turned harsh!")
-                    applied_any = True
-                elif mv_name == 'rain-dance':
-                    field.weather = 'rain'; field.weather_turns = 5
-                    self._msg("It started to rain!")
-                    applied_any = True
-                elif mv_name == 'sandstorm':
-                    field.weather = 'sand'; field.weather_turns = 5
-                    self._msg("A sandstorm kicked up!")
-                    applied_any = True
-                elif mv_name == 'hail':
-                    field.weather = 'hail'; field.weather_turns = 5
-                    self._msg("It started to hail!")
-                    applied_any = True
-                elif mv_name == 'reflect':
-                    field.reflect = True; field.reflect_turns = 5
-                    self._msg("Reflect raised your team's Defense!")
-                    applied_any = True
-                elif mv_name == 'light-screen':
-                    field.light_screen = True; field.light_screen_turns = 5
-                    self._msg("Light Screen raised your team's Sp. Def!")
-                    applied_any = True
-                if not applied_any:
-                    self._msg("But nothing happened.")
-                if mv.max_pp > 0 and mv.pp > 0:
-                    mv.pp -= 1
-                continue
-            if result["effectiveness"] == 0:
-                self._msg("It doesn't affect the target...")
-            total_damage = 0
-            for idx, h in enumerate(result["hits"], 1):
-                if h["damage"] <= 0: continue
-                eff_mult = result["effectiveness"]
-                self.apply_damage(opp, h["damage"], cause='move', meta={'effectiveness': eff_mult, 'move': mv.name, 'attacker': acting.name, 'hit_index': idx, 'multi_hits': len(result['hits'])})
-                total_damage += h["damage"]
-                multi_prefix = f" (hit {idx})" if len(result['hits']) > 1 else ""
-                crit_txt = " A critical hit!" if h["crit"] else ""
-                eff_txt = "" if eff_mult == 1 else (" It's super effective!" if eff_mult > 1 else " It's not very effective...")
-                self._msg(f"{acting.name} used {mv.name}!{multi_prefix}{crit_txt}{eff_txt}")
-                if opp.current_hp is not None and opp.current_hp <= 0:
-                    break
-            # Drain / recoil
-            if total_damage > 0 and mv.drain_ratio:
-                num, den = mv.drain_ratio
-                heal = max(1, (total_damage * num)//den)
-                if heal > 0:
-                    self.apply_heal(acting, heal, cause='drain', meta={'move': mv.name})
-                    # Use Platinum-accurate text for draining moves
-                    if mv.name.lower() in ['absorb', 'mega-drain', 'giga-drain']:
-                        self._msg(f"{acting.name} absorbed nutrients from {opp.name}!")
-                    elif mv.name.lower() == 'leech-life':
-                        self._msg(f"{acting.name} sucked life from {opp.name}!")
-                    elif mv.name.lower() == 'dream-eater':
-                        self._msg(f"{acting.name} ate {opp.name}'s dream!")
-                    elif mv.name.lower() == 'drain-punch':
-                        self._msg(f"{acting.name} drained power from {opp.name}!")
-                    else:
-                        self._msg(f"{acting.name} had its energy drained!")
-            if total_damage > 0 and mv.recoil_ratio:
-                rn, rd = mv.recoil_ratio
-                recoil = max(1, (total_damage * rn)//rd)
-                self.apply_damage(acting, recoil, cause='recoil', meta={'move': mv.name})
-                self._msg(f"{acting.name} is damaged by recoil!")
-            # Ailment chance for damaging moves
-            if total_damage > 0 and mv.ailment and mv.ailment not in {"none","unknown"} and opp.status == "none":
-                if self.rng.randint(1,100) <= (mv.ailment_chance or 0):
-                    status_map = {
-                        'paralysis':'par','burn':'brn','poison':'psn','toxic':'tox','sleep':'slp','freeze':'frz'
-                    }
-                    code = status_map.get(mv.ailment, mv.ailment[:3])
-                    if code not in {'slp','frz'} or opp.status == 'none':
-                        self._apply_status(opp, code, move_type=mv.type)
-            # Flinch chance
-            if total_damage > 0 and mv.flinch_chance and opp.current_hp and opp.current_hp > 0:
-                if self.rng.randint(1,100) <= mv.flinch_chance:
-                    opp.flinched = True
-            # Contact ability reactive effects
-            self._contact_reactive(acting, opp, mv, total_damage)
-            # Clear charging state after execution
-            if acting.charging_move is mv and acting.charging_turns_left == 0:
-                acting.charging_move = None
-            # Set recharge requirement for Hyper Beam-style moves (only after executing the move this turn)
-            try:
-                internal = (mv.flags or {}).get('internal') if isinstance(mv.flags, dict) else None
-                mv_slug = str(internal or mv.name).lower().replace(' ', '-').replace("'", "")
-            except Exception:
-                mv_slug = str(mv.name).lower()
-            if (((mv.flags.get('recharge') if isinstance(mv.flags, dict) else False) or mv_slug in {
-                'hyper-beam','giga-impact','roar-of-time','blast-burn','frenzy-plant','hydro-cannon','rock-wrecker'
-            }) and not acting.must_recharge):
-                acting.must_recharge = True
-            if mv.max_pp > 0 and mv.pp > 0:
-                mv.pp -= 1
-            if power_overridden:
-                mv.power = orig_power
+            self.run_action(acting, mv, (target if acting is user else user,), field)
         self.end_of_turn([user, target], field)
         # Reset flinch for next turn
         user.flinched = False if user.flinched else user.flinched
         target.flinched = False if target.flinched else target.flinched
 
+    def multi_turn(self, actions: Sequence[tuple[Battler, Move, Optional[int]]],
+                   sides: Tuple[Sequence[Battler], Sequence[Battler]], field: FieldState):
+        """One turn with any number of actors (doubles, tag battles).
+
+        ``actions`` are ``(battler, move, chosen)`` where ``chosen`` indexes
+        the foe side for single-target moves (None: first live foe);
+        ``sides`` are the two lists of active battlers. Actions run in
+        :meth:`action_order` and targets are resolved as each action starts.
+        """
+        for acting, mv, chosen in self.action_order(actions):
+            if (acting.current_hp or 0) <= 0:
+                continue
+            allies, foes = sides if any(b is acting for b in sides[0]) else (sides[1], sides[0])
+            self.run_action(acting, mv, self.select_targets(acting, mv, allies, foes, chosen), field)
+        active = [b for side in sides for b in side if (b.current_hp or 0) > 0]
+        self.end_of_turn(active, field)
+        for b in active:
+            b.flinched = False
+
+    def select_targets(self, user: Battler, move: Move, allies: Sequence[Battler], foes: Sequence[Battler],
+                       chosen: Optional[int] = None) -> List[Battler]:
+        """Battlers ``move`` hits, from ``Move.target``.
+
+        Spread moves hit every live foe ("all-opponents") or every other live
+        battler ("all-other-pokemon"); "ally" hits the partner and
+        "random-opponent" a random live foe. Everything else takes one foe:
+        the chosen one while it stands, else the first live one. Self and
+        field moves also get a foe, which is what their handlers expect.
+        """
+        live_foes = [b for b in foes if (b.current_hp or 0) > 0]
+        kind = move.target
+        if kind in _SPREAD_TARGETS:
+            if kind == "all-other-pokemon":
+                return live_foes + [b for b in allies if b is not user and (b.current_hp or 0) > 0]
+            return live_foes
+        if kind == "ally":
+            return [b for b in allies if b is not user and (b.current_hp or 0) > 0][:1]
+        if kind == "random-opponent" and len(live_foes) > 1:
+            return [self.rng.choice(live_foes)]
+        if chosen is not None and 0 <= chosen < len(foes) and (foes[chosen].current_hp or 0) > 0:
+            return [foes[chosen]]
+        return live_foes[:1]
+
+    def run_action(self, acting: Battler, mv: Move, targets: Sequence[Battler], field: FieldState):
+        """``acting`` uses ``mv`` on ``targets``: obedience, status and charge gates, accuracy, effect, PP."""
+        if acting.current_hp is None:
+            acting.current_hp = int(acting.stats.get("hp", 1))
+        if acting.current_hp <= 0:
+            return
+        self._emit(ActionStart, acting, mv)
+        cap = level_cap_for_badges(8 if acting.badge_count is None else int(acting.badge_count))
+        if acting.level > cap:
+            chance = disobedience_chance(acting.level, cap)
+            if self.rng.random() < chance:
+                # Behavior variants
+                roll = self.rng.randint(1, 100)
+                if roll <= 40:
+                    self._msg(f"{acting.name} ignored orders!")
+                elif roll <= 70 and acting.current_hp < acting.stats['hp']:
+                    # loaf (heal small amount)
+                    heal = max(1, acting.stats['hp']//20)
+                    acting.current_hp = min(acting.stats['hp'], acting.current_hp + heal)
+                    self._msg(f"{acting.name} loafed around and recovered a little HP!")
+                elif roll <= 85:
+                    self._msg(f"{acting.name} is loafing around!")
+                else:
+                    # hurt itself in confusion style (1/8 max HP)
+                    dmg = max(1, acting.stats['hp']//8)
+                    self.apply_damage(acting, dmg, cause='self', meta={'reason': 'disobedience'})
+                    self._msg(f"{acting.name} was hurt in its disobedience!")
+                return
+        # PP check
+        if mv.pp is not None and mv.max_pp > 0 and mv.pp <= 0:
+            # Skip move (could implement Struggle); for now treat as fail
+            self._msg(f"{acting.name} has no PP left for {mv.name}!")
+            return
+        # Flinch check
+        if acting.flinched:
+            self._msg(f"{acting.name} flinched and couldn't move!")
+            acting.flinched = False
+            return
+        # Recharge turn takes precedence over other action checks
+        if getattr(acting, 'must_recharge', False):
+            self._msg(f"{acting.name} must recharge!")
+            acting.must_recharge = False
+            return
+        # Sleep handling
+        if acting.status == 'slp':
+            if acting.sleep_turns > 0:
+                acting.sleep_turns -= 1
+            if acting.sleep_turns > 0:
+                self._msg(f"{acting.name} is fast asleep.")
+                return
+            else:
+                acting.status = 'none'
+                self._msg(f"{acting.name} woke up!")
+        # Freeze handling (20% thaw each turn)
+        if acting.status == 'frz':
+            if self.rng.randint(1,100) <= 20:
+                acting.status = 'none'
+                self._msg(f"{acting.name} thawed out!")
+            else:
+                self._msg(f"{acting.name} is frozen solid!")
+                return
+        # Paralysis action prevention (25%)
+        if acting.status == 'par':
+            if self.rng.randint(1,100) <= 25:
+                self._msg(f"{acting.name} is fully paralyzed! It can't move!")
+                return
+        # Charging logic (two-turn moves with charge flag: Solar Beam, Sky Attack, etc.)
+        if acting.charging_move and acting.charging_move is mv and acting.charging_turns_left > 0:
+            acting.charging_turns_left -= 1
+            if acting.charging_turns_left > 0:
+                self._msg(f"{acting.name} continues charging {mv.name}!")
+                return
+            else:
+                self._msg(f"{acting.name} unleashes {mv.name}!", key="unleash")
+                # Clear semi-invulnerable on the attack turn
+                acting.semi_invulnerable = False
+        elif mv.flags.get('charge') and acting.charging_move is None:
+            # Begin charging: skip damage this turn
+            acting.charging_move = mv
+            acting.charging_turns_left = 1  # simple two-turn assumption
+            self._msg(f"{acting.name} began charging {mv.name}!", key="charging")
+            # Some moves make the user semi-invulnerable on the charge turn (e.g., Fly/Dig/Bounce/Dive)
+            if bool(mv.flags.get('semi_invulnerable', False)):
+                acting.semi_invulnerable = True
+            return
+        if mv.category == 'status' and 'taunt' in acting.timers:
+            self._msg(f"{acting.name} can't use {mv.name} after the taunt!")
+            return
+        hit = False
+        if not targets:
+            self._msg("But there was no target...", key="failed")
+        self.spread = SPREAD_MODIFIER if len(targets) > 1 else 1.0
+        try:
+            for opp in targets:
+                if not self.accuracy_check(acting, opp, mv):
+                    self._msg(f"{acting.name}'s {mv.name} missed!", key="missed")
+                    continue
+                # Fixed damage, status effects, damaging hits: the move's compiled handler
+                mv.effect(self, acting, mv, opp, field)
+                hit = True
+        finally:
+            self.spread = 1.0
+        if hit and acting.item_hooks.choice_lock and acting.choice_lock is None:
+            acting.choice_lock = mv
+        if mv.max_pp > 0 and mv.pp > 0:
+            mv.pp -= 1
+
     # ------------------------------------------------------------------
     # Reactive effects
     # ------------------------------------------------------------------
     def _contact_reactive(self, attacker: Battler, defender: Battler, move: Move, damage: int):
-        # Simple subset of contact-based abilities
-        if damage <= 0:
+        hooks = defender.ability_hooks.contact
+        if not hooks or damage <= 0:
             return
         # Use explicit flag if available, else infer from physical category.
-        is_contact = move.flags.get('contact', move.category == 'physical')
-        if not is_contact:
+        if not move.flags.get('contact', move.category == 'physical'):
             return
-        # Ignore suppressed ability
-        if getattr(defender, 'ability_suppressed', False):
-            ability = ''
-        else:
-            ability = (defender.ability or '').lower()
-        if ability == 'rough-skin':
-            thorn = max(1, defender.stats['hp']//16)
-            self.apply_damage(attacker, thorn, cause='ability', meta={'ability': 'rough-skin'})
-            self._msg(f"{attacker.name} is hurt by Rough Skin!")
-        elif ability == 'static' and attacker.status == 'none':
-            if self.rng.randint(1,100) <= 30:
-                attacker.status = 'par'
-                self._msg(f"{attacker.name} is paralyzed by Static!")
-        elif ability == 'flame-body' and attacker.status == 'none':
-            if self.rng.randint(1,100) <= 30:
-                attacker.status = 'brn'
-                self._msg(f"{attacker.name} is burned by Flame Body!")
-        elif ability == 'poison-point' and attacker.status == 'none':
-            if self.rng.randint(1,100) <= 30:
-                attacker.status = 'psn'
-                self._msg(f"{attacker.name} is poisoned by Poison Point!")
+        for hook in hooks:
+            hook(self, attacker, defender, move)
+
+    def switch_in(self, battler: Battler, foe: Optional[Battler], field: FieldState):
+        """``battler`` enters battle: resolve its hooks and run switch-in abilities."""
+        battler.attach_hooks()
+        battler.choice_lock = None
+        if battler.timers:
+            clear_timers(battler)
+        battler.trick_room_active = 'trick-room' in field.timers
+        for hook in battler.ability_hooks.switch_in:
+            hook(self, battler, foe, field)
 
     # ------------------------------------------------------------------
     # Status helper
@@ -843,6 +791,9 @@ class BattleCore:
             return False
         # If provided a move_type and it has no effect on the target, fail (e.g., Electric vs Ground for Thunder Wave)
         if move_type is not None:
+            # Safeguard stops statuses inflicted by moves
+            if 'safeguard' in target.timers:
+                return False
             try:
                 if self.get_effectiveness(str(move_type), target.types) == 0.0:
                     return False
@@ -854,7 +805,7 @@ class BattleCore:
             target.sleep_turns = self.rng.randint(2,5)
         elif code == 'tox':
             target.toxic_stage = 0  # will increment at end of turn
-        self._msg(f"{target.name} is afflicted with {code}!")
+        self._emit(StatusApplied, target, code)
         return True
 
     def _cure_status(self, target: Battler, announce: bool = True):
@@ -863,10 +814,9 @@ class BattleCore:
         target.status = 'none'
         target.sleep_turns = 0
         target.toxic_stage = 0
-        if announce:
-            self._msg(f"{target.name}'s status was cured!")
+        self._emit(StatusCured, target, announce)
 
 __all__ = [
-    "BattleCore", "Battler", "Move", "Stages", "FieldState",
+    "BattleCore", "Battler", "Move", "Stages", "Stats", "FieldState",
     "stage_multiplier_stat", "stage_multiplier_acc_eva"
 ]
@@ -0,0 +1,181 @@
+"""Deterministic damage-range calculator.
+
+Returns the exact damage distribution :meth:`BattleCore.calc_damage` samples
+from, without drawing any random numbers. It covers the damage roll, the crit
+and non-crit branches, and the hit-count distribution of multi-hit moves.
+
+The core draws a continuous roll ``r ~ U(0.85, 1.0)`` and truncates
+``X * r`` to an int, where ``X`` is the deterministic per-hit damage (see
+:meth:`BattleCore.hit_base`). So ``P(damage <= d) = P(r < (d + 1) / X)``.
+This module evaluates that CDF on an integer grid for many (target, move)
+pairs at once and returns dense probability arrays indexed by damage value.
+
+Requires NumPy.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .core import BattleCore, Battler, Move, FieldState
+
+ROLL_MIN = 0.85
+ROLL_MAX = 1.0
+
+def _is_damaging(move: Move) -> bool:
+    return move.category != "status" and move.power > 0
+
+def roll_pmf(x: np.ndarray, size: int) -> np.ndarray:
+    """Per-hit damage pmf for deterministic damage ``x`` (shape (N,)) on grid ``0..size-1``.
+
+    ``x == 0`` marks a no-damage hit (immune or non-damaging) and yields a
+    point mass at 0; otherwise damage is at least 1, as in ``calc_damage``.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    grid = np.arange(size, dtype=np.float64)
+    safe = np.where(x > 0, x, 1.0)[:, None]
+    cdf = np.clip(((grid[None, :] + 1) / safe - ROLL_MIN) / (ROLL_MAX - ROLL_MIN), 0.0, 1.0)
+    pmf = np.diff(cdf, axis=1, prepend=0.0)
+    # int(max(1, base)): anything that would round to 0 deals 1
+    pmf[:, 1] += pmf[:, 0]
+    pmf[:, 0] = 0.0
+    zero = x <= 0
+    pmf[zero] = 0.0
+    pmf[zero, 0] = 1.0
+    return pmf
+
+@dataclass
+class DamageTable:
+    """Damage distributions for every (target, move) pair of one attacker.
+
+    Arrays are indexed ``[target, move, ...]``; pmfs are over ``values`` (0..D-1).
+    """
+    values: np.ndarray        # (D,)
+    normal: np.ndarray        # (T, M, D) non-crit per-hit pmf
+    crit: np.ndarray          # (T, M, D) crit per-hit pmf
+    crit_chance: np.ndarray   # (T, M)
+    effectiveness: np.ndarray  # (T, M)
+    hit_counts: np.ndarray    # (H,) 1..max hits
+    hit_probs: np.ndarray     # (T, M, H)
+
+    @property
+    def per_hit(self) -> np.ndarray:
+        """Per-hit pmf mixing crit and non-crit branches, (T, M, D)."""
+        c = self.crit_chance[..., None]
+        return (1 - c) * self.normal + c * self.crit
+
+    def _bounds(self, pmf: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        nz = pmf > 0
+        lo = np.argmax(nz, axis=-1)
+        hi = pmf.shape[-1] - 1 - np.argmax(nz[..., ::-1], axis=-1)
+        return lo, hi
+
+    @property
+    def min_per_hit(self) -> np.ndarray:
+        return self._bounds(self.normal)[0]
+
+    @property
+    def max_per_hit(self) -> np.ndarray:
+        return self._bounds(self.crit)[1]
+
+    @property
+    def expected_per_hit(self) -> np.ndarray:
+        return self.per_hit @ self.values
+
+    @property
+    def expected_total(self) -> np.ndarray:
+        return self.expected_per_hit * (self.hit_probs @ self.hit_counts)
+
+    def total_pmf(self, t: int, m: int) -> np.ndarray:
+        """Total damage pmf of one use of move ``m`` on target ``t`` (all hits)."""
+        hit = self.per_hit[t, m]
+        out = np.zeros(1, dtype=np.float64)
+        acc = np.ones(1, dtype=np.float64)
+        for n, p in zip(self.hit_counts, self.hit_probs[t, m]):
+            acc = np.convolve(acc, hit)
+            if p > 0:
+                if out.shape[0] < acc.shape[0]:
+                    out = np.pad(out, (0, acc.shape[0] - out.shape[0]))
+                out += p * acc
+        return out
+
+@dataclass
+class DamageRange:
+    """Distribution of a single (user, target, move, field) tuple."""
+    rolls: List[int]           # every reachable non-crit per-hit damage
+    crit_rolls: List[int]      # every reachable crit per-hit damage
+    normal: np.ndarray         # pmf over 0..len-1
+    crit: np.ndarray
+    crit_chance: float
+    effectiveness: float
+    hit_counts: List[int]
+    hit_probs: List[float]
+    total: np.ndarray          # pmf of the total over all hits
+
+    @property
+    def min(self) -> int:
+        return self.rolls[0] if self.rolls else 0
+
+    @property
+    def max(self) -> int:
+        return self.crit_rolls[-1] if self.crit_rolls else 0
+
+    @property
+    def expected(self) -> float:
+        return float(self.total @ np.arange(self.total.shape[0]))
+
+def damage_table(user: Battler, targets: Sequence[Battler], moves: Optional[Sequence[Move]] = None,
+                 field: Optional[FieldState] = None, core: Optional[BattleCore] = None) -> DamageTable:
+    """Damage distributions for ``user`` using each of ``moves`` (default: its moveset) on each target."""
+    core = core or BattleCore(rng=None, message_cb=lambda _m: None)
+    field = field or FieldState()
+    moves = list(user.moves if moves is None else moves)
+    T, M = len(targets), len(moves)
+    x_norm = np.zeros((T, M))
+    x_crit = np.zeros((T, M))
+    crit_chance = np.zeros((T, M))
+    eff = np.ones((T, M))
+    max_hits = max([mv.hits[1] for mv in moves if mv.hits and _is_damaging(mv)] + [1])
+    hit_counts = np.arange(1, max_hits + 1)
+    hit_probs = np.zeros((T, M, max_hits))
+    for t, tgt in enumerate(targets):
+        for m, mv in enumerate(moves):
+            if not _is_damaging(mv):
+                hit_probs[t, m, 0] = 1.0
+                continue
+            e = core.get_effectiveness(mv.type, tgt.types)
+            eff[t, m] = e
+            crit_chance[t, m] = core.crit_chance(mv)
+            post = core.stab(user, mv) * e
+            x_norm[t, m] = core.hit_base(user, tgt, mv, field, False) * post
+            x_crit[t, m] = core.hit_base(user, tgt, mv, field, True) * post
+            if mv.hits and e > 0:
+                lo, hi = mv.hits
+                hit_probs[t, m, lo - 1:hi] = 1.0 / (hi - lo + 1)
+            else:
+                # Immune targets stop after the first (0 damage) hit
+                hit_probs[t, m, 0] = 1.0
+    size = int(np.floor(max(x_norm.max(initial=0), x_crit.max(initial=0)))) + 2
+    normal = roll_pmf(x_norm.ravel(), size).reshape(T, M, size)
+    crit = roll_pmf(x_crit.ravel(), size).reshape(T, M, size)
+    return DamageTable(values=np.arange(size), normal=normal, crit=crit, crit_chance=crit_chance,
+                       effectiveness=eff, hit_counts=hit_counts, hit_probs=hit_probs)
+
+def damage_range(user: Battler, target: Battler, move: Move, field: Optional[FieldState] = None,
+                 core: Optional[BattleCore] = None) -> DamageRange:
+    """Full damage distribution for one move; see :func:`damage_table` for batches."""
+    tbl = damage_table(user, [target], [move], field, core)
+    normal, crit = tbl.normal[0, 0], tbl.crit[0, 0]
+    probs = tbl.hit_probs[0, 0]
+    return DamageRange(
+        rolls=[int(v) for v in np.flatnonzero(normal > 0)],
+        crit_rolls=[int(v) for v in np.flatnonzero(crit > 0)],
+        normal=normal, crit=crit, crit_chance=float(tbl.crit_chance[0, 0]),
+        effectiveness=float(tbl.effectiveness[0, 0]),
+        hit_counts=[int(n) for n, p in zip(tbl.hit_counts, probs) if p > 0],
+        hit_probs=[float(p) for p in probs if p > 0],
+        total=tbl.total_pmf(0, 0),
+    )
+
+__all__ = ["DamageTable", "DamageRange", "damage_table", "damage_range", "roll_pmf"]
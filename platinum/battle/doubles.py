@@ -0,0 +1,156 @@
+"""Double battles: two active battlers per side.
+
+:class:`DoubleBattleSession` runs 2v2 battles on :meth:`BattleCore.multi_turn`.
+Each side is a list of :class:`Slot`; a slot fields one member of a party,
+so a side sends out two members of one party or, in tag mode (Platinum's
+multi battles), one member of the trainer's party and one of the partner's.
+
+A turn takes one ``(move index, target)`` choice per slot, where ``target``
+indexes the foe side (0 = left, 1 = right) and only matters for
+single-target moves; spread moves hit every live foe at
+``SPREAD_MODIFIER`` damage. All actions of the turn are ordered together by
+(priority, speed, tiebreak). Fainted slots are refilled from their own party
+before the next turn.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple, Union
+import os
+
+from .core import BattleCore, Battler, FieldState
+from .events import tee
+from .log import BattleLog, DEFAULT_CAPACITY
+from .session import Party, choose_move
+
+# (move index, foe slot) per slot
+Choice = Tuple[int, Optional[int]]
+
+# Default turn limit for run_auto
+MAX_TURNS = 200
+
+def _alive(b: Battler) -> bool:
+    return (b.current_hp or 0) > 0
+
+def _first_healthy(party: Party) -> int:
+    return next((i for i, m in enumerate(party.members) if _alive(m)), 0)
+
+@dataclass
+class Slot:
+    """One battle position, filled from ``party.members[index]``."""
+    party: Party
+    index: int
+
+    def battler(self) -> Battler:
+        return self.party.members[self.index]
+
+class DoubleBattleSession:
+    def __init__(self, player: Party, enemy: Party, core: Optional[BattleCore] = None, *,
+                 partner: Optional[Party] = None, enemy_partner: Optional[Party] = None, is_wild: bool = False,
+                 record_log: bool = True, log_capacity: int = DEFAULT_CAPACITY,
+                 log_export: Optional[Union[str, os.PathLike]] = None):
+        """``partner`` / ``enemy_partner`` switch a side to tag mode (one slot per party)."""
+        self.player = player
+        self.enemy = enemy
+        self.partner = partner
+        self.enemy_partner = enemy_partner
+        self.core = core or BattleCore()
+        self.field = FieldState()
+        self.turn_counter = 0
+        # Turn count at which an undecided battle is a STALEMATE (run_auto's max_turns)
+        self.turn_limit = MAX_TURNS
+        self.is_wild = is_wild
+        self.sides: Tuple[List[Slot], List[Slot]] = (self._slots(player, partner), self._slots(enemy, enemy_partner))
+        self.log = BattleLog(log_capacity, side_of=self._side_of)
+        own = self.core.caller_sink
+        if record_log:
+            self.core.sink = tee(own, self.log)
+            if log_export is not None:
+                self.log.export(log_export)
+        else:
+            self.core.sink = own
+
+        for party in self._parties(0) + self._parties(1):
+            for b in party.members:
+                b.attach_hooks()
+        for side in (0, 1):
+            for slot in self.sides[side]:
+                self._send_out(slot, side)
+
+    @staticmethod
+    def _slots(party: Party, partner: Optional[Party]) -> List[Slot]:
+        if partner is not None:
+            return [Slot(party, _first_healthy(party)), Slot(partner, _first_healthy(partner))]
+        healthy = [i for i, m in enumerate(party.members) if _alive(m)] or [0]
+        return [Slot(party, i) for i in healthy[:2]]
+
+    def _parties(self, side: int) -> List[Party]:
+        if side == 0:
+            return [self.player] if self.partner is None else [self.player, self.partner]
+        return [self.enemy] if self.enemy_partner is None else [self.enemy, self.enemy_partner]
+
+    def _side_of(self, battler: Battler) -> Optional[str]:
+        for side, name in ((0, "player"), (1, "enemy")):
+            if any(m is battler for p in self._parties(side) for m in p.members):
+                return name
+        return None
+
+    def close_log(self) -> None:
+        self.log.close()
+
+    def actives(self, side: int) -> List[Battler]:
+        """Battlers in ``side``'s slots (0 = player, 1 = enemy), fainted ones included."""
+        return [slot.battler() for slot in self.sides[side]]
+
+    def _send_out(self, slot: Slot, side: int) -> None:
+        foe = next((b for b in self.actives(1 - side) if _alive(b)), None)
+        self.core.switch_in(slot.battler(), foe, self.field)
+
+    def replace_fainted(self) -> None:
+        """Refill each slot whose battler fainted with the next healthy member of its party."""
+        for side in (0, 1):
+            for slot in self.sides[side]:
+                if _alive(slot.battler()):
+                    continue
+                taken = {s.index for s in self.sides[side] if s.party is slot.party}
+                nxt = next((i for i, m in enumerate(slot.party.members) if i not in taken and _alive(m)), None)
+                if nxt is not None:
+                    slot.index = nxt
+                    self._send_out(slot, side)
+
+    def is_over(self) -> bool:
+        return not all(any(p.has_available() for p in self._parties(side)) for side in (0, 1))
+
+    def step(self, player: Sequence[Choice] = (), enemy: Sequence[Choice] = ()) -> None:
+        """Play one turn; missing choices default to ``(0, None)``."""
+        self.replace_fainted()
+        if self.is_over():
+            return
+        actions = []
+        for side, choices in ((0, player), (1, enemy)):
+            for i, b in enumerate(self.actives(side)):
+                if not _alive(b):
+                    continue
+                idx, target = choices[i] if i < len(choices) else (0, None)
+                actions.append((b, choose_move(b, idx), target))
+        self.log.turn = self.turn_counter + 1
+        self.core.multi_turn(actions, (self.actives(0), self.actives(1)), self.field)
+        self.turn_counter += 1
+
+    def run_auto(self, max_turns: int = MAX_TURNS) -> str:
+        self.turn_limit = max_turns
+        while not self.is_over() and self.turn_counter < max_turns:
+            self.step()
+        return self.outcome()
+
+    def outcome(self) -> str:
+        player = any(p.has_available() for p in self._parties(0))
+        enemy = any(p.has_available() for p in self._parties(1))
+        if player and not enemy:
+            return "PLAYER_WIN"
+        if enemy and not player:
+            return "PLAYER_LOSS"
+        if self.turn_counter >= self.turn_limit:
+            return "STALEMATE"
+        return "ONGOING"
+
+__all__ = ["Choice", "DoubleBattleSession", "MAX_TURNS", "Slot"]
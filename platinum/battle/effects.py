@@ -0,0 +1,397 @@
+"""Move effects compiled to per-move handlers.
+
+Every :class:`~platinum.battle.core.Move` is compiled once, when it is
+constructed, into ``move.effect``: a handler from :data:`EFFECTS` bound to
+its parameters. ``BattleCore.single_turn`` executes a move (after the
+obedience/status/charge/accuracy gates) with a single call::
+
+    move.effect(core, user, move, target, field)
+
+How a move compiles:
+
+* a slug listed in :data:`MOVE_EFFECTS` uses that effect kind; for a status
+  move the kind runs as the move's action after the generic status handling
+  (stat changes, ailment) and reports whether it did anything;
+* other status moves use ``"status"`` with their stat changes (or the
+  :data:`FALLBACK_STAT_CHANGES` entry when the data has none);
+* everything else uses ``"damage"``, with :data:`FALLBACK_POWER` for
+  formula moves whose data power is 0 and :data:`RECHARGE_MOVES`.
+
+New behaviour is added by registering a kind and pointing slugs at it::
+
+    @register_effect("splash")
+    def _splash(core, user, move, target, field) -> bool:
+        core._msg("But nothing happened!")
+        return True
+
+    MOVE_EFFECTS["splash"] = ("splash", {})
+
+Handlers are module-level functions and parameters plain data, so compiled
+moves still pickle and deep-copy. Existing moves keep their handler; call
+:func:`compile_move` again after changing the tables.
+"""
+from __future__ import annotations
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+from . import timers
+from .events import FieldChange, MoveUsed, StatStage
+
+if TYPE_CHECKING:
+    from .core import BattleCore, Battler, FieldState, Move
+
+# handler(core, user, move, target, field, **params)
+EffectHandler = Callable[..., Optional[bool]]
+
+EFFECTS: Dict[str, EffectHandler] = {}
+
+def register_effect(kind: str) -> Callable[[EffectHandler], EffectHandler]:
+    def deco(fn: EffectHandler) -> EffectHandler:
+        EFFECTS[kind] = fn
+        return fn
+    return deco
+
+def _slug(move: "Move") -> str:
+    internal = move.flags.get('internal') if isinstance(move.flags, dict) else None
+    return str(internal or move.name).lower().replace(' ', '-').replace("'", "")
+
+_AILMENT_CODES = {'paralysis': 'par', 'burn': 'brn', 'poison': 'psn', 'toxic': 'tox', 'sleep': 'slp', 'freeze': 'frz'}
+_STAGE_STATS = {"attack", "defense", "sp-atk", "sp-def", "speed", "accuracy", "evasion"}
+
+def _ailment_code(ailment: str) -> str:
+    return _AILMENT_CODES.get(ailment, ailment[:3])
+
+# ---------------------------------------------------------------- damaging
+
+# Temporary base power for formula moves whose data power is 0/None
+FALLBACK_POWER: Dict[str, int] = {
+    'grass-knot': 60, 'low-kick': 60, 'gyro-ball': 60, 'crush-grip': 60, 'wring-out': 60, 'punishment': 60,
+    'magnitude': 70, 'return': 70, 'frustration': 70, 'trump-card': 40, 'flail': 20, 'reversal': 20,
+}
+
+# Hyper Beam-style moves (in addition to the 'recharge' flag)
+RECHARGE_MOVES = frozenset({
+    'hyper-beam', 'giga-impact', 'roar-of-time', 'blast-burn', 'frenzy-plant', 'hydro-cannon', 'rock-wrecker',
+})
+
+_DRAIN_TEXT = {
+    'absorb': "{user} absorbed nutrients from {target}!",
+    'mega-drain': "{user} absorbed nutrients from {target}!",
+    'giga-drain': "{user} absorbed nutrients from {target}!",
+    'leech-life': "{user} sucked life from {target}!",
+    'dream-eater': "{user} ate {target}'s dream!",
+    'drain-punch': "{user} drained power from {target}!",
+}
+
+@register_effect("damage")
+def _damage(core: "BattleCore", user: "Battler", move: "Move", target: "Battler", field: "FieldState", *,
+            power: Optional[int] = None, recharge: bool = False):
+    orig_power = move.power
+    if power is not None and (orig_power or 0) <= 0:
+        move.power = power
+    try:
+        result = core.calc_damage(user, target, move, field)
+    finally:
+        move.power = orig_power
+    if result["effectiveness"] == 0:
+        core._msg("It doesn't affect the target...", key="no-effect")
+    hits = result["hits"]
+    eff_mult = result["effectiveness"]
+    total_damage = 0
+    for idx, h in enumerate(hits, 1):
+        if h["damage"] <= 0: continue
+        core._emit(MoveUsed, user, move, idx, len(hits), h["crit"], eff_mult)
+        core.apply_damage(target, h["damage"], cause='move', meta={'effectiveness': eff_mult, 'move': move.name, 'attacker': user.name, 'hit_index': idx, 'multi_hits': len(hits)})
+        total_damage += h["damage"]
+        if target.current_hp is not None and target.current_hp <= 0:
+            break
+    if total_damage > 0:
+        if move.drain_ratio:
+            num, den = move.drain_ratio
+            core.apply_heal(user, max(1, (total_damage * num) // den), cause='drain', meta={'move': move.name})
+            text = _DRAIN_TEXT.get(move.slug, "{user} had its energy drained!")
+            core._msg(text.format(user=user.name, target=target.name))
+        if move.recoil_ratio:
+            rn, rd = move.recoil_ratio
+            core.apply_damage(user, max(1, (total_damage * rn) // rd), cause='recoil', meta={'move': move.name})
+            core._msg(f"{user.name} is damaged by recoil!")
+        # Ailment chance for damaging moves
+        if move.ailment and move.ailment not in {"none", "unknown"} and target.status == "none":
+            if core.rng.randint(1, 100) <= (move.ailment_chance or 0):
+                core._apply_status(target, _ailment_code(move.ailment), move_type=move.type)
+        if move.flinch_chance and target.current_hp and target.current_hp > 0:
+            if core.rng.randint(1, 100) <= move.flinch_chance:
+                target.flinched = True
+        for hook in user.item_hooks.after_hit:
+            hook(core, user, target, move, total_damage)
+    core._contact_reactive(user, target, move, total_damage)
+    # Clear charging state after execution
+    if user.charging_move is move and user.charging_turns_left == 0:
+        user.charging_move = None
+    if recharge and not user.must_recharge:
+        user.must_recharge = True
+
+def _fixed(core: "BattleCore", user: "Battler", move: "Move", target: "Battler", amount: int):
+    # Type immunity still applies
+    if core.get_effectiveness(move.type, target.types) == 0.0 or amount <= 0:
+        core._msg("It doesn't affect the target...", key="no-effect")
+        return
+    core._emit(MoveUsed, user, move)
+    core.apply_damage(target, amount, cause='move', meta={'move': move.name, 'fixed': True})
+
+@register_effect("fixed-damage")
+def _fixed_damage(core, user, move, target, field, *, amount: int):
+    _fixed(core, user, move, target, amount)
+
+@register_effect("level-damage")
+def _level_damage(core, user, move, target, field, *, scale: float = 1.0):
+    _fixed(core, user, move, target, max(1, int((user.level or 1) * scale)))
+
+@register_effect("half-hp")
+def _half_hp(core, user, move, target, field):
+    _fixed(core, user, move, target, max(1, int(target.current_hp or target.stats.get('hp', 1)) // 2))
+
+@register_effect("hp-difference")
+def _hp_difference(core, user, move, target, field):
+    cur_t = int(target.current_hp or target.stats.get('hp', 1))
+    cur_u = int(user.current_hp or user.stats.get('hp', 1))
+    _fixed(core, user, move, target, max(0, cur_t - cur_u))
+
+@register_effect("fail")
+def _fail(core, user, move, target, field) -> bool:
+    # Reactive or item/team dependent moves that are not simulated
+    core._msg("But it failed!", key="failed")
+    return False
+
+# ---------------------------------------------------------------- status moves
+
+# Stat changes for common Gen IV status moves whose data has none
+FALLBACK_STAT_CHANGES: Dict[str, Tuple[Tuple[str, int], ...]] = {
+    'growl': (("attack", -1),),
+    'leer': (("defense", -1),),
+    'tail-whip': (("defense", -1),),
+    'string-shot': (("speed", -1),),
+    'cotton-spore': (("speed", -2),),
+    'acid-armor': (("defense", 2),),
+    'iron-defense': (("defense", 2),),
+    'agility': (("speed", 2),),
+    'rock-polish': (("speed", 2),),
+    'amnesia': (("sp-def", 2),),
+    'barrier': (("defense", 1),),
+    'withdraw': (("defense", 1),),
+    'harden': (("defense", 1),),
+    'howl': (("attack", 1),),
+    'meditate': (("attack", 1),),
+    'sharpen': (("attack", 1),),
+    'swords-dance': (("attack", 2),),
+    'nasty-plot': (("sp-atk", 2),),
+    'calm-mind': (("sp-atk", 1), ("sp-def", 1)),
+    'bulk-up': (("attack", 1), ("defense", 1)),
+    'cosmic-power': (("defense", 1), ("sp-def", 1)),
+    'charge': (("sp-def", 1),),
+}
+
+def _normalize_stat(s: str) -> str:
+    s = s.replace("_", "-").lower()
+    if s in ("special-attack", "sp-atk", "spatk"): return "sp-atk"
+    if s in ("special-defense", "sp-def", "spdef"): return "sp-def"
+    return s
+
+def _compile_changes(move: "Move", slug: str) -> Tuple[Tuple[Optional[str], str, int, int], ...]:
+    """(stage attribute or None if not a stage, stat name, change, chance) per entry."""
+    out = []
+    if move.stat_changes:
+        for sc in move.stat_changes:
+            try:
+                chance = int(sc.get("chance", 100) or 100)  # type: ignore[arg-type]
+            except Exception:
+                chance = 100
+            try:
+                change = int(sc.get("change", 0) or 0)  # type: ignore[arg-type]
+            except Exception:
+                change = 0
+            stat = _normalize_stat(str(sc.get("stat")))
+            attr = stat.replace("-", "_") if stat in _STAGE_STATS and change != 0 else None
+            out.append((attr, stat, change, chance))
+    else:
+        for stat, change in FALLBACK_STAT_CHANGES.get(slug, ()):
+            out.append((stat.replace("-", "_"), stat, change, 100))
+    return tuple(out)
+
+@register_effect("status")
+def _status(core: "BattleCore", user: "Battler", move: "Move", target: "Battler", field: "FieldState", *,
+            changes: tuple = (), action: Optional[EffectHandler] = None):
+    core._emit(MoveUsed, user, move)
+    # If the move's type has no effect on the target (e.g., Electric vs Ground), it fails
+    if core.get_effectiveness(move.type, target.types) == 0.0:
+        core._msg("It doesn't affect the target...", key="no-effect")
+        return
+    applied_any = False
+    for attr, stat, change, chance in changes:
+        if core.rng.randint(1, 100) <= chance and attr is not None:
+            # Boosts apply to the user, drops to the target
+            who = user if change > 0 else target
+            setattr(who.stages, attr, max(-6, min(6, getattr(who.stages, attr) + change)))
+            core._emit(StatStage, who, stat, change)
+            applied_any = True
+    if move.ailment and move.ailment not in {"none", "unknown"} and target.status == "none":
+        if core.rng.randint(1, 100) <= (move.ailment_chance or 100):
+            if core._apply_status(target, _ailment_code(move.ailment), move_type=move.type):
+                applied_any = True
+    if action is not None and action(core, user, move, target, field):
+        applied_any = True
+    if not applied_any:
+        core._msg("But nothing happened.", key="nothing")
+
+@register_effect("rest")
+def _rest(core, user, move, target, field) -> bool:
+    if user.current_hp == user.stats['hp'] and user.status == 'none':
+        core._msg("But it failed!", key="failed")
+        return False
+    heal_amt = int(user.stats['hp'] - (user.current_hp or 0))
+    if heal_amt > 0:
+        core.apply_heal(user, heal_amt, cause='move', meta={'move': 'Rest'})
+    # Clear status then apply sleep (overwrite existing status even if none)
+    core._cure_status(user, announce=False)
+    core._apply_status(user, 'slp')
+    core._msg(f"{user.name} fell asleep and regained health!")
+    return True
+
+@register_effect("cure-status")
+def _cure(core, user, move, target, field, *, codes: Optional[frozenset] = None) -> bool:
+    # Heal Bell / Aromatherapy only heal the user in this 1v1 context
+    if user.status != 'none' and (codes is None or user.status in codes):
+        core._cure_status(user)
+        return True
+    return False
+
+@register_effect("aqua-ring")
+def _aqua_ring(core, user, move, target, field) -> bool:
+    if user.aqua_ring:
+        return False
+    user.aqua_ring = True
+    core._msg(f"A veil of water surrounds {user.name}!", key="effect")
+    return True
+
+_TIMED_TEXT = {
+    'magnet-rise': "{user} levitated with electromagnetism!",
+    'taunt': "{target} fell for the taunt!",
+    'tailwind': "The tailwind blew from behind {user}!",
+    'safeguard': "{user} became cloaked in a mystical veil!",
+}
+
+@register_effect("timed")
+def _timed(core, user, move, target, field, *, effect: str, turns: int, on_target: bool = False,
+           extra_turns: int = 0) -> bool:
+    # Battler-scoped timed effect; fails while it is already running
+    who = target if on_target else user
+    if effect in who.timers:
+        return False
+    if extra_turns:
+        turns += core.rng.randint(0, extra_turns)
+    timers.start(core, who, effect, turns, field)
+    core._msg(_TIMED_TEXT[effect].format(user=user.name, target=target.name), key="effect")
+    return True
+
+@register_effect("gastro-acid")
+def _gastro_acid(core, user, move, target, field) -> bool:
+    # No duration handling; lasts while the target stays in
+    if not target.ability or target.ability_suppressed:
+        return False
+    target.ability_suppressed = True
+    target.attach_hooks()
+    core._msg(f"{target.name}'s Ability was suppressed!", key="effect")
+    return True
+
+@register_effect("haze")
+def _haze(core, user, move, target, field) -> bool:
+    for b in (user, target):
+        b.stages = type(b.stages)()
+    core._msg("All stat changes were eliminated!", key="effect")
+    return True
+
+@register_effect("weather")
+def _weather(core, user, move, target, field, *, weather: str, turns: int = 5) -> bool:
+    field.weather = weather
+    timers.start(core, field, "weather", turns, field)
+    core._emit(FieldChange, weather, True)
+    return True
+
+@register_effect("field")
+def _field(core, user, move, target, field, *, effect: str, turns: int = 5) -> bool:
+    # Any timed field effect registered in platinum.battle.timers
+    timers.start(core, field, effect, turns, field, (user, target))
+    core._emit(FieldChange, effect, True)
+    return True
+
+@register_effect("stealth-rock")
+def _stealth_rock(core, user, move, target, field) -> bool:
+    if field.stealth_rock:
+        return False
+    field.stealth_rock = True
+    core._emit(FieldChange, 'stealth-rock', True)
+    return True
+
+# slug -> (effect kind, parameters)
+MOVE_EFFECTS: Dict[str, Tuple[str, Dict[str, Any]]] = {
+    'dragon-rage': ("fixed-damage", {"amount": 40}),
+    'sonic-boom': ("fixed-damage", {"amount": 20}),
+    'present': ("fixed-damage", {"amount": 40}),
+    'night-shade': ("level-damage", {}),
+    'seismic-toss': ("level-damage", {}),
+    'psywave': ("level-damage", {"scale": 0.8}),
+    'super-fang': ("half-hp", {}),
+    'endeavor': ("hp-difference", {}),
+    **{slug: ("fail", {}) for slug in (
+        'counter', 'mirror-coat', 'metal-burst', 'bide', 'spit-up', 'natural-gift', 'fling', 'beat-up',
+        'roar', 'whirlwind', 'teleport', 'destiny-bond', 'grudge',
+    )},
+    'rest': ("rest", {}),
+    'refresh': ("cure-status", {"codes": frozenset({'brn', 'par', 'psn', 'tox'})}),
+    'heal-bell': ("cure-status", {}),
+    'aromatherapy': ("cure-status", {}),
+    'aqua-ring': ("aqua-ring", {}),
+    'magnet-rise': ("timed", {"effect": "magnet-rise", "turns": 5}),
+    'taunt': ("timed", {"effect": "taunt", "turns": 3, "on_target": True, "extra_turns": 2}),
+    'tailwind': ("timed", {"effect": "tailwind", "turns": 3}),
+    'safeguard': ("timed", {"effect": "safeguard", "turns": 5}),
+    'gastro-acid': ("gastro-acid", {}),
+    'haze': ("haze", {}),
+    'mist': ("field", {"effect": "mist"}),
+    'trick-room': ("field", {"effect": "trick-room"}),
+    'reflect': ("field", {"effect": "reflect"}),
+    'light-screen': ("field", {"effect": "light-screen"}),
+    'stealth-rock': ("stealth-rock", {}),
+    'sunny-day': ("weather", {"weather": "sun"}),
+    'rain-dance': ("weather", {"weather": "rain"}),
+    'sandstorm': ("weather", {"weather": "sand"}),
+    'hail': ("weather", {"weather": "hail"}),
+}
+
+def compile_move(move: "Move") -> Callable[..., Optional[bool]]:
+    """Resolve ``move.slug`` and ``move.effect`` from the registries and return the handler."""
+    slug = _slug(move)
+    kind, params = MOVE_EFFECTS.get(slug, (None, {}))
+    if move.category == "status":
+        action = partial(EFFECTS[kind], **params) if kind is not None else None
+        effect = partial(EFFECTS["status"], changes=_compile_changes(move, slug), action=action)
+    elif kind is not None:
+        effect = partial(EFFECTS[kind], **params)
+    else:
+        recharge = bool(move.flags.get('recharge')) if isinstance(move.flags, dict) else False
+        effect = partial(EFFECTS["damage"], power=FALLBACK_POWER.get(slug),
+                         recharge=recharge or slug in RECHARGE_MOVES)
+    move.slug = slug
+    move.effect = effect
+    return effect
+
+def effect_kind(move: "Move") -> Optional[str]:
+    """Effect kind ``move`` compiles to; for status moves with an action, the action's kind."""
+    if move.slug in MOVE_EFFECTS:
+        return MOVE_EFFECTS[move.slug][0]
+    return "status" if move.category == "status" else "damage"
+
+__all__ = [
+    "EFFECTS", "EffectHandler", "MOVE_EFFECTS", "FALLBACK_POWER", "FALLBACK_STAT_CHANGES", "RECHARGE_MOVES",
+    "register_effect", "compile_move", "effect_kind",
+]
@@ -0,0 +1,185 @@
+"""Typed battle events and the sinks that consume them.
+
+:class:`BattleCore` reports what happens during a turn as small event
+objects instead of pre-formatted strings. Events are only built when a sink
+is attached (``core.sink is None`` costs a single attribute check), and text
+is only produced when a sink asks for it via :meth:`BattleEvent.text`.
+
+* ``TextSink(cb)`` formats events to the classic battle log lines; this is
+  what ``BattleCore.message_cb`` installs under the hood.
+* ``tee(a, b)`` fans one stream out to several sinks (log + screen effects).
+"""
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+if TYPE_CHECKING:
+    from .core import Battler, Move
+
+EventSink = Callable[["BattleEvent"], None]
+
+@dataclass(frozen=True, slots=True)
+class BattleEvent:
+    def text(self) -> str:
+        """Battle-log line for this event ('' if it is not narrated)."""
+        return ""
+
+@dataclass(frozen=True, slots=True)
+class Message(BattleEvent):
+    """Free-form narration; ``key`` tags lines UIs react to (e.g. 'nothing')."""
+    message: str
+    key: Optional[str] = None
+
+    def text(self) -> str:
+        return self.message
+
+@dataclass(frozen=True, slots=True)
+class ActionStart(BattleEvent):
+    """``user`` begins its action with ``move`` (not narrated; lets logs attribute what follows)."""
+    user: "Battler"
+    move: "Move"
+
+@dataclass(frozen=True, slots=True)
+class EndOfTurn(BattleEvent):
+    """Residual end-of-turn effects (weather, status damage, timers) begin."""
+
+@dataclass(frozen=True, slots=True)
+class MoveUsed(BattleEvent):
+    """A move was executed. Damaging moves emit one per landed hit (``hit`` >= 1)."""
+    user: "Battler"
+    move: "Move"
+    hit: int = 0
+    hits: int = 1
+    crit: bool = False
+    effectiveness: float = 1.0
+
+    def text(self) -> str:
+        out = f"{self.user.name} used {self.move.name}!"
+        if self.hits > 1:
+            out += f" (hit {self.hit})"
+        if self.crit:
+            out += " A critical hit!"
+        if self.effectiveness > 1:
+            out += " It's super effective!"
+        elif 0 < self.effectiveness < 1:
+            out += " It's not very effective..."
+        return out
+
+@dataclass(frozen=True, slots=True)
+class HpChange(BattleEvent):
+    target: "Battler"
+    old_hp: int
+    new_hp: int
+    cause: str = "other"
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+@dataclass(frozen=True, slots=True)
+class Damage(HpChange):
+    pass
+
+@dataclass(frozen=True, slots=True)
+class Heal(HpChange):
+    pass
+
+@dataclass(frozen=True, slots=True)
+class Faint(BattleEvent):
+    target: "Battler"
+
+    def text(self) -> str:
+        return f"{self.target.name} fainted!"
+
+@dataclass(frozen=True, slots=True)
+class StatusApplied(BattleEvent):
+    target: "Battler"
+    status: str
+
+    def text(self) -> str:
+        return f"{self.target.name} is afflicted with {self.status}!"
+
+@dataclass(frozen=True, slots=True)
+class StatusCured(BattleEvent):
+    target: "Battler"
+    announce: bool = True
+
+    def text(self) -> str:
+        return f"{self.target.name}'s status was cured!" if self.announce else ""
+
+_STAT_LABELS = {
+    'attack': 'Attack', 'defense': 'Defense', 'sp-atk': 'Special Attack', 'sp-def': 'Special Defense',
+    'speed': 'Speed', 'accuracy': 'Accuracy', 'evasion': 'Evasion',
+}
+
+@dataclass(frozen=True, slots=True)
+class StatStage(BattleEvent):
+    """A stat stage change request; ``stat`` uses hyphenated names ('sp-atk')."""
+    target: "Battler"
+    stat: str
+    change: int
+
+    def text(self) -> str:
+        adverb = ""
+        if abs(self.change) == 2:
+            adverb = " sharply"
+        elif abs(self.change) >= 3:
+            adverb = " drastically"
+        direction = " rose!" if self.change > 0 else " fell!"
+        return f"{self.target.name}'s {_STAT_LABELS.get(self.stat, self.stat.title())}{adverb}{direction}"
+
+_FIELD_TEXT = {
+    ("sun", True): "The sunlight turned harsh!",
+    ("sun", False): "The sunlight faded.",
+    ("rain", True): "It started to rain!",
+    ("rain", False): "The rain stopped.",
+    ("sand", True): "A sandstorm kicked up!",
+    ("sand", False): "The sandstorm subsided.",
+    ("hail", True): "It started to hail!",
+    ("hail", False): "The hail stopped.",
+    ("reflect", True): "Reflect raised your team's Defense!",
+    ("reflect", False): "Reflect wore off!",
+    ("light-screen", True): "Light Screen raised your team's Sp. Def!",
+    ("light-screen", False): "Light Screen wore off!",
+    ("trick-room", True): "The dimensions were twisted!",
+    ("trick-room", False): "The twisted dimensions returned to normal!",
+    ("mist", True): "A mist shrouded the field!",
+    ("mist", False): "The mist faded!",
+    ("stealth-rock", True): "Pointed stones float in the air around the foe's team!",
+}
+
+@dataclass(frozen=True, slots=True)
+class FieldChange(BattleEvent):
+    """Weather or a field effect started (``active``) or ended."""
+    effect: str
+    active: bool
+
+    def text(self) -> str:
+        return _FIELD_TEXT.get((self.effect, self.active), "")
+
+class TextSink:
+    """Formats events and forwards non-empty lines to ``cb``."""
+    __slots__ = ("cb",)
+
+    def __init__(self, cb: Callable[[str], None]):
+        self.cb = cb
+
+    def __call__(self, event: BattleEvent) -> None:
+        line = event.text()
+        if line:
+            self.cb(line)
+
+def tee(*sinks: Optional[EventSink]) -> Optional[EventSink]:
+    """Combine sinks, skipping ``None``; returns ``None`` if nothing is left."""
+    live = [s for s in sinks if s is not None]
+    if not live:
+        return None
+    if len(live) == 1:
+        return live[0]
+
+    def _fanout(event: BattleEvent) -> None:
+        for s in live:
+            s(event)
+    return _fanout
+
+__all__ = [
+    "ActionStart", "BattleEvent", "EndOfTurn", "EventSink", "Message", "MoveUsed", "HpChange", "Damage", "Heal", "Faint",
+    "StatusApplied", "StatusCured", "StatStage", "FieldChange", "TextSink", "tee",
+]
@@ -0,0 +1,246 @@
+"""Held-item hooks compiled per battler.
+
+Mirrors :mod:`platinum.battle.abilities`: items register handlers for hook
+points and :func:`item_hooks` compiles an item into an immutable, cached
+:class:`ItemHooks` that ``Battler.attach_hooks`` stores on the holder.
+
+Hook points:
+
+* ``attack``       ``fn(user, target, move, field, crit) -> float``: multiplier
+  on the holder's attacking stat (Choice Band, Light Ball...).
+* ``damage``       ``fn(user, target, move, field) -> float``: multiplier on
+  the holder's hits (Charcoal, Life Orb, Expert Belt...).
+* ``after_hit``    ``fn(core, user, target, move, damage)``: after the holder
+  lands a damaging move (Life Orb recoil, Shell Bell).
+* ``hp_drop``      ``fn(core, battler)``: the holder lost HP and is still up
+  (Oran/Sitrus and the pinch stat berries).
+* ``end_of_turn``  ``fn(core, battler, field)`` (Leftovers, Black Sludge...).
+
+``ItemHooks.speed`` scales effective speed and ``ItemHooks.choice_lock``
+locks the holder into the first move it uses until it switches out.
+
+Items without an explicit registration are compiled from their
+``assets/items`` entry where the category says enough: type-enhancement
+items and plates, in-a-pinch berries, and the halved-speed effort items.
+Consumed items are removed from ``battler.item`` and the holder's hooks are
+re-attached.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from functools import lru_cache
+import re
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple
+
+from platinum.data.items import get_item
+from .events import StatStage
+
+if TYPE_CHECKING:
+    from .core import BattleCore, Battler, Move
+
+HOOK_POINTS = ("attack", "damage", "after_hit", "hp_drop", "end_of_turn")
+
+# item -> hook point -> handler
+HELD_ITEMS: Dict[str, Dict[str, Callable]] = {}
+
+# Effective speed multipliers
+SPEED_MULTIPLIER: Dict[str, float] = {"choice-scarf": 1.5, "iron-ball": 0.5}
+
+CHOICE_ITEMS = frozenset({"choice-band", "choice-specs", "choice-scarf"})
+
+def register_item(name: str, point: str) -> Callable[[Callable], Callable]:
+    if point not in HOOK_POINTS:
+        raise ValueError(f"Unknown item hook point: {point}")
+
+    def deco(fn: Callable) -> Callable:
+        HELD_ITEMS.setdefault(name, {})[point] = fn
+        _compile.cache_clear()
+        return fn
+    return deco
+
+@dataclass(frozen=True, slots=True)
+class ItemHooks:
+    name: Optional[str] = None
+    attack: Tuple[Callable, ...] = ()
+    damage: Tuple[Callable, ...] = ()
+    after_hit: Tuple[Callable, ...] = ()
+    hp_drop: Tuple[Callable, ...] = ()
+    end_of_turn: Tuple[Callable, ...] = ()
+    speed: float = 1.0
+    choice_lock: bool = False
+
+    def __reduce__(self):
+        # Handlers may be closures; pickle/deepcopy by name and recompile (shared, cached)
+        return (item_hooks, (self.name,))
+
+NO_ITEM_HOOKS = ItemHooks()
+
+def item_hooks(name: Optional[str]) -> ItemHooks:
+    """Compiled hooks for held item ``name`` (NO_ITEM_HOOKS if it does nothing in battle)."""
+    return _compile(str(name or "").strip().lower().replace(" ", "-").replace("_", "-"))
+
+@lru_cache(maxsize=None)
+def _compile(key: str) -> ItemHooks:
+    if not key:
+        return NO_ITEM_HOOKS
+    table = dict(_from_data(key))
+    table.update(HELD_ITEMS.get(key, {}))
+    speed = SPEED_MULTIPLIER.get(key, table.pop("speed", 1.0))
+    choice = key in CHOICE_ITEMS
+    if not table and speed == 1.0 and not choice:
+        return NO_ITEM_HOOKS
+    return ItemHooks(key, *((table[p],) if p in table else () for p in HOOK_POINTS), speed=speed, choice_lock=choice)
+
+def consume(core: "BattleCore", b: "Battler"):
+    """Use up the holder's item."""
+    b.item = None
+    b.attach_hooks()
+
+# ---------------------------------------------------------------- helpers
+
+_STAT_NAMES = {"attack": "attack", "defense": "defense", "special attack": "sp-atk", "special defense": "sp-def",
+               "speed": "speed"}
+
+def _effectiveness(move: "Move", target: "Battler") -> float:
+    from .core import _TYPE_CHART
+    row = _TYPE_CHART.get(move.type, {})
+    eff = 1.0
+    for t in target.types:
+        eff *= row.get(t, 1.0)
+    return eff
+
+def _type_boost(move_type: str) -> Callable:
+    def hook(user, target, move, field) -> float:
+        return 1.2 if move.type == move_type else 1.0
+    return hook
+
+def _pinch_berry(stat: str) -> Callable:
+    attr = stat.replace("-", "_")
+
+    def hook(core, b):
+        if b.current_hp * 4 <= b.stats["hp"]:
+            consume(core, b)
+            cur = getattr(b.stages, attr)
+            setattr(b.stages, attr, min(6, cur + 1))
+            core._emit(StatStage, b, stat, 1)
+    return hook
+
+def _from_data(key: str) -> Dict[str, Callable]:
+    """Hooks derivable from the item's asset entry ({} if none or unknown)."""
+    try:
+        data = get_item(key)
+    except KeyError:
+        return {}
+    category = data.get("category")
+    text = data.get("short_effect") or ""
+    if category in ("type-enhancement", "plates"):
+        m = re.search(r"(\w+)-Type moves from holder do 20% more damage", text)
+        if m:
+            return {"damage": _type_boost(m.group(1).lower())}
+    elif category == "in-a-pinch":
+        m = re.search(r"Consumed at 1/4 max HP to boost (Attack|Defense|Special Attack|Special Defense|Speed)\.", text)
+        if m:
+            return {"hp_drop": _pinch_berry(_STAT_NAMES[m.group(1).lower()])}
+    elif category == "effort-training" and "halved Speed" in text:
+        return {"speed": 0.5}
+    return {}
+
+# ---------------------------------------------------------------- damage
+
+@register_item("choice-band", "attack")
+def _choice_band(user, target, move, field, crit) -> float:
+    return 1.5 if move.category == "physical" else 1.0
+
+@register_item("choice-specs", "attack")
+def _choice_specs(user, target, move, field, crit) -> float:
+    return 1.5 if move.category == "special" else 1.0
+
+@register_item("light-ball", "attack")
+def _light_ball(user, target, move, field, crit) -> float:
+    return 2.0 if user.species_id == 25 else 1.0
+
+@register_item("thick-club", "attack")
+def _thick_club(user, target, move, field, crit) -> float:
+    return 2.0 if move.category == "physical" and user.species_id in (104, 105) else 1.0
+
+@register_item("life-orb", "damage")
+def _life_orb(user, target, move, field) -> float:
+    return 1.3
+
+@register_item("expert-belt", "damage")
+def _expert_belt(user, target, move, field) -> float:
+    return 1.2 if _effectiveness(move, target) > 1 else 1.0
+
+@register_item("muscle-band", "damage")
+def _muscle_band(user, target, move, field) -> float:
+    return 1.1 if move.category == "physical" else 1.0
+
+@register_item("wise-glasses", "damage")
+def _wise_glasses(user, target, move, field) -> float:
+    return 1.1 if move.category == "special" else 1.0
+
+@register_item("life-orb", "after_hit")
+def _life_orb_recoil(core, user, target, move, damage):
+    if (user.current_hp or 0) > 0:
+        core.apply_damage(user, max(1, user.stats["hp"] // 10), cause='item', meta={'item': 'life-orb'})
+        core._msg(f"{user.name} lost some of its HP!")
+
+@register_item("shell-bell", "after_hit")
+def _shell_bell(core, user, target, move, damage):
+    if 0 < (user.current_hp or 0) < user.stats["hp"]:
+        core.apply_heal(user, max(1, damage // 8), cause='item', meta={'item': 'shell-bell'})
+        core._msg(f"{user.name} restored a little HP using its Shell Bell!")
+
+# ---------------------------------------------------------------- HP threshold berries
+
+@register_item("oran-berry", "hp_drop")
+def _oran_berry(core, b):
+    if b.current_hp * 2 <= b.stats["hp"]:
+        consume(core, b)
+        core.apply_heal(b, 10, cause='item', meta={'item': 'oran-berry'})
+        core._msg(f"{b.name} restored its health using its Oran Berry!")
+
+@register_item("sitrus-berry", "hp_drop")
+def _sitrus_berry(core, b):
+    if b.current_hp * 2 <= b.stats["hp"]:
+        consume(core, b)
+        core.apply_heal(b, max(1, b.stats["hp"] // 4), cause='item', meta={'item': 'sitrus-berry'})
+        core._msg(f"{b.name} restored its health using its Sitrus Berry!")
+
+# ---------------------------------------------------------------- end of turn
+
+@register_item("leftovers", "end_of_turn")
+def _leftovers(core, b, field):
+    if 0 < (b.current_hp or 0) < b.stats["hp"]:
+        core.apply_heal(b, max(1, b.stats["hp"] // 16), cause='item', meta={'item': 'leftovers'})
+        core._msg(f"{b.name} restored a little HP with Leftovers.")
+
+@register_item("black-sludge", "end_of_turn")
+def _black_sludge(core, b, field):
+    if (b.current_hp or 0) <= 0:
+        return
+    if "poison" in b.types:
+        _leftovers(core, b, field)
+    else:
+        core.apply_damage(b, max(1, b.stats["hp"] // 8), cause='item', meta={'item': 'black-sludge'})
+        core._msg(f"{b.name} is hurt by its Black Sludge!")
+
+@register_item("sticky-barb", "end_of_turn")
+def _sticky_barb(core, b, field):
+    if (b.current_hp or 0) > 0:
+        core.apply_damage(b, max(1, b.stats["hp"] // 8), cause='item', meta={'item': 'sticky-barb'})
+        core._msg(f"{b.name} is hurt by its Sticky Barb!")
+
+@register_item("flame-orb", "end_of_turn")
+def _flame_orb(core, b, field):
+    if (b.current_hp or 0) > 0:
+        core._apply_status(b, 'brn')
+
+@register_item("toxic-orb", "end_of_turn")
+def _toxic_orb(core, b, field):
+    if (b.current_hp or 0) > 0:
+        core._apply_status(b, 'tox')
+
+__all__ = [
+    "CHOICE_ITEMS", "HELD_ITEMS", "HOOK_POINTS", "ItemHooks", "NO_ITEM_HOOKS", "SPEED_MULTIPLIER",
+    "consume", "item_hooks", "register_item",
+]
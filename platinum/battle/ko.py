@@ -0,0 +1,132 @@
+"""Exact KO-probability calculator.
+
+Given an attacker repeating one move, returns ``P(target fainted by the end
+of turn k)`` for k = 1..N. No sampling is involved. The calculation builds on
+:mod:`platinum.battle.damage` and mirrors :meth:`BattleCore.end_of_turn`:
+
+* per-hit damage pmfs (roll + crit branches) convolved over the
+  ``Move.hits`` hit-count distribution;
+* accuracy/evasion (``stage_multiplier_acc_eva``) and the attacker's
+  paralysis as a per-turn "no damage" branch;
+* end-of-turn chip on the target: poison, burn, escalating toxic,
+  sand/hail (honouring type immunity and the weather timer), then the
+  Leftovers and Aqua Ring heals.
+
+State is a distribution over the target's *missing* HP, one row per
+(target, move) line. Convolutions are done with batched FFTs along the HP
+axis, so hundreds of lines cost a handful of array ops per turn.
+"""
+from __future__ import annotations
+from typing import Optional, Sequence
+
+import numpy as np
+
+from .core import BattleCore, Battler, Move, FieldState, stage_multiplier_acc_eva, _DEF_WEATHER_IMMUNITY
+from .damage import damage_table
+
+def _fft_conv(a: np.ndarray, b: np.ndarray, size: int) -> np.ndarray:
+    """Linear convolution of the last axes, truncated to ``size`` entries."""
+    n = a.shape[-1] + b.shape[-1] - 1
+    out = np.fft.irfft(np.fft.rfft(a, n) * np.fft.rfft(b, n), n)[..., :size]
+    return np.clip(out, 0.0, None)
+
+def _cap(pmf: np.ndarray, cap: int) -> np.ndarray:
+    """Fold all mass at index >= cap into index ``cap`` (any such hit is a KO)."""
+    if pmf.shape[-1] <= cap + 1:
+        return np.pad(pmf, [(0, 0)] * (pmf.ndim - 1) + [(0, cap + 1 - pmf.shape[-1])])
+    out = pmf[..., :cap + 1].copy()
+    out[..., cap] += pmf[..., cap + 1:].sum(axis=-1)
+    return out
+
+def _hit_chance(user: Battler, target: Battler, move: Move) -> float:
+    if move.accuracy is None:
+        return 1.0
+    mult = stage_multiplier_acc_eva(user.stages.accuracy) / stage_multiplier_acc_eva(target.stages.evasion)
+    return min(1.0, max(0.0, move.accuracy * mult / 100))
+
+def _shift(state: np.ndarray, amount: np.ndarray) -> np.ndarray:
+    """Shift missing-HP distributions by a per-target amount (>0 damage, <0 heal)."""
+    size = state.shape[-1]
+    j = np.arange(size)
+    src = j[None, :] - amount[:, None]                        # (T, size)
+    valid = (src >= 0) & (src < size)
+    out = np.where(valid[:, None, :], np.take_along_axis(state, np.clip(src, 0, size - 1)[:, None, :].repeat(state.shape[1], 1), -1), 0.0)
+    # Heals cannot overshoot max HP: mass healed past 0 missing HP lands on 0
+    heal = np.maximum(0, -amount)
+    csum = np.cumsum(state, axis=-1)
+    out[..., 0] = np.where(heal[:, None] > 0, csum[np.arange(len(heal)), :, np.minimum(heal, size - 1)], out[..., 0])
+    return out
+
+def ko_table(user: Battler, targets: Sequence[Battler], moves: Optional[Sequence[Move]] = None, turns: int = 3,
+             field: Optional[FieldState] = None, core: Optional[BattleCore] = None) -> np.ndarray:
+    """Cumulative KO probabilities, shape ``(len(targets), len(moves), turns)``.
+
+    Entry ``[t, m, k]`` is ``P(target t fainted by the end of turn k + 1)`` when
+    ``user`` uses ``moves[m]`` every turn. The attacker is assumed to survive.
+    """
+    field = field or FieldState()
+    moves = list(user.moves if moves is None else moves)
+    tbl = damage_table(user, targets, moves, field, core)
+    T, M = len(targets), len(moves)
+    max_hp = np.array([int(t.stats["hp"]) for t in targets])
+    size = int(max_hp.max())
+    cap = size  # damage >= the largest max HP is a KO for every target
+
+    # Per-use damage pmf: mixture over hit counts of convolution powers of the per-hit pmf
+    per_hit = _cap(tbl.per_hit, cap)
+    use = np.zeros_like(per_hit)
+    acc = np.zeros_like(per_hit)
+    acc[..., 0] = 1.0
+    for n, probs in zip(tbl.hit_counts, np.moveaxis(tbl.hit_probs, -1, 0)):
+        acc = _cap(_fft_conv(acc, per_hit, cap + 1 + per_hit.shape[-1]), cap)
+        use += probs[..., None] * acc
+    # Misses / full paralysis deal nothing
+    act = np.array([[_hit_chance(user, t, mv) for mv in moves] for t in targets])
+    if user.status == "par":
+        act *= 0.75
+    turn_pmf = act[..., None] * use
+    turn_pmf[..., 0] += 1 - act
+
+    # Missing-HP state; index >= the target's max HP means fainted (dropped from the array)
+    alive_mask = np.arange(size)[None, :] < max_hp[:, None]   # (T, size)
+    state = np.zeros((T, M, size))
+    for t, tgt in enumerate(targets):
+        cur = int(tgt.current_hp if tgt.current_hp is not None else tgt.stats["hp"])
+        if cur > 0:
+            state[t, :, int(tgt.stats["hp"]) - cur] = 1.0
+
+    out = np.zeros((T, M, turns))
+    toxic = np.array([t.toxic_stage for t in targets])
+    weather_left = field.remaining("weather")
+    for k in range(turns):
+        state = _fft_conv(state, turn_pmf, size) * alive_mask[:, None, :]
+        # End of turn, in BattleCore.end_of_turn order
+        chips = []
+        status_chip = np.zeros(T, dtype=np.int64)
+        for t, tgt in enumerate(targets):
+            if tgt.status in ("psn", "brn"):
+                status_chip[t] = max(1, max_hp[t] // 8)
+            elif tgt.status == "tox":
+                toxic[t] = min(15, toxic[t] + 1 if toxic[t] > 0 else 1)
+                status_chip[t] = max(1, (max_hp[t] * toxic[t]) // 16)
+        chips.append(status_chip)
+        weather_on = field.weather in _DEF_WEATHER_IMMUNITY and (weather_left == 0 or k < weather_left)
+        if weather_on:
+            immune = _DEF_WEATHER_IMMUNITY[field.weather]
+            chips.append(np.array([0 if any(ty in immune for ty in t.types) else max(1, max_hp[i] // 16)
+                                   for i, t in enumerate(targets)]))
+        chips.append(-np.array([max(1, max_hp[i] // 16) if t.item_hooks.name == "leftovers" else 0
+                                for i, t in enumerate(targets)]))
+        chips.append(-np.array([max(1, max_hp[i] // 16) if t.aqua_ring else 0 for i, t in enumerate(targets)]))
+        for amount in chips:
+            if amount.any():
+                state = _shift(state, amount) * alive_mask[:, None, :]
+        out[..., k] = 1.0 - state.sum(axis=-1)
+    return np.clip(out, 0.0, 1.0)
+
+def ko_probability(user: Battler, target: Battler, move: Move, turns: int = 3,
+                   field: Optional[FieldState] = None, core: Optional[BattleCore] = None) -> np.ndarray:
+    """``P(KO by end of turn k)`` for k = 1..turns, for one (user, target, move) line."""
+    return ko_table(user, [target], [move], turns, field, core)[0, 0]
+
+__all__ = ["ko_table", "ko_probability"]
@@ -0,0 +1,237 @@
+"""Bounded, structured battle log.
+
+:class:`BattleLog` is the event sink a :class:`BattleSession` installs on its
+core. Every event becomes a :class:`LogEntry` ``(seq, turn, side, actor,
+kind, payload, text)`` kept in a ring buffer of ``capacity`` entries, so a
+long battle holds only its most recent history. Entries are attributed to
+the action they happened in: ``ActionStart`` opens an action for the acting
+battler and ``EndOfTurn`` closes it, so the damage a move deals is filed
+under its user even though the target takes it.
+
+For display code the log still reads as the classic list of narration lines
+(iteration, ``len``, indexing and slicing cover narrated entries only);
+:meth:`BattleLog.mark` / :meth:`BattleLog.since` replace ``len(log)``
+bookkeeping, which a bounded buffer cannot support.
+
+Queries: :meth:`BattleLog.entries` filters by kind/side/turn, and
+:meth:`BattleLog.outcome` sums up one side's action in a turn as an
+:class:`ActionOutcome` (damage dealt, stat stages, statuses, field changes,
+message keys such as ``"missed"`` or ``"no-effect"``).
+
+``BattleLog.export(path)`` streams entries, as they are logged, to a
+gzip-compressed JSONL file (the entries already retained are written first).
+"""
+from __future__ import annotations
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
+import gzip
+import json
+import os
+
+from .events import (
+    ActionStart, BattleEvent, Damage, EndOfTurn, Faint, FieldChange, Heal, Message, MoveUsed, StatStage,
+    StatusApplied, StatusCured,
+)
+
+DEFAULT_CAPACITY = 2000
+
+@dataclass(frozen=True, slots=True)
+class LogEntry:
+    seq: int                 # position in the whole battle (survives eviction)
+    turn: int
+    side: Optional[str]      # 'player' / 'enemy' side of the acting battler; None outside actions
+    actor: Optional[str]     # acting battler's name
+    kind: str
+    payload: Dict[str, Any]
+    text: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"seq": self.seq, "turn": self.turn, "side": self.side, "actor": self.actor, "kind": self.kind,
+                "payload": self.payload, "text": self.text}
+
+def _hp(kind: str) -> Callable[[Any], Tuple[str, Dict[str, Any]]]:
+    def conv(e) -> Tuple[str, Dict[str, Any]]:
+        return kind, {"target": e.target.name, "amount": abs(e.old_hp - e.new_hp), "hp": e.new_hp,
+                      "cause": e.cause, **e.meta}
+    return conv
+
+# event type -> (entry kind, payload)
+_CONVERT: Dict[type, Callable[[Any], Tuple[str, Dict[str, Any]]]] = {
+    Message: lambda e: ("message", {"key": e.key} if e.key else {}),
+    ActionStart: lambda e: ("action", {"move": e.move.name}),
+    EndOfTurn: lambda e: ("end-of-turn", {}),
+    MoveUsed: lambda e: ("move", {"move": e.move.name, "hit": e.hit, "hits": e.hits, "crit": e.crit,
+                                  "effectiveness": e.effectiveness}),
+    Damage: _hp("damage"),
+    Heal: _hp("heal"),
+    Faint: lambda e: ("faint", {"target": e.target.name}),
+    StatusApplied: lambda e: ("status", {"target": e.target.name, "status": e.status}),
+    StatusCured: lambda e: ("cure", {"target": e.target.name}),
+    StatStage: lambda e: ("stage", {"target": e.target.name, "stat": e.stat, "change": e.change}),
+    FieldChange: lambda e: ("field", {"effect": e.effect, "active": e.active}),
+}
+
+@dataclass
+class ActionOutcome:
+    """What one side's action did in one turn (see :meth:`BattleLog.outcome`)."""
+    side: str
+    turn: int
+    actor: Optional[str] = None
+    move: Optional[str] = None
+    used: bool = False                   # the move executed (a MoveUsed event)
+    hits: int = 0
+    crit: bool = False
+    effectiveness: float = 1.0
+    damage: Dict[str, int] = field(default_factory=dict)   # battler name -> HP lost during the action
+    healed: Dict[str, int] = field(default_factory=dict)
+    stages: List[Tuple[str, str, int]] = field(default_factory=list)
+    statuses: List[Tuple[str, str]] = field(default_factory=list)
+    fields: List[Tuple[str, bool]] = field(default_factory=list)
+    fainted: List[str] = field(default_factory=list)
+    keys: Set[str] = field(default_factory=set)             # tagged messages ('missed', 'no-effect', ...)
+    lines: List[str] = field(default_factory=list)
+
+    def dealt(self) -> int:
+        """Damage to battlers other than the actor."""
+        return sum(v for k, v in self.damage.items() if k != self.actor)
+
+class BattleLog:
+    """Ring buffer of :class:`LogEntry`; a callable event sink."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, *,
+                 side_of: Optional[Callable[[Any], Optional[str]]] = None):
+        self.capacity = capacity
+        self.turn = 0
+        self._entries: deque = deque(maxlen=capacity)
+        self._seq = 0
+        self._side_of = side_of
+        self._side: Optional[str] = None
+        self._actor: Optional[str] = None
+        self._export: Any = None
+
+    # ---- sink
+    def __call__(self, event: BattleEvent) -> None:
+        kind, payload = _CONVERT[type(event)](event)
+        if kind == "action":
+            self._actor = event.user.name
+            self._side = self._side_of(event.user) if self._side_of is not None else None
+        elif kind == "end-of-turn":
+            self._actor = self._side = None
+        self._add(kind, payload, event.text())
+
+    def append(self, text: str) -> None:
+        """Add a free-form narration line (legacy ``message_cb`` style)."""
+        self._add("message", {}, text)
+
+    def _add(self, kind: str, payload: Dict[str, Any], text: str) -> None:
+        entry = LogEntry(self._seq, self.turn, self._side, self._actor, kind, payload, text)
+        self._seq += 1
+        self._entries.append(entry)
+        if self._export is not None:
+            self._export.write(json.dumps(entry.to_dict()) + "\n")
+
+    # ---- narration lines
+    def lines(self) -> List[str]:
+        return [e.text for e in self._entries if e.text]
+
+    def __iter__(self) -> Iterator[str]:
+        return (e.text for e in self._entries if e.text)
+
+    def __len__(self) -> int:
+        return sum(1 for e in self._entries if e.text)
+
+    def __getitem__(self, index: Union[int, slice]):
+        return self.lines()[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BattleLog):
+            return self.lines() == other.lines()
+        if isinstance(other, list):
+            return self.lines() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"BattleLog({len(self._entries)}/{self.capacity} entries, seq={self._seq})"
+
+    # ---- positions
+    def mark(self) -> int:
+        """Position of the next entry; pass to :meth:`since` or :meth:`truncate`."""
+        return self._seq
+
+    def since(self, mark: int) -> List[str]:
+        """Narration lines logged at or after ``mark`` (that are still retained)."""
+        return [e.text for e in self._entries if e.seq >= mark and e.text]
+
+    def truncate(self, mark: int) -> None:
+        """Drop entries logged at or after ``mark`` (rewind; exported lines stay written)."""
+        entries = self._entries
+        while entries and entries[-1].seq >= mark:
+            entries.pop()
+        self._seq = min(self._seq, mark)
+        self._actor = self._side = None
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    # ---- queries
+    def entries(self, kind: Optional[str] = None, *, side: Optional[str] = None, turn: Optional[int] = None,
+                since: Optional[int] = None) -> List[LogEntry]:
+        return [e for e in self._entries
+                if (kind is None or e.kind == kind) and (side is None or e.side == side)
+                and (turn is None or e.turn == turn) and (since is None or e.seq >= since)]
+
+    def outcome(self, side: str, turn: Optional[int] = None) -> ActionOutcome:
+        """Summary of ``side``'s action in ``turn`` (default: the latest turn logged)."""
+        if turn is None:
+            turn = self._entries[-1].turn if self._entries else self.turn
+        out = ActionOutcome(side, turn)
+        for e in self.entries(side=side, turn=turn):
+            p = e.payload
+            k = e.kind
+            out.actor = e.actor
+            if e.text:
+                out.lines.append(e.text)
+            if k == "action":
+                out.move = p["move"]
+            elif k == "move":
+                out.used = True
+                out.hits += 1
+                out.crit = out.crit or p["crit"]
+                out.effectiveness = p["effectiveness"]
+            elif k == "damage":
+                out.damage[p["target"]] = out.damage.get(p["target"], 0) + p["amount"]
+            elif k == "heal":
+                out.healed[p["target"]] = out.healed.get(p["target"], 0) + p["amount"]
+            elif k == "stage":
+                out.stages.append((p["target"], p["stat"], p["change"]))
+            elif k == "status":
+                out.statuses.append((p["target"], p["status"]))
+            elif k == "field":
+                out.fields.append((p["effect"], p["active"]))
+            elif k == "faint":
+                out.fainted.append(p["target"])
+            elif k == "message" and "key" in p:
+                out.keys.add(p["key"])
+        return out
+
+    # ---- export
+    def export(self, path: Union[str, os.PathLike]) -> None:
+        """Stream entries to gzip JSONL at ``path`` from now on (retained entries first)."""
+        self.close()
+        self._export = gzip.open(path, "wt", encoding="utf-8")
+        for e in self._entries:
+            self._export.write(json.dumps(e.to_dict()) + "\n")
+
+    def close(self) -> None:
+        """Finish the export file, if any."""
+        if self._export is not None:
+            self._export.close()
+            self._export = None
+
+def read_export(path: Union[str, os.PathLike]) -> List[LogEntry]:
+    """Load entries written by :meth:`BattleLog.export`."""
+    with gzip.open(path, "rt", encoding="utf-8") as fh:
+        return [LogEntry(**json.loads(line)) for line in fh if line.strip()]
+
+__all__ = ["ActionOutcome", "BattleLog", "DEFAULT_CAPACITY", "LogEntry", "read_export"]
@@ -0,0 +1,245 @@
+"""Parallel Monte Carlo tree search opponent for late-game trainers.
+
+:class:`MCTSAI` picks the enemy's move with open-loop, decoupled-UCT MCTS:
+tree nodes are keyed by the joint (enemy move, player move) history, each
+side keeps its own UCB1 statistics per node, and every iteration re-plays
+the real engine (:meth:`BattleSession.step`, message sink detached) after
+rewinding one worker-local session with :meth:`BattleSession.restore`, so
+all mechanics and RNG draws are the real ones.
+Leaves are scored by a uniformly random rollout of up to
+``MCTSProfile.rollout_turns`` turns.
+
+Root parallelism: ``MCTSProfile.workers`` independent trees are grown from
+the root across a ``ProcessPoolExecutor`` (capped at the CPU count), each
+with its own RNG streams, and their root visit counts are summed. Frozen
+executables, and machines where the pool cannot start, grow the trees
+in-process instead. Every
+stream derives from ``(seed, decision, tree)`` (:class:`~.rng.RNGService`);
+iteration ``i`` replays the engine from position ``i << 32`` of the tree's
+battle stream, a counter seek rather than a reseed. With an iteration budget
+the chosen moves are reproducible from the seed on any machine and any
+process count. With a
+millisecond budget the search is anytime and only reproducible up to timing.
+"""
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+import math
+import os
+import pickle
+import random
+import sys
+import time
+
+from .core import BattleCore, Battler
+from .memo import DamageMemo
+from .rng import STATE_TAG, RNGService, StreamRNG
+from .session import BattleSession, Party
+
+@dataclass(frozen=True)
+class MCTSProfile:
+    budget_ms: float = 1000.0        # wall-clock decision time budget
+    iterations: Optional[int] = None  # fixed per-tree iteration budget (overrides budget_ms)
+    workers: int = 4                 # independent root trees (each with its own seed)
+    rollout_turns: int = 20
+    exploration: float = 1.4
+
+# Trainer id prefix -> MCTS profile; other tiers use the expectimax search
+MCTS_PROFILES: Dict[str, MCTSProfile] = {
+    "elite_four": MCTSProfile(budget_ms=1000, workers=4),
+    "champion": MCTSProfile(budget_ms=1500, workers=4),
+}
+
+@dataclass
+class MCTSStats:
+    iterations: int = 0
+    nodes: int = 0            # simulated turns (tree descent + rollouts)
+    elapsed_ms: float = 0.0
+    workers: int = 1
+
+    @property
+    def nodes_per_sec(self) -> float:
+        return self.nodes / (self.elapsed_ms / 1000) if self.elapsed_ms > 0 else 0.0
+
+class _Node:
+    __slots__ = ("visits", "stats", "children")
+
+    def __init__(self):
+        self.visits = 0
+        # Per side (0 = enemy/AI, 1 = player): move index -> [visits, total reward for that side]
+        self.stats: Tuple[Dict[int, list], Dict[int, list]] = ({}, {})
+        self.children: Dict[Tuple[int, int], "_Node"] = {}
+
+def _usable(b: Battler) -> List[int]:
+    moves = [i for i, m in enumerate(b.moves) if m.max_pp == 0 or m.pp > 0]
+    return moves or [0]
+
+def _select(node: _Node, side: int, actions: List[int], c: float, rng: random.Random) -> int:
+    stats = node.stats[side]
+    untried = [a for a in actions if a not in stats]
+    if untried:
+        return rng.choice(untried)
+    log_n = math.log(max(1, node.visits))
+    best, best_score = actions[0], -math.inf
+    for a in actions:
+        n, w = stats[a]
+        score = w / n + c * math.sqrt(log_n / n)
+        if score > best_score:
+            best, best_score = a, score
+    return best
+
+def _reward(session: BattleSession) -> float:
+    """Enemy-side reward in [0, 1]: 1 win, 0 loss, else by remaining HP share."""
+    if not session.player.has_available():
+        return 1.0 if session.enemy.has_available() else 0.5
+    if not session.enemy.has_available():
+        return 0.0
+    def frac(party: Party) -> float:
+        return sum(max(0, m.current_hp or 0) / m.stats["hp"] for m in party.members) / len(party.members)
+    return 0.5 + 0.5 * (frac(session.enemy) - frac(session.player))
+
+# Per-process damage memo; survives across decisions, so later turns of a battle mostly hit it
+_DAMAGE_MEMO = DamageMemo()
+
+def _restore(blob: bytes, rng: random.Random) -> BattleSession:
+    player, enemy, p_active, e_active, field, turn = pickle.loads(blob)
+    core = BattleCore(rng=rng)
+    core.damage_memo = _DAMAGE_MEMO
+    s = BattleSession(Party(player, p_active), Party(enemy, e_active), core=core,
+                      is_wild=False, record_log=False, send_out=False)
+    s.field = field
+    s.turn_counter = turn
+    return s
+
+def _search(job: tuple) -> Tuple[Dict[int, list], int, int, float]:
+    """One worker's tree search; returns (root enemy stats, iterations, nodes, elapsed ms)."""
+    blob, (seed, decision, tree), profile, budget_ms = job
+    service = RNGService(f"mcts:{seed}")
+    rng = service.worker(decision, tree)
+    engine_key = service.stream("engine", decision, tree).key
+    session = _restore(blob, StreamRNG())
+    root_snap = session.snapshot(include_rng=False)
+    root = _Node()
+    start = time.perf_counter()
+    deadline = start + budget_ms / 1000
+    iterations = nodes = 0
+    while True:
+        if profile.iterations is not None:
+            if iterations >= profile.iterations:
+                break
+        elif iterations and time.perf_counter() >= deadline:
+            break
+        session.restore(root_snap)
+        session.core.rng.setstate((STATE_TAG, engine_key, iterations << 32))
+        node, path = root, []
+        # Selection / expansion: descend while the joint action has a child
+        while not session.is_over():
+            a = _select(node, 0, _usable(session.enemy.active()), profile.exploration, rng)
+            b = _select(node, 1, _usable(session.player.active()), profile.exploration, rng)
+            session.step(b, a)
+            nodes += 1
+            path.append((node, a, b))
+            child = node.children.get((a, b))
+            if child is None:
+                node.children[(a, b)] = _Node()
+                break
+            node = child
+        # Rollout
+        for _ in range(profile.rollout_turns):
+            if session.is_over():
+                break
+            session.step(rng.choice(_usable(session.player.active())), rng.choice(_usable(session.enemy.active())))
+            nodes += 1
+        r = _reward(session)
+        for n, a, b in path:
+            n.visits += 1
+            sa = n.stats[0].setdefault(a, [0, 0.0])
+            sa[0] += 1
+            sa[1] += r
+            sb = n.stats[1].setdefault(b, [0, 0.0])
+            sb[0] += 1
+            sb[1] += 1.0 - r
+        iterations += 1
+    return root.stats[0], iterations, nodes, (time.perf_counter() - start) * 1000
+
+class MCTSAI:
+    """Enemy move selection by root-parallel MCTS; call :meth:`close` when the battle ends."""
+
+    def __init__(self, profile: Optional[MCTSProfile] = None, *, seed: int = 0):
+        self.profile = profile or MCTS_PROFILES["elite_four"]
+        self.seed = seed
+        self.decisions = 0
+        self.last = MCTSStats()
+        self.root_stats: Dict[int, list] = {}
+        self._pool: Optional[ProcessPoolExecutor] = None
+        # Set once a pool fails to start or breaks; later decisions stay in-process
+        self._serial = False
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _jobs(self, blob: bytes, decision: int, trees: int, procs: int) -> list:
+        # Trees beyond the process count run back to back; split the budget so wall time stays on target
+        budget = self.profile.budget_ms * procs / trees
+        return [(blob, (self.seed, decision, w), self.profile, budget) for w in range(trees)]
+
+    def choose(self, session: BattleSession) -> int:
+        """Index into the enemy active's moves (0 if nothing is usable, i.e. Struggle)."""
+        usable = [i for i, m in enumerate(session.enemy.active().moves) if m.max_pp == 0 or m.pp > 0]
+        decision = self.decisions
+        self.decisions += 1
+        if len(usable) <= 1:
+            self.last = MCTSStats()
+            return usable[0] if usable else 0
+        blob = pickle.dumps((session.player.members, session.enemy.members, session.player.active_index,
+                             session.enemy.active_index, session.field, session.turn_counter))
+        trees = max(1, self.profile.workers)
+        # Frozen builds (PyInstaller) re-run the game in pool workers: search in-process there
+        serial = self._serial or getattr(sys, "frozen", False)
+        procs = 1 if serial else min(trees, os.cpu_count() or 1)
+        start = time.perf_counter()
+        results = None
+        if procs > 1:
+            try:
+                if self._pool is None:
+                    self._pool = ProcessPoolExecutor(max_workers=procs)
+                results = list(self._pool.map(_search, self._jobs(blob, decision, trees, procs)))
+            except (OSError, NotImplementedError, BrokenProcessPool):
+                self.close()
+                self._serial = True
+                procs = 1
+        if results is None:
+            results = [_search(job) for job in self._jobs(blob, decision, trees, 1)]
+        merged: Dict[int, list] = {}
+        for stats, _, _, _ in results:
+            for a, (n, w) in stats.items():
+                acc = merged.setdefault(a, [0, 0.0])
+                acc[0] += n
+                acc[1] += w
+        self.root_stats = merged
+        self.last = MCTSStats(
+            iterations=sum(r[1] for r in results), nodes=sum(r[2] for r in results),
+            elapsed_ms=(time.perf_counter() - start) * 1000, workers=procs,
+        )
+        # Robust child: most visits, then mean reward, then lowest index
+        return max(sorted(merged), key=lambda a: (merged[a][0], merged[a][1] / merged[a][0]))
+
+def mcts_for_trainer(trainer_id: Optional[str], *, seed: int = 0) -> Optional[MCTSAI]:
+    """MCTS opponent for Elite Four / Champion ids, else None."""
+    tid = (trainer_id or "").lower()
+    for prefix, profile in MCTS_PROFILES.items():
+        if tid.startswith(prefix):
+            return MCTSAI(profile, seed=seed)
+    return None
+
+__all__ = ["MCTSAI", "MCTSProfile", "MCTSStats", "MCTS_PROFILES", "mcts_for_trainer"]
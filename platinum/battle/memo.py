@@ -0,0 +1,94 @@
+"""Bounded memo for the deterministic part of the damage formula.
+
+Search re-plays the same matchups over and over, so :meth:`BattleCore.calc_damage`
+recomputes :meth:`BattleCore.hit_base` (stats, stages, burn, weather,
+screens, crit, ability and item multipliers) for identical inputs. With
+``core.damage_memo = DamageMemo()`` those values come from an LRU table
+instead; the damage roll, crit draw, STAB and effectiveness are still
+applied per call, so results and RNG draws are unchanged.
+
+The key is a flat tuple of everything ``hit_base`` and the attack/defense
+hooks read, none of it tied to object identity except the compiled hook
+objects (cached for the life of the process). Battlers rebuilt from a
+snapshot or a pickle therefore hit the same entries, and a memo kept per
+process warms up over a whole battle.
+
+The table holds at most ``max_bytes`` worth of entries (estimated from the
+first key) and counts hits, misses and evictions.
+"""
+from __future__ import annotations
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict
+import sys
+
+if TYPE_CHECKING:
+    from .core import BattleCore, Battler, FieldState, Move
+
+DEFAULT_BUDGET = 4 << 20
+# Per-entry overhead of the OrderedDict (hash slot + linked-list node) and the float value
+_ENTRY_OVERHEAD = 150
+
+class DamageMemo:
+    def __init__(self, max_bytes: int = DEFAULT_BUDGET):
+        self.max_bytes = max_bytes
+        self.capacity = 0            # entries; fixed on first insert
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._table: "OrderedDict[tuple, float]" = OrderedDict()
+
+    @staticmethod
+    def key(core: "BattleCore", user: "Battler", target: "Battler", move: "Move", field: "FieldState",
+            crit: bool) -> tuple:
+        us, ts = user.stats, target.stats
+        if move.category == "physical":
+            atk, atk_stage, dfn, def_stage = us.atk, user.stages.attack, ts.def_, target.stages.defense
+        else:
+            atk, atk_stage, dfn, def_stage = us.sp_atk, user.stages.sp_atk, ts.sp_def, target.stages.sp_def
+        return (
+            move.slug, move.power, move.type, move.category, bool(move.recoil_ratio), crit, core.spread,
+            user.level, atk, atk_stage, user.status, user.species_id,
+            # Pinch abilities (Blaze, Torrent...) read HP only through the 1/3 threshold
+            (user.current_hp or 0) * 3 <= us.hp, id(user.ability_hooks), id(user.item_hooks),
+            dfn, def_stage, target.status, target.types, id(target.ability_hooks),
+            field.weather, field.reflect, field.light_screen,
+        )
+
+    def hit_base(self, core: "BattleCore", user: "Battler", target: "Battler", move: "Move", field: "FieldState",
+                 crit: bool) -> float:
+        """``core.hit_base(...)``, from the table when the same inputs were seen before."""
+        key = self.key(core, user, target, move, field, crit)
+        table = self._table
+        x = table.get(key)
+        if x is not None:
+            self.hits += 1
+            table.move_to_end(key)
+            return x
+        self.misses += 1
+        x = core.hit_base(user, target, move, field, crit)
+        if not self.capacity:
+            entry = sys.getsizeof(key) + sum(sys.getsizeof(v) for v in key) + _ENTRY_OVERHEAD
+            self.capacity = max(1, self.max_bytes // entry)
+        table[key] = x
+        if len(table) > self.capacity:
+            table.popitem(last=False)
+            self.evictions += 1
+        return x
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size": len(self._table),
+                "capacity": self.capacity, "hit_rate": self.hit_rate}
+
+    def clear(self) -> None:
+        self._table.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+__all__ = ["DEFAULT_BUDGET", "DamageMemo"]
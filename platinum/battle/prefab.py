@@ -0,0 +1,78 @@
+"""Prefab cache for freshly built battlers.
+
+:func:`battler_from_species` reads the species, derives stats, filters the
+learnset and builds every Move from its JSON. Encounters on a route, demo
+battles and trainer rematches ask for the same (species, level, moveset)
+again and again, so :class:`PrefabCache` builds each one once as a template
+that is never handed out, and returns clones: a new Battler with its own
+Stats and per-battler :meth:`Move.copy` objects (so PP and battle state
+stay independent), sharing only read-only data. Entries are evicted least
+recently used first; hits, misses and evictions are counted.
+"""
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence, Tuple
+from .core import Battler, Stats
+from .experience import clamp_level
+from .factory import battler_from_species
+
+DEFAULT_CAPACITY = 256
+
+PrefabKey = Tuple[int, int, Optional[Tuple[str, ...]]]
+
+def _clone(t: Battler, name: str) -> Battler:
+    s = t.stats
+    return Battler(species_id=t.species_id, name=name, level=t.level, types=t.types,
+                   stats=Stats(s.hp, s.atk, s.def_, s.sp_atk, s.sp_def, s.speed), ability=t.ability,
+                   moves=[m.copy() for m in t.moves])
+
+class PrefabCache:
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._templates: "OrderedDict[PrefabKey, Battler]" = OrderedDict()
+
+    def battler(self, species_id: int, level: int, nickname: str | None = None,
+                moves: Sequence[str] | None = None) -> Battler:
+        """Same result as ``battler_from_species(...)``, cloned from a cached template."""
+        key = (int(species_id), clamp_level(level), tuple(moves) if moves is not None else None)
+        templates = self._templates
+        t = templates.get(key)
+        if t is not None:
+            self.hits += 1
+            templates.move_to_end(key)
+        else:
+            self.misses += 1
+            t = battler_from_species(key[0], key[1], moves=list(moves) if moves is not None else None)
+            templates[key] = t
+            if len(templates) > self.capacity:
+                templates.popitem(last=False)
+                self.evictions += 1
+        return _clone(t, nickname or t.name)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size": len(self._templates),
+                "capacity": self.capacity, "hit_rate": self.hit_rate}
+
+    def clear(self) -> None:
+        self._templates.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+# Process-wide cache used by encounters, trainer parties and demo battles
+PREFABS = PrefabCache()
+
+def prefab_battler(species_id: int, level: int, nickname: str | None = None,
+                   moves: Sequence[str] | None = None) -> Battler:
+    return PREFABS.battler(species_id, level, nickname, moves)
+
+__all__ = ["DEFAULT_CAPACITY", "PREFABS", "PrefabCache", "prefab_battler"]
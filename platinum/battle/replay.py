@@ -0,0 +1,437 @@
+"""Compact deterministic battle replays.
+
+A replay is the initial battle state (both parties plus the core RNG seed or
+state) followed by the stream of player-facing actions: turns (both move
+indices), switches, bag items, capture and flee attempts. Every action is
+stored with a 32-bit hash of the session state after it ran, so a replay
+re-driven through :class:`BattleSession` headlessly can check each turn.
+
+Usage::
+
+    rec = ReplayRecorder(session, seed=1234)   # reseeds session.core.rng
+    session.step(0, 1); session.switch("player", 2); ...
+    data = rec.to_bytes()                      # a few hundred bytes
+
+    Replay.from_bytes(data).play()             # raises ReplayMismatch on divergence
+
+Wire format: ``b"PRPL"``, a version byte, then unsigned LEB128 varints
+(zigzag for signed values). Strings (names, move slugs, items) are interned
+in a table and referenced by index.
+"""
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Tuple, Union
+import argparse
+import random
+import struct
+
+from platinum.core.errors import PlatinumError
+from .core import BattleCore, Battler, Stats
+from .factory import battler_from_species, move_from_data, move_slug
+from .rng import STATE_TAG as STREAM_STATE_TAG, StreamRNG, is_stream_state
+from .session import BattleSession, Party, OP_TURN, OP_SWITCH, OP_ITEM, OP_CAPTURE, OP_FLEE
+
+MAGIC = b"PRPL"
+VERSION = 2
+
+# How the initial RNG is described in the header
+_RNG_INT_SEED, _RNG_STR_SEED, _RNG_STATE, _RNG_STREAM = range(4)
+
+class ReplayError(PlatinumError):
+    pass
+
+class ReplayMismatch(ReplayError):
+    def __init__(self, index: int, expected: int, actual: int):
+        super().__init__(f"Replay diverged at action {index}: state hash {actual:08x} != {expected:08x}")
+        self.index = index
+        self.expected = expected
+        self.actual = actual
+
+# ---------------------------------------------------------------- state hash
+
+def state_hash(session: BattleSession) -> int:
+    """Stable 32-bit hash of everything a turn can change, including the RNG position."""
+    return session.state_hash()
+
+# ------------------------------------------------------------------- varints
+
+class _Writer:
+    def __init__(self):
+        self.buf = bytearray()
+        self.strings: List[str] = []
+        self._index: dict = {}
+
+    def uint(self, n: int):
+        n = int(n)
+        if n < 0:
+            raise ReplayError(f"Cannot encode negative value {n} as unsigned")
+        while True:
+            byte = n & 0x7F
+            n >>= 7
+            if n:
+                self.buf.append(byte | 0x80)
+            else:
+                self.buf.append(byte)
+                return
+
+    def sint(self, n: int):
+        # Zigzag: arbitrary-size ints map to 0, -1 -> 1, 1 -> 2, ...
+        n = int(n)
+        self.uint(n * 2 if n >= 0 else -n * 2 - 1)
+
+    def text(self, s: Optional[str]):
+        """Interned optional string: 0 is None, otherwise table index + 1."""
+        if s is None:
+            self.uint(0)
+            return
+        idx = self._index.get(s)
+        if idx is None:
+            idx = self._index[s] = len(self.strings)
+            self.strings.append(s)
+        self.uint(idx + 1)
+
+class _Reader:
+    def __init__(self, data: bytes, pos: int = 0, strings: Optional[List[str]] = None):
+        self.data = data
+        self.pos = pos
+        self.strings = strings or []
+
+    def uint(self) -> int:
+        out = shift = 0
+        while True:
+            if self.pos >= len(self.data):
+                raise ReplayError("Truncated replay")
+            byte = self.data[self.pos]
+            self.pos += 1
+            out |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return out
+            shift += 7
+
+    def sint(self) -> int:
+        n = self.uint()
+        return n // 2 if not n & 1 else -(n + 1) // 2
+
+    def text(self) -> Optional[str]:
+        idx = self.uint()
+        if idx == 0:
+            return None
+        try:
+            return self.strings[idx - 1]
+        except IndexError:
+            raise ReplayError(f"Bad string reference {idx}") from None
+
+    def raw(self, n: int) -> bytes:
+        if self.pos + n > len(self.data):
+            raise ReplayError("Truncated replay")
+        out = self.data[self.pos:self.pos + n]
+        self.pos += n
+        return out
+
+# ------------------------------------------------------------- replay model
+
+@dataclass(frozen=True)
+class MemberState:
+    """Initial state of one party member; enough to rebuild an identical Battler."""
+    species_id: int
+    level: int
+    name: str
+    stats: Tuple[int, int, int, int, int, int]
+    moves: Tuple[Tuple[str, int], ...]          # (slug, current pp)
+    current_hp: int
+    status: str = "none"
+    sleep_turns: int = 0
+    toxic_stage: int = 0
+    ability: Optional[str] = None
+    item: Optional[str] = None
+    badge_count: Optional[int] = None
+
+    @classmethod
+    def of(cls, b: Battler) -> "MemberState":
+        moves = []
+        for m in b.moves:
+            slug = (m.flags or {}).get("internal") or move_slug(m.name)
+            moves.append((str(slug), int(m.pp)))
+        return cls(
+            species_id=int(b.species_id), level=int(b.level), name=b.name,
+            stats=tuple(int(v) for v in b.stats.values()), moves=tuple(moves),
+            current_hp=int(b.current_hp or 0), status=b.status, sleep_turns=b.sleep_turns,
+            toxic_stage=b.toxic_stage, ability=b.ability, item=b.item, badge_count=b.badge_count,
+        )
+
+    def build(self) -> Battler:
+        b = battler_from_species(self.species_id, self.level, nickname=self.name, moves=[])
+        b.stats = Stats(*self.stats)
+        b.moves = [move_from_data(slug, fallback_type=b.types[0], pp=pp) for slug, pp in self.moves]
+        # Battler.__post_init__ resets non-positive HP, so fainted members are patched afterwards
+        b.current_hp = self.current_hp
+        b.status = self.status
+        b.sleep_turns = self.sleep_turns
+        b.toxic_stage = self.toxic_stage
+        b.ability = self.ability
+        b.item = self.item
+        b.badge_count = self.badge_count
+        return b
+
+@dataclass(frozen=True)
+class Action:
+    op: int
+    args: Tuple[Any, ...]
+    state_hash: int
+
+@dataclass
+class Replay:
+    player: List[MemberState]
+    enemy: List[MemberState]
+    player_active: int = 0
+    enemy_active: int = 0
+    is_wild: bool = True
+    # int/str seed, a full random.Random.getstate() tuple, or a StreamRNG state
+    rng: Union[int, str, tuple] = 0
+    actions: List[Action] = field(default_factory=list)
+
+    def new_session(self, *, record_log: bool = False) -> BattleSession:
+        """Rebuild the session as it was when recording started."""
+        rng = StreamRNG() if is_stream_state(self.rng) else random.Random()
+        if isinstance(self.rng, tuple):
+            rng.setstate(self.rng)
+        else:
+            rng.seed(self.rng)
+        session = BattleSession(
+            Party([m.build() for m in self.player], self.player_active),
+            Party([m.build() for m in self.enemy], self.enemy_active),
+            core=BattleCore(rng=rng), is_wild=self.is_wild, record_log=record_log,
+        )
+        return session
+
+    def play(self, *, verify: bool = True, record_log: bool = False) -> BattleSession:
+        """Re-drive every action through a fresh session; check state hashes when ``verify``."""
+        session = self.new_session(record_log=record_log)
+        for i, act in enumerate(self.actions):
+            apply_action(session, act.op, act.args)
+            if verify:
+                h = state_hash(session)
+                if h != act.state_hash:
+                    raise ReplayMismatch(i, act.state_hash, h)
+        return session
+
+    @property
+    def turns(self) -> int:
+        return sum(1 for a in self.actions if a.op == OP_TURN)
+
+    # ---- serialization
+    def to_bytes(self) -> bytes:
+        w = _Writer()
+        w.uint(int(self.is_wild))
+        if is_stream_state(self.rng):
+            w.uint(_RNG_STREAM)
+            w.uint(self.rng[1])
+            w.uint(self.rng[2])
+        elif isinstance(self.rng, tuple):
+            version, internal, gauss = self.rng
+            w.uint(_RNG_STATE)
+            w.uint(version)
+            w.uint(len(internal))
+            for v in internal:
+                w.uint(v)
+            w.uint(gauss is not None)
+            body_gauss = struct.pack("<d", gauss) if gauss is not None else b""
+            w.buf += body_gauss
+        elif isinstance(self.rng, str):
+            w.uint(_RNG_STR_SEED)
+            w.text(self.rng)
+        else:
+            w.uint(_RNG_INT_SEED)
+            w.sint(self.rng)
+        for members, active in ((self.player, self.player_active), (self.enemy, self.enemy_active)):
+            w.uint(active)
+            w.uint(len(members))
+            for m in members:
+                _write_member(w, m)
+        w.uint(len(self.actions))
+        for act in self.actions:
+            w.uint(act.op)
+            if act.op == OP_TURN:
+                w.uint(act.args[0])
+                w.uint(act.args[1])
+            elif act.op == OP_SWITCH:
+                w.uint(act.args[0])
+                w.uint(act.args[1])
+            elif act.op in (OP_ITEM, OP_CAPTURE):
+                w.text(act.args[0])
+            elif act.op == OP_FLEE:
+                w.uint(act.args[0])
+            else:
+                raise ReplayError(f"Unknown action op {act.op}")
+            w.buf += struct.pack("<I", act.state_hash)
+        # String table goes first so the reader can resolve references in one pass
+        head = _Writer()
+        head.uint(len(w.strings))
+        for s in w.strings:
+            raw = s.encode("utf-8")
+            head.uint(len(raw))
+            head.buf += raw
+        return MAGIC + bytes([VERSION]) + bytes(head.buf) + bytes(w.buf)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        if data[:4] != MAGIC:
+            raise ReplayError("Not a battle replay")
+        if len(data) < 5 or data[4] != VERSION:
+            raise ReplayError(f"Unsupported replay version {data[4] if len(data) > 4 else None}")
+        r = _Reader(data, 5)
+        strings = []
+        for _ in range(r.uint()):
+            strings.append(r.raw(r.uint()).decode("utf-8"))
+        r.strings = strings
+        is_wild = bool(r.uint())
+        mode = r.uint()
+        rng: Union[int, str, tuple]
+        if mode == _RNG_STATE:
+            version = r.uint()
+            internal = tuple(r.uint() for _ in range(r.uint()))
+            gauss = struct.unpack("<d", r.raw(8))[0] if r.uint() else None
+            rng = (version, internal, gauss)
+        elif mode == _RNG_STREAM:
+            rng = (STREAM_STATE_TAG, r.uint(), r.uint())
+        elif mode == _RNG_STR_SEED:
+            rng = r.text() or ""
+        elif mode == _RNG_INT_SEED:
+            rng = r.sint()
+        else:
+            raise ReplayError(f"Unknown RNG mode {mode}")
+        sides = []
+        for _ in range(2):
+            active = r.uint()
+            sides.append((active, [_read_member(r) for _ in range(r.uint())]))
+        actions = []
+        for _ in range(r.uint()):
+            op = r.uint()
+            if op in (OP_TURN, OP_SWITCH):
+                args: Tuple[Any, ...] = (r.uint(), r.uint())
+            elif op in (OP_ITEM, OP_CAPTURE):
+                args = (r.text(),)
+            elif op == OP_FLEE:
+                args = (r.uint(),)
+            else:
+                raise ReplayError(f"Unknown action op {op}")
+            actions.append(Action(op, args, struct.unpack("<I", r.raw(4))[0]))
+        (p_active, player), (e_active, enemy) = sides
+        return cls(player=player, enemy=enemy, player_active=p_active, enemy_active=e_active,
+                   is_wild=is_wild, rng=rng, actions=actions)
+
+    def save(self, path) -> None:
+        with open(path, "wb") as fh:
+            fh.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path) -> "Replay":
+        with open(path, "rb") as fh:
+            return cls.from_bytes(fh.read())
+
+def _write_member(w: _Writer, m: MemberState):
+    w.uint(m.species_id)
+    w.uint(m.level)
+    w.text(m.name)
+    for v in m.stats:
+        w.uint(v)
+    w.uint(len(m.moves))
+    for slug, pp in m.moves:
+        w.text(slug)
+        w.uint(pp)
+    w.uint(m.current_hp)
+    w.text(m.status)
+    w.uint(m.sleep_turns)
+    w.uint(m.toxic_stage)
+    w.text(m.ability)
+    w.text(m.item)
+    w.uint(0 if m.badge_count is None else m.badge_count + 1)
+
+def _read_member(r: _Reader) -> MemberState:
+    species_id, level, name = r.uint(), r.uint(), r.text() or ""
+    stats = tuple(r.uint() for _ in range(6))
+    moves = tuple((r.text() or "", r.uint()) for _ in range(r.uint()))
+    current_hp = r.uint()
+    status = r.text() or "none"
+    sleep_turns, toxic_stage = r.uint(), r.uint()
+    ability, item = r.text(), r.text()
+    badges = r.uint()
+    return MemberState(species_id=species_id, level=level, name=name, stats=stats, moves=moves,  # type: ignore[arg-type]
+                       current_hp=current_hp, status=status, sleep_turns=sleep_turns, toxic_stage=toxic_stage,
+                       ability=ability, item=item, badge_count=None if badges == 0 else badges - 1)
+
+def apply_action(session: BattleSession, op: int, args: Tuple[Any, ...]):
+    """Run one recorded action against ``session``."""
+    if op == OP_TURN:
+        session.step(*args)
+    elif op == OP_SWITCH:
+        session.switch("player" if args[0] == 0 else "enemy", args[1])
+    elif op == OP_ITEM:
+        session.use_item(args[0])
+    elif op == OP_CAPTURE:
+        session.attempt_capture(args[0])
+    elif op == OP_FLEE:
+        session.attempt_flee(args[0])
+    else:
+        raise ReplayError(f"Unknown action op {op}")
+
+# ------------------------------------------------------------------ recorder
+
+class ReplayRecorder:
+    """Attach to a session and record every action it performs.
+
+    With ``seed`` the session's RNG is reseeded so the header stays a few
+    bytes; otherwise the full Mersenne Twister state is captured (~3 KB).
+    A :class:`~.rng.StreamRNG` is always stored as its (key, position) state.
+    """
+
+    def __init__(self, session: BattleSession, *, seed: Union[int, str, None] = None):
+        if seed is not None:
+            session.core.rng.seed(seed)
+        rng: Union[int, str, tuple] = seed
+        if seed is None or isinstance(session.core.rng, StreamRNG):
+            rng = session.core.rng.getstate()
+        self.replay = Replay(
+            player=[MemberState.of(b) for b in session.player.members],
+            enemy=[MemberState.of(b) for b in session.enemy.members],
+            player_active=session.player.active_index, enemy_active=session.enemy.active_index,
+            is_wild=session.is_wild, rng=rng,
+        )
+        session.recorder = self
+
+    def record(self, session: BattleSession, op: int, *args):
+        self.replay.actions.append(Action(op, tuple(args), state_hash(session)))
+
+    def to_bytes(self) -> bytes:
+        return self.replay.to_bytes()
+
+    def save(self, path) -> None:
+        self.replay.save(path)
+
+# ----------------------------------------------------------------------- CLI
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Verify a recorded battle replay headlessly")
+    ap.add_argument("path", help="Replay file written by ReplayRecorder.save")
+    ap.add_argument("--no-verify", action="store_true", help="Skip per-action state hash checks")
+    ap.add_argument("--log", action="store_true", help="Print the battle log after replaying")
+    args = ap.parse_args(argv)
+    replay = Replay.load(args.path)
+    try:
+        session = replay.play(verify=not args.no_verify, record_log=args.log)
+    except ReplayMismatch as e:
+        print(e)
+        return 1
+    if args.log:
+        for line in session.log:
+            print(line)
+    print(f"{len(replay.actions)} actions, {replay.turns} turns -> {session.outcome()}")
+    return 0
+
+__all__ = [
+    "Action", "MemberState", "Replay", "ReplayRecorder", "ReplayError", "ReplayMismatch",
+    "apply_action", "state_hash", "main",
+]
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,195 @@
+"""Counter-based, independently seedable random streams.
+
+:class:`RNGService` hands out one :class:`StreamRNG` per battle, encounter
+or AI worker. A stream is Philox4x64-10 keyed by a hash of
+``(service seed, domain, *ids)``: output block ``n`` depends only on the key
+and ``n``, so streams never overlap, any stream can be rebuilt anywhere from
+its path, and results do not depend on how work is split across processes.
+
+:class:`StreamRNG` is a drop-in ``random.Random`` (``random``, ``randint``,
+``uniform``, ``choice``, ``getrandbits``, ``getstate``...). Draws are
+pre-generated in blocks and served from a buffer; blocks come from NumPy's
+``Philox`` bit generator when NumPy is installed (``pip install
+platinum-text[sim]``) and from an equivalent pure-Python Philox otherwise,
+with identical bits either way. Floats carry 53 bits of each 64-bit word and
+integer draws are taken from them (``randint(a, b)`` is
+``a + floor(u * (b - a + 1))``, off from exact uniformity by at most
+``n / 2**53``).
+
+State is ``("philox", key, position)``: two integers, however far the
+stream has run.
+"""
+from __future__ import annotations
+from hashlib import blake2b
+from operator import length_hint
+from typing import Any, List, Optional, Sequence
+import random
+
+STATE_TAG = "philox"
+
+# Philox4x64 round multipliers and Weyl key increments (Salmon et al. 2011)
+_M0, _M1 = 0xD2E7470EE14C6C93, 0xCA5A826395121157
+_W0, _W1 = 0x9E3779B97F4A7C15, 0xBB67AE8584CAA73B
+_MASK = (1 << 64) - 1
+_SCALE = 2.0 ** -53
+
+# Buffer sizes in 64-bit words (multiples of 4): short battles stay cheap, long runs amortize
+_FIRST_BLOCK = 64
+_MAX_BLOCK = 4096
+
+_np: Any = None
+
+def _numpy():
+    global _np
+    if _np is None:
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:
+            _np = False
+    return _np or None
+
+def derive_key(seed: Any, *path: Any) -> int:
+    """128-bit Philox key for the stream at ``path`` under ``seed``."""
+    digest = blake2b(repr((seed, *path)).encode("utf-8"), digest_size=16).digest()
+    return int.from_bytes(digest, "little")
+
+def philox_block(key: int, counter: int) -> List[int]:
+    """Four 64-bit words of Philox4x64-10 for a 128-bit key and 256-bit counter."""
+    c0, c1, c2, c3 = ((counter >> s) & _MASK for s in (0, 64, 128, 192))
+    k0, k1 = key & _MASK, (key >> 64) & _MASK
+    for r in range(10):
+        if r:
+            k0 = (k0 + _W0) & _MASK
+            k1 = (k1 + _W1) & _MASK
+        p0 = _M0 * c0
+        p1 = _M1 * c2
+        c0, c1, c2, c3 = ((p1 >> 64) ^ c1 ^ k0, p1 & _MASK, (p0 >> 64) ^ c3 ^ k1, p0 & _MASK)
+    return [c0, c1, c2, c3]
+
+class StreamRNG(random.Random):
+    """``random.Random`` over a buffered Philox stream; see the module docstring."""
+
+    def __init__(self, x: Any = None):
+        self._key = 0
+        self._base = 0       # stream position of the first word in the buffer
+        self._size = 0
+        self._bitgen = None
+        self._next = iter(()).__next__
+        self._it: Any = iter(())
+        super().__init__(x)
+
+    @classmethod
+    def from_key(cls, key: int, position: int = 0) -> "StreamRNG":
+        rng = cls()
+        rng.setstate((STATE_TAG, key, position))
+        return rng
+
+    # ---- state
+    def seed(self, a: Any = None, version: int = 2) -> None:
+        if a is None:
+            a = random.SystemRandom().getrandbits(128)
+        self._reset(derive_key(a), 0)
+
+    def getstate(self) -> tuple:
+        return (STATE_TAG, self._key, self.position)
+
+    def setstate(self, state: tuple) -> None:
+        if not (isinstance(state, tuple) and len(state) == 3 and state[0] == STATE_TAG):
+            raise ValueError("not a StreamRNG state")
+        self._reset(state[1], state[2])
+
+    @property
+    def key(self) -> int:
+        return self._key
+
+    @property
+    def position(self) -> int:
+        """Number of 64-bit words consumed so far."""
+        return self._base + self._size - length_hint(self._it)
+
+    def _reset(self, key: int, position: int) -> None:
+        self._key = key
+        self._bitgen = None
+        self._size = 0
+        self._base = position - position % 4
+        self._fill(_FIRST_BLOCK)
+        for _ in range(position % 4):
+            self._next()
+
+    def _fill(self, size: int) -> None:
+        # Continues from the end of the current buffer (always a whole number of Philox blocks)
+        start = self._base + self._size
+        np = _numpy()
+        if np is not None:
+            if self._bitgen is None:
+                self._bitgen = np.random.Philox(key=self._key, counter=start // 4)
+            words = self._bitgen.random_raw(size)
+            buf = ((words >> np.uint64(11)).astype(np.float64) * _SCALE).tolist()
+        else:
+            # NumPy's Philox increments the counter before each block: block n uses counter n + 1
+            buf = []
+            for n in range(start // 4, (start + size) // 4):
+                buf.extend((w >> 11) * _SCALE for w in philox_block(self._key, n + 1))
+        self._base = start
+        self._size = size
+        self._it = iter(buf)
+        self._next = self._it.__next__
+
+    def _refill(self) -> None:
+        self._fill(min(_MAX_BLOCK, self._size * 2))
+
+    # ---- draws
+    def random(self) -> float:
+        try:
+            return self._next()
+        except StopIteration:
+            self._refill()
+            return self._next()
+
+    def getrandbits(self, k: int) -> int:
+        if k <= 32:
+            if k < 0:
+                raise ValueError("number of bits must be non-negative")
+            return int(self.random() * (1 << k))
+        out = 0
+        for shift in range(0, k, 32):
+            out |= int(self.random() * 4294967296.0) << shift
+        return out & ((1 << k) - 1)
+
+    def randint(self, a: int, b: int) -> int:
+        if b < a:
+            raise ValueError(f"empty range for randint({a}, {b})")
+        return a + int(self.random() * (b - a + 1))
+
+    def choice(self, seq: Sequence) -> Any:
+        if not seq:
+            raise IndexError("Cannot choose from an empty sequence")
+        return seq[int(self.random() * len(seq))]
+
+class RNGService:
+    """Factory of independent :class:`StreamRNG` streams under one seed.
+
+    ``service.stream(domain, *ids)`` is a pure function of ``(seed, domain,
+    *ids)``; the helpers name the domains the engine uses.
+    """
+
+    def __init__(self, seed: Any = 0):
+        self.seed = seed
+
+    def stream(self, domain: str, *ids: Any) -> StreamRNG:
+        return StreamRNG.from_key(derive_key(self.seed, domain, *ids))
+
+    def battle(self, index: int) -> StreamRNG:
+        return self.stream("battle", index)
+
+    def encounter(self, index: int) -> StreamRNG:
+        return self.stream("encounter", index)
+
+    def worker(self, decision: int, tree: int) -> StreamRNG:
+        return self.stream("ai", decision, tree)
+
+def is_stream_state(state: Optional[tuple]) -> bool:
+    return isinstance(state, tuple) and len(state) == 3 and state[0] == STATE_TAG
+
+__all__ = ["RNGService", "STATE_TAG", "StreamRNG", "derive_key", "is_stream_state", "philox_block"]
@@ -0,0 +1,159 @@
+"""Live battlers for the player's party.
+
+Battles used to rebuild every player Battler from ``state.party`` (species
+lookup, stats, one Move per move JSON) and copy HP, status and PP back
+afterwards. :class:`PartyRuntime` keeps one Battler per
+:class:`~platinum.system.save.PartyMember` for the session instead:
+
+* :meth:`PartyRuntime.battlers` hands out the live battlers. A member is
+  rebuilt (through the prefab cache) only when its species, level or
+  moves changed; HP, status or PP edited on the save model since the last
+  sync (healing, items) are pulled into the battler. Per-battle volatile
+  state (stages, confusion, charge turns...) is cleared.
+* :meth:`PartyRuntime.sync` writes HP, status and PP back for battlers
+  that differ from what the save model last saw (the dirty ones). The game
+  context syncs before every save and once after each battle, since the
+  post-battle EXP, level-up and evolution code edits the save model.
+
+Only what the battle changed is written back. If the save model changed
+too in the meantime (EXP and evolution run while the battle screen is
+up), the battle's HP change is applied on top of the member's HP.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+from .core import Battler, Stages
+from .prefab import prefab_battler
+from platinum.system.save import PartyMember
+
+MemberState = Tuple[int, str, Tuple[Optional[int], ...]]
+
+@dataclass(slots=True)
+class _Live:
+    member: PartyMember
+    battler: Battler
+    key: tuple                # (species id, level, moves) the battler was built from
+    names: Tuple[str, ...]    # PP keys of the battler's moves
+    seen: MemberState = (0, "none", ())   # member HP/status/PP as of the last pull or push
+    base: MemberState = (0, "none", ())   # battler HP/status/PP as of the last pull or push
+
+def _species_id(member: PartyMember) -> int:
+    from platinum.data.species_lookup import species_id
+    return species_id(member.species) if isinstance(member.species, str) else int(member.species)
+
+def _member_state(member: PartyMember, moves: Sequence[str]) -> MemberState:
+    pp = member.move_pp or {}
+    return (int(member.hp), member.status or "none", tuple(pp.get(m) for m in moves))
+
+def _key(member: PartyMember) -> tuple:
+    return (_species_id(member), int(member.level), tuple(member.moves[:4]))
+
+def _battler_state(b: Battler) -> MemberState:
+    return (int(b.current_hp or 0), b.status, tuple(m.pp for m in b.moves))
+
+def _reset_volatile(b: Battler) -> None:
+    b.stages = Stages()
+    b.sleep_turns = b.toxic_stage = 0
+    b.confusion_turns = 0
+    b.flinched = False
+    b.charging_move = None
+    b.charging_turns_left = 0
+    b.semi_invulnerable = b.must_recharge = b.aqua_ring = b.ability_suppressed = False
+    b.tailwind = b.trick_room_active = False
+    b.choice_lock = None
+    b.timers = {}
+    b.timer_heap = []
+
+class PartyRuntime:
+    def __init__(self):
+        self._live: Dict[int, _Live] = {}   # id(member) -> entry
+
+    def battlers(self, party: Sequence[PartyMember]) -> List[Battler]:
+        """Live battlers for ``party`` in order; members with an unknown species are skipped."""
+        live: Dict[int, _Live] = {}
+        out: List[Battler] = []
+        for pm in party:
+            entry = self._live.get(id(pm))
+            if entry is not None and entry.member is not pm:
+                entry = None
+            try:
+                key = _key(pm)
+            except Exception:
+                continue
+            if entry is None or entry.key != key:
+                entry = self._build(pm, key)
+            else:
+                if _member_state(pm, entry.names) != entry.seen:
+                    self._pull(entry)
+                _reset_volatile(entry.battler)
+            live[id(pm)] = entry
+            out.append(entry.battler)
+        self._live = live
+        return out
+
+    def _build(self, pm: PartyMember, key: tuple) -> _Live:
+        sid, level, moves = key
+        name = str(pm.species).capitalize()
+        try:
+            b = prefab_battler(sid, level, nickname=name, moves=list(moves) or None)
+        except KeyError:
+            # Unknown move name on the save model: fight with the learnset moves instead
+            if not moves:
+                raise
+            b, moves = prefab_battler(sid, level, nickname=name), ()
+        entry = _Live(pm, b, key, moves or tuple(m.slug for m in b.moves))
+        self._pull(entry)
+        return entry
+
+    @staticmethod
+    def _pull(entry: _Live) -> None:
+        b = entry.battler
+        entry.seen = hp, status, pps = _member_state(entry.member, entry.names)
+        b.current_hp = max(0, min(hp, b.stats.hp))
+        b.status = status
+        for m, pp in zip(b.moves, pps):
+            m.pp = m.max_pp if pp is None else pp
+        entry.base = _battler_state(b)
+
+    def dirty(self) -> List[PartyMember]:
+        """Members whose battler changed since the last sync."""
+        return [e.member for e in self._live.values() if _battler_state(e.battler) != e.base]
+
+    def sync(self) -> int:
+        """Write dirty battlers back to their members; returns how many were written."""
+        n = 0
+        for e in self._live.values():
+            b = e.battler
+            state = _battler_state(b)
+            if state == e.base:
+                continue
+            pm = e.member
+            hp, status, pps = state
+            try:
+                rebuilt = _key(pm) != e.key
+            except Exception:
+                rebuilt = True
+            if not rebuilt:
+                pm.max_hp = int(b.stats.hp)
+            if _member_state(pm, e.names) == e.seen:
+                pm.hp = hp
+            else:
+                pm.hp = max(0, min(int(pm.max_hp), int(pm.hp) + hp - e.base[0]))
+            if status != e.base[1]:
+                pm.status = status
+            move_pp = dict(pm.move_pp or {})
+            for name, pp, old in zip(e.names, pps, e.base[2]):
+                if pp != old:
+                    move_pp[name] = pp
+            pm.move_pp = move_pp
+            self._pull(e)
+            n += 1
+        return n
+
+    def clear(self) -> None:
+        self._live.clear()
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+__all__ = ["PartyRuntime"]
@@ -8,9 +8,11 @@ from typing import Protocol, Literal, TypedDict, Dict, Any, Optional
 from platinum.core.logging import logger
 from platinum.system.settings import Settings
 from .core import BattleCore, Battler, Move, FieldState
+from .events import TextSink
 from platinum.data.loader import get_species
-from .factory import battler_from_species
+from .prefab import prefab_battler
 from .experience import clamp_level
+from .ai import ExpectimaxAI
 
 class BattleResult(TypedDict):
     outcome: Literal["PLAYER_WIN","PLAYER_LOSS","ESCAPE","SCRIPTED"]
@@ -55,8 +57,8 @@ class BattleService:
             return {"outcome": "PLAYER_WIN", "battle_id": battle_id}
         p_spec = demo["player"]
         e_spec = demo["enemy"]
-        p = p_spec if isinstance(p_spec, Battler) else battler_from_species(p_spec["species"], p_spec["level"])
-        e = e_spec if isinstance(e_spec, Battler) else battler_from_species(e_spec["species"], e_spec["level"], nickname="Wild " + get_species(e_spec["species"]) ["name"].capitalize())
+        p = p_spec if isinstance(p_spec, Battler) else prefab_battler(p_spec["species"], p_spec["level"])
+        e = e_spec if isinstance(e_spec, Battler) else prefab_battler(e_spec["species"], e_spec["level"], nickname="Wild " + get_species(e_spec["species"]) ["name"].capitalize())
         pm = demo.get("player_move") or (p.moves[0] if p.moves else Move(name="Struggle", type="normal", category="physical", power=50))  # type: ignore
         em = demo.get("enemy_move") or (e.moves[0] if e.moves else Move(name="Struggle", type="normal", category="physical", power=50))  # type: ignore
         return self._loop(p, e, pm, em, battle_id)
@@ -67,31 +69,32 @@ class BattleService:
         Returns BattleResult; outcome PLAYER_WIN if enemy faints else PLAYER_LOSS.
         """
         enemy_level = clamp_level(enemy_level)
-        e = battler_from_species(enemy_species, enemy_level, nickname="Wild " + get_species(enemy_species)["name"].capitalize())
-        # Pick first available move each turn (very naive AI)
+        e = prefab_battler(enemy_species, enemy_level, nickname="Wild " + get_species(enemy_species)["name"].capitalize())
+        # Player auto-uses its first move; the enemy searches for its move each turn
         pm = player.moves[0] if player.moves else Move(name="Struggle", type="normal", category="physical", power=50)
         em = e.moves[0] if e.moves else Move(name="Struggle", type="normal", category="physical", power=50)
         bid = battle_id or f"wild_{enemy_species}_{enemy_level}"
         if getattr(Settings.load().data, 'debug', False):
             logger.info("BattleStartDynamic", battle_id=bid, enemy=enemy_species, level=enemy_level)
-        return self._loop(player, e, pm, em, bid)
+        return self._loop(player, e, pm, em, bid, ai=ExpectimaxAI.for_trainer(None))
 
-    def _loop(self, p: Battler, e: Battler, pm: Move, em: Move, battle_id: str) -> BattleResult:
+    def _loop(self, p: Battler, e: Battler, pm: Move, em: Move, battle_id: str, ai: Optional[ExpectimaxAI] = None) -> BattleResult:
         field = FieldState()
         turn = 1
         debug = getattr(Settings.load().data, 'debug', False)
         def _msg(s: str):
-            if debug:
-                print(f"[turn {turn}] {s}")
-        # Attach temporary message callback
-        saved_cb = self.core.message_cb
-        self.core.message_cb = _msg
+            print(f"[turn {turn}] {s}")
+        # Attach temporary message sink (none at all outside debug mode); message_cb is left alone
+        saved_sink = self.core.sink
+        self.core.sink = TextSink(_msg) if debug else None
         try:
             while (p.current_hp and p.current_hp > 0 and e.current_hp and e.current_hp > 0):
+                if ai is not None and e.moves:
+                    em = e.moves[ai.choose_move(e, p, field)]
                 self.core.single_turn(p, pm, e, em, field)
                 turn += 1
         finally:
-            self.core.message_cb = saved_cb
+            self.core.sink = saved_sink
         outcome = "PLAYER_WIN" if (p.current_hp and p.current_hp > 0) else "PLAYER_LOSS"
         return {"outcome": outcome, "battle_id": battle_id}
 
@@ -4,9 +4,13 @@ Incremental scaffold atop BattleCore mechanics.
 """
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Union
+import hashlib
+import os
 import random
-from .core import BattleCore, Battler, Move, FieldState
+from .core import BattleCore, Battler, Move, FieldState, MOVE_SLOTS
+from .events import tee
+from .log import BattleLog, DEFAULT_CAPACITY
 from .capture import attempt_capture, flee_success
 from platinum.data.loader import get_species
 from platinum.encounters.loader import roll_encounter, EncounterMethod
@@ -31,29 +35,162 @@ class Party:
                 return m
         return None
 
+# Action kinds reported to a session recorder, in replay opcode order
+OP_TURN, OP_SWITCH, OP_ITEM, OP_CAPTURE, OP_FLEE = range(5)
+
+# Bag items usable from the battle menu: flat heals and status cures
+_HEAL_ITEMS = {"potion": 20, "super-potion": 50}
+_CURE_ITEMS = {
+    "antidote": {"psn", "tox"},
+    "paralyze-heal": {"par"},
+    "burn-heal": {"brn"},
+    "ice-heal": {"frz"},
+    "awakening": {"slp"},
+}
+
+def choose_move(b: Battler, idx: int) -> Move:
+    """Move ``b`` uses from menu slot ``idx`` (Struggle when out of PP; honours a Choice lock)."""
+    if not b.moves:
+        return Move(name="Struggle", type="normal", category="physical", power=50, recoil_ratio=(1,4))
+    if all((m.max_pp > 0 and m.pp <= 0) for m in b.moves):
+        return Move(name="Struggle", type="normal", category="physical", power=50, recoil_ratio=(1,4))
+    # Clamp index and skip to first move with PP if selected depleted
+    if idx >= len(b.moves):
+        idx = 0
+    chosen = b.moves[idx]
+    # A Choice item holds the battler to its first move while it has PP
+    lock = b.choice_lock
+    if lock is not None and lock is not chosen and any(m is lock for m in b.moves) and (lock.max_pp == 0 or lock.pp > 0):
+        return lock
+    if chosen.max_pp > 0 and chosen.pp <= 0:
+        for m in b.moves:
+            if m.max_pp > 0 and m.pp > 0:
+                return m
+        return Move(name="Struggle", type="normal", category="physical", power=50, recoil_ratio=(1,4))
+    return chosen
+
 class BattleSession:
-    def __init__(self, player: Party, enemy: Party, core: Optional[BattleCore] = None, *, is_wild: bool = True):
+    def __init__(self, player: Party, enemy: Party, core: Optional[BattleCore] = None, *, is_wild: bool = True,
+                 record_log: bool = True, send_out: bool = True, log_capacity: int = DEFAULT_CAPACITY,
+                 log_export: Optional[Union[str, os.PathLike]] = None):
+        """``send_out=False`` resumes a battle in progress (no switch-in abilities for the actives).
+
+        ``self.log`` is a :class:`~platinum.battle.log.BattleLog` keeping the
+        last ``log_capacity`` entries; ``log_export`` also streams every entry
+        to a gzip JSONL file (call :meth:`close_log` when done).
+        """
         self.player = player
         self.enemy = enemy
         self.core = core or BattleCore()
         self.field = FieldState()
         self.turn_counter = 0
-        self.log: List[str] = []
+        self.log = BattleLog(log_capacity, side_of=self._side_of)
         self.is_wild = is_wild
         # Track which party members participated (entered battle) for EXP share
         self.player_participants = {self.player.active_index}
         self.enemy_participants = {self.enemy.active_index}
+        # Optional replay recorder (see platinum.battle.replay); notified after each action
+        self.recorder = None
+
+        # Headless callers (simulations) skip the log; a sink installed on the passed core keeps its events
+        own = self.core.caller_sink
+        if record_log:
+            self.core.sink = tee(own, self.log)
+            if log_export is not None:
+                self.log.export(log_export)
+        else:
+            self.core.sink = own
+
+        for b in self.player.members + self.enemy.members:
+            b.attach_hooks()
+        if send_out:
+            self._send_out(self.player, self.enemy)
+            self._send_out(self.enemy, self.player)
+
+    def _send_out(self, party: Party, foe: Party):
+        self.core.switch_in(party.active(), foe.active(), self.field)
+
+    def _side_of(self, battler: Battler) -> Optional[str]:
+        if any(m is battler for m in self.player.members):
+            return "player"
+        if any(m is battler for m in self.enemy.members):
+            return "enemy"
+        return None
+
+    def close_log(self) -> None:
+        """Finish the log export file, if one was requested."""
+        self.log.close()
 
-        def _capture(msg: str):
-            self.log.append(msg)
-        self.core.message_cb = _capture
+    def replace_fainted(self):
+        """Send in the next healthy member for each side whose active battler fainted."""
+        if self.player.auto_switch_if_fainted() is not None:
+            self._send_out(self.player, self.enemy)
+        if self.enemy.auto_switch_if_fainted() is not None:
+            self._send_out(self.enemy, self.player)
 
     def is_over(self) -> bool:
         return (not self.player.has_available()) or (not self.enemy.has_available())
 
+    def snapshot(self, *, include_rng: bool = True) -> tuple:
+        """Compact copy of the mutable battle state, for search and rewind.
+
+        A flat tuple of scalars per battler/field (see ``Battler.snapshot``);
+        species data and Move objects are shared, so this costs one small
+        tuple per battler rather than a deep copy of the parties.
+        """
+        return (
+            self.turn_counter, self.player.active_index, self.enemy.active_index,
+            frozenset(self.player_participants), frozenset(self.enemy_participants), self.log.mark(),
+            self.field.snapshot(),
+            tuple([b.snapshot() for b in self.player.members]),
+            tuple([b.snapshot() for b in self.enemy.members]),
+            self.core.rng.getstate() if include_rng else None,
+        )
+
+    def restore(self, snap: tuple) -> None:
+        """Rewind to ``snap`` (taken from this session); log lines written since are dropped."""
+        (self.turn_counter, self.player.active_index, self.enemy.active_index,
+         p_part, e_part, log_mark, field_snap, p_snaps, e_snaps, rng_state) = snap
+        self.player_participants = set(p_part)
+        self.enemy_participants = set(e_part)
+        self.log.truncate(log_mark)
+        self.field.restore(field_snap)
+        for b, bs in zip(self.player.members, p_snaps):
+            b.restore(bs)
+        for b, bs in zip(self.enemy.members, e_snaps):
+            b.restore(bs)
+        if rng_state is not None:
+            self.core.rng.setstate(rng_state)
+
+    def state_hash(self) -> int:
+        """Stable 32-bit hash of everything a turn can change, including the RNG position.
+
+        Independent of object identity and process, so it can be stored in
+        replays and compared across runs.
+        """
+        def battler(b: Battler) -> tuple:
+            snap = list(b.snapshot())
+            for i in MOVE_SLOTS:
+                if snap[i] is not None:
+                    snap[i] = snap[i].name
+            return (b.species_id, b.level, *snap)
+        state = (
+            self.turn_counter, self.player.active_index, self.enemy.active_index, self.field.snapshot(),
+            tuple(battler(b) for b in self.player.members), tuple(battler(b) for b in self.enemy.members),
+            self.core.rng.getstate(),
+        )
+        return int.from_bytes(hashlib.blake2b(repr(state).encode(), digest_size=4).digest(), "little")
+
+    def _record(self, op: int, *args):
+        if self.recorder is not None:
+            self.recorder.record(self, op, *args)
+
     def step(self, player_move_idx: int = 0, enemy_move_idx: int = 0):
-        self.player.auto_switch_if_fainted()
-        self.enemy.auto_switch_if_fainted()
+        self._step(player_move_idx, enemy_move_idx)
+        self._record(OP_TURN, player_move_idx, enemy_move_idx)
+
+    def _step(self, player_move_idx: int, enemy_move_idx: int):
+        self.replace_fainted()
         # Mark current actives as participants each step
         try:
             self.player_participants.add(self.player.active_index)
@@ -67,24 +204,9 @@ class BattleSession:
             return
         p_act = self.player.active()
         e_act = self.enemy.active()
-        # Determine if Struggle is required (no usable PP on any move)
-        def choose_move(b: Battler, idx: int) -> Move:
-            if not b.moves:
-                return Move(name="Struggle", type="normal", category="physical", power=50, recoil_ratio=(1,4))
-            if all((m.max_pp > 0 and m.pp <= 0) for m in b.moves):
-                return Move(name="Struggle", type="normal", category="physical", power=50, recoil_ratio=(1,4))
-            # Clamp index and skip to first move with PP if selected depleted
-            if idx >= len(b.moves):
-                idx = 0
-            chosen = b.moves[idx]
-            if chosen.max_pp > 0 and chosen.pp <= 0:
-                for m in b.moves:
-                    if m.max_pp > 0 and m.pp > 0:
-                        return m
-                return Move(name="Struggle", type="normal", category="physical", power=50, recoil_ratio=(1,4))
-            return chosen
         p_move = choose_move(p_act, player_move_idx)
         e_move = choose_move(e_act, enemy_move_idx)
+        self.log.turn = self.turn_counter + 1
         self.core.single_turn(p_act, p_move, e_act, e_move, self.field)
         self.turn_counter += 1
 
@@ -102,8 +224,38 @@ class BattleSession:
             return "STALEMATE"
         return "ONGOING"
 
+    def switch(self, side: str, index: int) -> Battler:
+        """Send out ``members[index]`` for ``side`` ('player' or 'enemy')."""
+        party = self.player if side == "player" else self.enemy
+        party.active_index = int(index)
+        (self.player_participants if side == "player" else self.enemy_participants).add(party.active_index)
+        self._send_out(party, self.enemy if side == "player" else self.player)
+        self._record(OP_SWITCH, 0 if side == "player" else 1, party.active_index)
+        return party.active()
+
+    def use_item(self, item: str) -> bool:
+        """Use a bag item on the player's active battler. Returns False if it has no effect."""
+        target = self.player.active()
+        used = False
+        if item in _HEAL_ITEMS:
+            missing = target.stats['hp'] - (target.current_hp or 0)
+            if missing > 0:
+                self.core.apply_heal(target, min(_HEAL_ITEMS[item], missing), cause='item', meta={'item': item})
+                used = True
+        elif item in _CURE_ITEMS and target.status in _CURE_ITEMS[item]:
+            self.core._cure_status(target, announce=False)
+            used = True
+        if used:
+            self._record(OP_ITEM, item)
+        return used
+
     # ---------------- Capturing & Fleeing (wild only assumptions) -----------------
     def attempt_capture(self, ball: str = 'poke-ball') -> str:
+        result = self._attempt_capture(ball)
+        self._record(OP_CAPTURE, ball)
+        return result
+
+    def _attempt_capture(self, ball: str) -> str:
         if not self.is_wild:
             return 'NOT_ALLOWED'
         enemy_active = self.enemy.active()
@@ -137,7 +289,9 @@ class BattleSession:
     def attempt_flee(self, attempts: int = 1) -> bool:
         p = self.player.active()
         e = self.enemy.active()
-        return flee_success(self.core.rng, p.stats['speed'], e.stats['speed'], attempts)
+        fled = flee_success(self.core.rng, p.stats['speed'], e.stats['speed'], attempts)
+        self._record(OP_FLEE, attempts)
+        return fled
 
     @classmethod
     def from_wild_encounter(cls, player_party: Party, zone: str, method: EncounterMethod, level: int | None = None, rng: Optional[random.Random] = None) -> 'BattleSession':
@@ -156,9 +310,9 @@ class BattleSession:
             if not res:
                 raise ValueError(f"No encounter available for zone={zone} method={method}")
             species_id, _ = res
-        from .factory import battler_from_species
-        wild = battler_from_species(species_id, level)
+        from .prefab import prefab_battler
+        wild = prefab_battler(species_id, level)
         enemy_party = Party([wild])
         return cls(player_party, enemy_party, is_wild=True)
 
-__all__ = ["BattleSession","Party"]
+__all__ = ["BattleSession","Party","choose_move"]
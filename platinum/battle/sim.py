@@ -0,0 +1,285 @@
+"""Headless Monte Carlo battle simulator.
+
+Plays many seeded 1v1 party battles between two party specs and aggregates
+win rate, turn distribution and per-move usage (with 95% confidence
+intervals). Battles are fanned out across a ``ProcessPoolExecutor``; every
+battle draws from its own counter-based stream (:mod:`platinum.battle.rng`)
+keyed by ``(seed, battle index)`` only, so results are identical regardless
+of worker count.
+
+CLI:
+  python -m platinum.battle.sim --player turtwig:12:tackle,withdraw \
+      --enemy trainer:gym_leader_roark -n 2000 --workers 4 --seed 1
+"""
+from __future__ import annotations
+import argparse
+import json
+import math
+import os
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Optional, Sequence, Tuple, Iterable
+
+from platinum.core.paths import ASSETS
+from .core import BattleCore, Battler
+from .session import BattleSession, Party
+from .prefab import prefab_battler
+from .rng import RNGService
+
+_Z95 = 1.959963984540054
+STRUGGLE = "Struggle"
+
+# ---------------------------------------------------------------------------
+# Party specs
+# ---------------------------------------------------------------------------
+@dataclass(frozen=True)
+class MemberSpec:
+    species: int
+    level: int
+    moves: Optional[Tuple[str, ...]] = None  # None => default level-up moves
+
+    def build(self) -> Battler:
+        return prefab_battler(self.species, self.level, moves=self.moves or None)
+
+def _resolve_species(identifier: int | str) -> int:
+    from platinum.data.species_lookup import species_id
+    return species_id(identifier)
+
+def parse_member(text: str) -> MemberSpec:
+    """Parse ``species:level[:move,move,...]`` (species by dex id or name)."""
+    parts = [p.strip() for p in text.split(":")]
+    if len(parts) < 2 or not parts[1].isdigit():
+        raise ValueError(f"Bad member spec '{text}' (expected species:level[:moves])")
+    moves = tuple(m.strip() for m in parts[2].split(",") if m.strip()) if len(parts) > 2 else ()
+    return MemberSpec(_resolve_species(parts[0]), int(parts[1]), moves or None)
+
+def _flag_ok(entry: dict, flags: Iterable[str]) -> bool:
+    req = entry.get("requires_flag")
+    return not req or req in set(flags)
+
+def _available(spec: MemberSpec) -> bool:
+    # Trainer data may reference species outside the bundled dex; the battle UI skips those too
+    from platinum.data.loader import get_species, SpeciesNotFound
+    try:
+        get_species(spec.species)
+        return True
+    except SpeciesNotFound:
+        return False
+
+def trainer_party(trainer_id: str, flags: Iterable[str] = ()) -> List[MemberSpec]:
+    """Party specs for ``assets/trainers/<trainer_id>.json`` (members gated by ``flags``)."""
+    path = ASSETS / "trainers" / f"{trainer_id}.json"
+    if not path.exists():
+        raise KeyError(f"Trainer not found: {trainer_id}")
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    flags = tuple(flags)
+    specs = [MemberSpec(int(p["species_id"]), int(p["level"]), tuple(p.get("moves") or ()) or None)
+             for p in raw.get("party", []) if _flag_ok(p, flags)]
+    return [s for s in specs if _available(s)]
+
+def config_party(config_id: str, flags: Iterable[str] = ()) -> List[MemberSpec]:
+    """Party specs for the ``assets/battle_configs`` entry whose ``id`` matches."""
+    flags = tuple(flags)
+    for fp in (ASSETS / "battle_configs").rglob("*.json"):
+        try:
+            raw = json.loads(fp.read_text(encoding="utf-8"))
+        except Exception:
+            continue
+        if str(raw.get("id")) != str(config_id):
+            continue
+        return [MemberSpec(_resolve_species(p["species"]), int(p.get("level", 5)), tuple(p.get("moves") or ()) or None)
+                for p in raw.get("party", []) if _flag_ok(p, flags)]
+    raise KeyError(f"Battle config not found: {config_id}")
+
+def parse_party(items: Sequence[str], flags: Iterable[str] = ()) -> List[MemberSpec]:
+    """Party from CLI items: ``trainer:<id>``, ``config:<id>`` or member specs."""
+    specs: List[MemberSpec] = []
+    for item in items:
+        if item.startswith("trainer:"):
+            specs.extend(trainer_party(item.split(":", 1)[1], flags))
+        elif item.startswith("config:"):
+            specs.extend(config_party(item.split(":", 1)[1], flags))
+        else:
+            specs.append(parse_member(item))
+    if not specs:
+        raise ValueError("Party spec resolved to no members")
+    return specs
+
+# ---------------------------------------------------------------------------
+# Single battle
+# ---------------------------------------------------------------------------
+@dataclass
+class BattleRecord:
+    outcome: str
+    turns: int
+    player_moves: Dict[str, int] = field(default_factory=dict)
+    enemy_moves: Dict[str, int] = field(default_factory=dict)
+
+def battle_rng(seed: int, index: int) -> random.Random:
+    """Independent stream for battle ``index``; depends only on (seed, index)."""
+    return RNGService(f"sim:{seed}").battle(index)
+
+def _pick_move(b: Battler, rng: random.Random) -> Tuple[int, str]:
+    # Same policy as the UI's wild/trainer AI: uniformly random usable move
+    usable = [i for i, m in enumerate(b.moves) if m.max_pp == 0 or m.pp > 0]
+    if not usable:
+        return 0, STRUGGLE
+    idx = rng.choice(usable)
+    return idx, b.moves[idx].name
+
+def play_battle(player: Sequence[MemberSpec], enemy: Sequence[MemberSpec], seed: int, index: int,
+                max_turns: int = 200) -> BattleRecord:
+    rng = battle_rng(seed, index)
+    session = BattleSession(Party([m.build() for m in player]), Party([m.build() for m in enemy]),
+                            core=BattleCore(rng=rng), is_wild=False, record_log=False)
+    p_used: Counter[str] = Counter()
+    e_used: Counter[str] = Counter()
+    while not session.is_over() and session.turn_counter < max_turns:
+        session.replace_fainted()
+        p_idx, p_name = _pick_move(session.player.active(), rng)
+        e_idx, e_name = _pick_move(session.enemy.active(), rng)
+        p_used[p_name] += 1
+        e_used[e_name] += 1
+        session.step(p_idx, e_idx)
+    outcome = session.outcome()
+    if outcome == "ONGOING":
+        outcome = "STALEMATE"
+    return BattleRecord(outcome, session.turn_counter, dict(p_used), dict(e_used))
+
+def _run_chunk(args: Tuple[Tuple[MemberSpec, ...], Tuple[MemberSpec, ...], int, int, int, int]) -> List[BattleRecord]:
+    player, enemy, seed, start, stop, max_turns = args
+    return [play_battle(player, enemy, seed, i, max_turns) for i in range(start, stop)]
+
+# ---------------------------------------------------------------------------
+# Aggregation
+# ---------------------------------------------------------------------------
+def wilson_interval(k: int, n: int, z: float = _Z95) -> Tuple[float, float]:
+    """Wilson score interval for a binomial proportion."""
+    if n <= 0:
+        return (0.0, 0.0)
+    p = k / n
+    denom = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    half = (z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n))) / denom
+    return (max(0.0, centre - half), min(1.0, centre + half))
+
+@dataclass
+class MoveUsage:
+    uses: int
+    share: float
+    ci: Tuple[float, float]
+
+@dataclass
+class SimReport:
+    battles: int
+    wins: int
+    losses: int
+    stalemates: int
+    win_rate: float
+    win_ci: Tuple[float, float]
+    turns_mean: float
+    turns_stdev: float
+    turns_ci: Tuple[float, float]
+    turns_p50: int
+    turns_p90: int
+    turn_histogram: Dict[int, int]
+    player_moves: Dict[str, MoveUsage]
+    enemy_moves: Dict[str, MoveUsage]
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    def format(self) -> str:
+        lo, hi = self.win_ci
+        tlo, thi = self.turns_ci
+        lines = [
+            f"Battles: {self.battles}  W/L/S: {self.wins}/{self.losses}/{self.stalemates}",
+            f"Win rate: {self.win_rate:.1%}  (95% CI {lo:.1%} - {hi:.1%})",
+            f"Turns: mean {self.turns_mean:.2f} +/- {self.turns_stdev:.2f}  (95% CI {tlo:.2f} - {thi:.2f})  p50 {self.turns_p50}  p90 {self.turns_p90}",
+        ]
+        for label, usage in (("Player", self.player_moves), ("Enemy", self.enemy_moves)):
+            lines.append(f"{label} move usage:")
+            for name, u in sorted(usage.items(), key=lambda kv: -kv[1].uses):
+                lines.append(f"  {name:<16} {u.uses:>7}  {u.share:6.1%}  ({u.ci[0]:.1%} - {u.ci[1]:.1%})")
+        return "\n".join(lines)
+
+def _percentile(sorted_vals: List[int], q: float) -> int:
+    if not sorted_vals:
+        return 0
+    return sorted_vals[min(len(sorted_vals) - 1, int(q * len(sorted_vals)))]
+
+def _usage(counter: Counter[str]) -> Dict[str, MoveUsage]:
+    total = sum(counter.values())
+    return {name: MoveUsage(k, k / total if total else 0.0, wilson_interval(k, total)) for name, k in counter.items()}
+
+def aggregate(records: Sequence[BattleRecord]) -> SimReport:
+    n = len(records)
+    outcomes = Counter(r.outcome for r in records)
+    wins = outcomes.get("PLAYER_WIN", 0)
+    turns = sorted(r.turns for r in records)
+    mean = sum(turns) / n if n else 0.0
+    var = sum((t - mean) ** 2 for t in turns) / (n - 1) if n > 1 else 0.0
+    sd = math.sqrt(var)
+    half = _Z95 * sd / math.sqrt(n) if n else 0.0
+    p_used: Counter[str] = Counter()
+    e_used: Counter[str] = Counter()
+    for r in records:
+        p_used.update(r.player_moves)
+        e_used.update(r.enemy_moves)
+    return SimReport(
+        battles=n, wins=wins, losses=outcomes.get("PLAYER_LOSS", 0), stalemates=outcomes.get("STALEMATE", 0),
+        win_rate=wins / n if n else 0.0, win_ci=wilson_interval(wins, n),
+        turns_mean=mean, turns_stdev=sd, turns_ci=(mean - half, mean + half),
+        turns_p50=_percentile(turns, 0.5), turns_p90=_percentile(turns, 0.9),
+        turn_histogram=dict(sorted(Counter(turns).items())),
+        player_moves=_usage(p_used), enemy_moves=_usage(e_used),
+    )
+
+def simulate(player: Sequence[MemberSpec], enemy: Sequence[MemberSpec], n: int = 1000, *, seed: int = 0,
+             workers: Optional[int] = None, max_turns: int = 200, chunk_size: Optional[int] = None) -> SimReport:
+    """Run ``n`` seeded battles and aggregate them.
+
+    ``workers`` <= 1 runs in-process; otherwise battles are split into chunks
+    across a process pool. Output is independent of ``workers``/``chunk_size``.
+    """
+    player_t, enemy_t = tuple(player), tuple(enemy)
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if workers <= 1 or n < 2:
+        return aggregate(_run_chunk((player_t, enemy_t, seed, 0, n, max_turns)))
+    chunk = chunk_size or max(1, math.ceil(n / (workers * 4)))
+    jobs = [(player_t, enemy_t, seed, start, min(n, start + chunk), max_turns) for start in range(0, n, chunk)]
+    records: List[BattleRecord] = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for part in pool.map(_run_chunk, jobs):
+            records.extend(part)
+    return aggregate(records)
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m platinum.battle.sim", description="Monte Carlo battle simulator")
+    ap.add_argument("--player", action="append", required=True,
+                    help="species:level[:move,move] | trainer:<id> | config:<id> (repeatable)")
+    ap.add_argument("--enemy", action="append", required=True, help="same forms as --player (repeatable)")
+    ap.add_argument("--flag", action="append", default=[], help="story flag enabling requires_flag members")
+    ap.add_argument("-n", "--battles", type=int, default=1000)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--max-turns", type=int, default=200)
+    ap.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = ap.parse_args(argv)
+    report = simulate(parse_party(args.player, args.flag), parse_party(args.enemy, args.flag), args.battles,
+                      seed=args.seed, workers=args.workers, max_turns=args.max_turns)
+    print(json.dumps(report.to_dict(), indent=2) if args.json else report.format())
+    return 0
+
+__all__ = [
+    "MemberSpec", "BattleRecord", "MoveUsage", "SimReport", "parse_member", "parse_party",
+    "trainer_party", "config_party", "battle_rng", "play_battle", "aggregate", "simulate", "wilson_interval",
+]
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,144 @@
+"""Turn-limited effects on a single expiry heap per owner.
+
+A timed effect belongs to the field (weather, screens, Trick Room) or to one
+battler (Taunt, Tailwind, Safeguard, Magnet Rise). Starting one records the
+turn it ends on in ``owner.timers`` and pushes ``(ends, order, name)`` onto
+``owner.timer_heap``; ``BattleCore.end_of_turn`` advances ``field.turn`` and
+calls :func:`expire`, which pops only the entries that are due. Inactive
+effects cost nothing per turn, and re-starting an effect just records the new
+end turn: the stale heap entry is skipped when it surfaces.
+
+Effects are declared with :func:`register_timed`:
+
+* ``flag`` names a boolean attribute on the owner that is True while the
+  effect runs (``FieldState.reflect``, ``Battler.tailwind``...);
+* ``on_start`` / ``on_expire`` are ``fn(core, owner, field, battlers)``,
+  where ``battlers`` are the active battlers. Without ``on_expire`` a field
+  effect announces its end with a ``FieldChange`` event.
+
+Everything else reads ``name in owner.timers`` where the effect matters.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from heapq import heapify, heappop, heappush
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Sequence
+
+from .events import FieldChange
+
+if TYPE_CHECKING:
+    from .core import BattleCore, Battler, FieldState
+
+# fn(core, owner, field, battlers)
+TimerHook = Callable[..., None]
+
+@dataclass(frozen=True, slots=True)
+class TimedEffect:
+    name: str
+    scope: str                      # "field" | "battler"
+    order: int                      # tiebreak for effects ending on the same turn (registration order)
+    flag: Optional[str] = None
+    on_start: Optional[TimerHook] = None
+    on_expire: Optional[TimerHook] = None
+
+TIMED_EFFECTS: Dict[str, TimedEffect] = {}
+
+def register_timed(name: str, scope: str, *, flag: Optional[str] = None, on_start: Optional[TimerHook] = None,
+                   on_expire: Optional[TimerHook] = None) -> TimedEffect:
+    if scope not in ("field", "battler"):
+        raise ValueError(f"Unknown timed effect scope: {scope}")
+    prev = TIMED_EFFECTS.get(name)
+    spec = TimedEffect(name, scope, prev.order if prev else len(TIMED_EFFECTS), flag, on_start, on_expire)
+    TIMED_EFFECTS[name] = spec
+    return spec
+
+def start(core: "BattleCore", owner: Any, name: str, turns: int, field: "FieldState",
+          battlers: Sequence["Battler"] = ()) -> None:
+    """Run ``name`` on ``owner`` for ``turns`` end-of-turn ticks, replacing any running instance."""
+    spec = TIMED_EFFECTS[name]
+    ends = field.turn + turns
+    owner.timers[name] = ends
+    heappush(owner.timer_heap, (ends, spec.order, name))
+    if spec.flag is not None:
+        setattr(owner, spec.flag, True)
+    if spec.on_start is not None:
+        spec.on_start(core, owner, field, battlers)
+
+def stop(owner: Any, name: str) -> None:
+    """Drop ``name``'s timer without running its expiry (the effect itself stays as the caller leaves it)."""
+    owner.timers.pop(name, None)
+
+def clear(owner: Any) -> None:
+    """Drop every timer on ``owner`` and lower their flags, without expiry hooks (e.g. on switch-out)."""
+    for name in owner.timers:
+        flag = TIMED_EFFECTS[name].flag
+        if flag is not None:
+            setattr(owner, flag, False)
+    owner.timers.clear()
+    owner.timer_heap.clear()
+
+def remaining(owner: Any, name: str, field: "FieldState") -> int:
+    """End-of-turn ticks left for ``name`` (0 if it has no timer)."""
+    ends = owner.timers.get(name)
+    return ends - field.turn if ends is not None else 0
+
+def expire(core: "BattleCore", owner: Any, field: "FieldState", battlers: Sequence["Battler"]) -> None:
+    """Pop and end every effect on ``owner`` due by ``field.turn``."""
+    heap = owner.timer_heap
+    timers = owner.timers
+    turn = field.turn
+    while heap and heap[0][0] <= turn:
+        ends, _, name = heappop(heap)
+        if timers.get(name) != ends:
+            continue  # restarted or stopped since this entry was pushed
+        del timers[name]
+        spec = TIMED_EFFECTS[name]
+        if spec.flag is not None:
+            setattr(owner, spec.flag, False)
+        if spec.on_expire is not None:
+            spec.on_expire(core, owner, field, battlers)
+        elif spec.scope == "field":
+            core._emit(FieldChange, name, False)
+
+def rebuild_heap(owner: Any) -> None:
+    """Reset ``owner.timer_heap`` from ``owner.timers`` (after a restore)."""
+    heap = [(ends, TIMED_EFFECTS[name].order, name) for name, ends in owner.timers.items()]
+    heapify(heap)
+    owner.timer_heap = heap
+
+# ---------------------------------------------------------------- field
+
+def _weather_expire(core, field, _field, battlers):
+    if field.weather is not None:
+        core._emit(FieldChange, field.weather, False)
+        field.weather = None
+
+def _trick_room_start(core, field, _field, battlers):
+    for b in battlers:
+        b.trick_room_active = True
+
+def _trick_room_expire(core, field, _field, battlers):
+    for b in battlers:
+        b.trick_room_active = False
+    core._emit(FieldChange, 'trick-room', False)
+
+register_timed("weather", "field", on_expire=_weather_expire)
+register_timed("reflect", "field", flag="reflect")
+register_timed("light-screen", "field", flag="light_screen")
+register_timed("trick-room", "field", on_start=_trick_room_start, on_expire=_trick_room_expire)
+register_timed("mist", "field")
+
+# ---------------------------------------------------------------- battler
+
+def _wore_off(text: str) -> TimerHook:
+    def hook(core, b, field, battlers):
+        core._msg(text.format(name=b.name))
+    return hook
+
+register_timed("magnet-rise", "battler", on_expire=_wore_off("{name}'s electromagnetism wore off!"))
+register_timed("taunt", "battler", on_expire=_wore_off("{name}'s taunt wore off!"))
+register_timed("tailwind", "battler", flag="tailwind", on_expire=_wore_off("{name}'s tailwind petered out!"))
+register_timed("safeguard", "battler", on_expire=_wore_off("{name} is no longer protected by Safeguard!"))
+
+__all__ = [
+    "TIMED_EFFECTS", "TimedEffect", "clear", "expire", "rebuild_heap", "register_timed", "remaining", "start", "stop",
+]
@@ -0,0 +1,149 @@
+"""Offline microbenchmarks.
+
+A suite is a list of :class:`Case`; ``case.setup()`` builds fixed-seed state
+and returns the zero-argument operation to time. :func:`measure` reports:
+
+* ``ops_per_sec`` / ``ns_per_op``: best of ``repeat`` timed runs, each
+  calibrated to last about ``min_time / repeat`` seconds;
+* ``kib_per_op``: tracemalloc peak of one call (memory the call allocates,
+  freed or not);
+* ``blocks_per_op``: memory blocks still allocated after a call, averaged
+  over a batch (nonzero means the operation retains memory).
+
+Results are saved as JSON baselines; :func:`compare` diffs two of them and
+flags cases whose throughput dropped by more than a threshold.
+
+CLI (see ``python -m platinum.bench --help``)::
+
+  python -m platinum.bench battle --save baseline.json
+  python -m platinum.bench battle --compare baseline.json --threshold 0.1
+  python -m platinum.bench compare baseline.json current.json
+"""
+from __future__ import annotations
+from dataclasses import asdict, dataclass
+from importlib import import_module
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+import gc
+import json
+import platform
+import tracemalloc
+
+# suite name -> module defining ``cases(seed) -> List[Case]``
+SUITES: Dict[str, str] = {"battle": "platinum.bench.battle"}
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+
+@dataclass
+class Result:
+    name: str
+    ops_per_sec: float
+    ns_per_op: float
+    kib_per_op: float
+    blocks_per_op: float
+    calls: int
+
+def _timed(op: Callable[[], Any], n: int) -> float:
+    t0 = perf_counter()
+    for _ in range(n):
+        op()
+    return perf_counter() - t0
+
+def measure(case: Case, *, min_time: float = 0.5, repeat: int = 5, alloc_calls: int = 20) -> Result:
+    op = case.setup()
+    op()  # warm caches and lazy imports
+    budget = min_time / repeat
+    n = 1
+    while True:
+        elapsed = _timed(op, n)
+        if elapsed >= budget / 4 or n >= 1 << 24:
+            break
+        n *= 4
+    n = max(1, int(n * budget / max(elapsed, 1e-9)))
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        best = min(_timed(op, n) for _ in range(repeat)) / n
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        op()
+        peak = tracemalloc.get_traced_memory()[1] - base
+        before = len(tracemalloc.take_snapshot().traces)
+        for _ in range(alloc_calls):
+            op()
+        retained = (len(tracemalloc.take_snapshot().traces) - before) / alloc_calls
+    finally:
+        tracemalloc.stop()
+    return Result(case.name, 1.0 / best, best * 1e9, peak / 1024, max(0.0, retained), n * repeat)
+
+def load_cases(suite: str, seed: int = 0) -> List[Case]:
+    if suite not in SUITES:
+        raise KeyError(f"Unknown benchmark suite: {suite}")
+    return import_module(SUITES[suite]).cases(seed)
+
+def run_suite(suite: str, *, seed: int = 0, only: Optional[Sequence[str]] = None,
+              progress: Optional[Callable[[Result], None]] = None, **kw) -> Dict[str, Any]:
+    """Measure every case of ``suite`` (or those named in ``only``); returns a baseline document."""
+    results = []
+    for case in load_cases(suite, seed):
+        if only and case.name not in only:
+            continue
+        res = measure(case, **kw)
+        results.append(res)
+        if progress is not None:
+            progress(res)
+    return {
+        "suite": suite, "seed": seed, "python": platform.python_version(), "machine": platform.machine(),
+        "results": {r.name: asdict(r) for r in results},
+    }
+
+def save(doc: Dict[str, Any], path: Union[str, Path]) -> None:
+    Path(path).write_text(json.dumps(doc, indent=2) + "\n", encoding="utf-8")
+
+def load(path: Union[str, Path]) -> Dict[str, Any]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+@dataclass
+class Delta:
+    name: str
+    base: float           # ops/sec
+    current: float
+    change: float         # relative throughput change (negative = slower)
+    regressed: bool
+
+def compare(base: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.10) -> List[Delta]:
+    """Per-case throughput change for cases present in both documents."""
+    out = []
+    for name, cur in current["results"].items():
+        old = base["results"].get(name)
+        if old is None:
+            continue
+        change = cur["ops_per_sec"] / old["ops_per_sec"] - 1.0
+        out.append(Delta(name, old["ops_per_sec"], cur["ops_per_sec"], change, change < -threshold))
+    return out
+
+def format_result(r: Result) -> str:
+    return (f"{r.name:<28} {r.ops_per_sec:>12,.0f} ops/s {r.ns_per_op:>12,.0f} ns/op "
+            f"{r.kib_per_op:>8.1f} KiB/op {r.blocks_per_op:>6.1f} blocks kept/op")
+
+def format_deltas(deltas: Sequence[Delta]) -> str:
+    lines = []
+    for d in deltas:
+        mark = "  REGRESSION" if d.regressed else ""
+        lines.append(f"{d.name:<28} {d.base:>12,.0f} -> {d.current:>12,.0f} ops/s {d.change:>+8.1%}{mark}")
+    return "\n".join(lines)
+
+__all__ = [
+    "Case", "Delta", "Result", "SUITES", "compare", "format_deltas", "format_result", "load", "load_cases",
+    "measure", "run_suite", "save",
+]
@@ -0,0 +1,47 @@
+"""``python -m platinum.bench``: run a suite, save a baseline, compare baselines."""
+from __future__ import annotations
+from typing import Optional, Sequence
+import argparse
+import json
+
+from . import SUITES, compare, format_deltas, format_result, load, run_suite, save
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m platinum.bench", description="Offline microbenchmarks")
+    sub = ap.add_subparsers(dest="command", required=True)
+    for suite in SUITES:
+        sp = sub.add_parser(suite, help=f"run the {suite} suite")
+        sp.add_argument("cases", nargs="*", help="only these cases")
+        sp.add_argument("--seed", type=int, default=0)
+        sp.add_argument("--min-time", type=float, default=0.5, help="seconds of timed calls per case")
+        sp.add_argument("--repeat", type=int, default=5)
+        sp.add_argument("--save", metavar="PATH", help="write the results as a JSON baseline")
+        sp.add_argument("--compare", metavar="PATH", help="baseline to compare against")
+        sp.add_argument("--threshold", type=float, default=0.10, help="slowdown flagged as a regression")
+        sp.add_argument("--json", action="store_true", help="print the results as JSON")
+    cp = sub.add_parser("compare", help="compare two saved baselines")
+    cp.add_argument("base")
+    cp.add_argument("current")
+    cp.add_argument("--threshold", type=float, default=0.10)
+    args = ap.parse_args(argv)
+
+    if args.command == "compare":
+        deltas = compare(load(args.base), load(args.current), args.threshold)
+        print(format_deltas(deltas))
+        return 1 if any(d.regressed for d in deltas) else 0
+
+    progress = None if args.json else (lambda r: print(format_result(r), flush=True))
+    doc = run_suite(args.command, seed=args.seed, only=args.cases, progress=progress, min_time=args.min_time,
+                    repeat=args.repeat)
+    if args.json:
+        print(json.dumps(doc, indent=2))
+    if args.save:
+        save(doc, args.save)
+    if args.compare:
+        deltas = compare(load(args.compare), doc, args.threshold)
+        print(format_deltas(deltas))
+        return 1 if any(d.regressed for d in deltas) else 0
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
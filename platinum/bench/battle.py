@@ -0,0 +1,167 @@
+"""Battle hot-path benchmarks (``python -m platinum.bench battle``).
+
+Parties come from ``assets/trainers``: Barry's second team (Chimchar
+route) against Roark's. Every case owns a fixed-seed ``random.Random`` and
+rewinds battler/field snapshots and the RNG state before each call, so each
+call does the same work (the rewind is part of the timing). ``multi_turn_2``
+and ``multi_turn_4`` run one turn with two and four actors; their ratio
+shows how a turn scales with the number of actors. ``session_snapshot``
+(flat snapshot + restore) is meant to stay well ahead of
+``session_deepcopy`` of the same state.
+"""
+from __future__ import annotations
+from typing import Any, Callable, List, Sequence
+import copy
+import random
+
+from platinum.battle.capture import attempt_capture
+from platinum.battle.core import BattleCore, Battler, FieldState
+from platinum.battle.experience import apply_experience
+from platinum.battle.factory import battler_from_species
+from platinum.battle.memo import DamageMemo
+from platinum.battle.prefab import PrefabCache
+from platinum.battle.session import BattleSession, Party
+from platinum.battle.sim import MemberSpec, trainer_party
+from platinum.system.save import PartyMember
+from . import Case
+
+PLAYER = ("rival_barry_2", ("rival_starter_chimchar",))
+ENEMY = ("gym_leader_roark", ())
+
+def _specs() -> tuple[List[MemberSpec], List[MemberSpec]]:
+    return trainer_party(*PLAYER), trainer_party(*ENEMY)
+
+def _teams() -> tuple[List[Battler], List[Battler]]:
+    player, enemy = _specs()
+    return [s.build() for s in player], [s.build() for s in enemy]
+
+def _core(seed: int) -> BattleCore:
+    core = BattleCore(rng=random.Random(seed))
+    core.sink = None
+    return core
+
+def _rewinding(core: BattleCore, battlers: Sequence[Battler], field: FieldState,
+               op: Callable[[], Any]) -> Callable[[], Any]:
+    snaps = [(b, b.snapshot()) for b in battlers]
+    field_snap = field.snapshot()
+    rng_state = core.rng.getstate()
+
+    def run():
+        for b, snap in snaps:
+            b.restore(snap)
+        field.restore(field_snap)
+        core.rng.setstate(rng_state)
+        return op()
+    return run
+
+def _calc_damage(seed: int):
+    def setup():
+        (a, _), (b, _) = _teams()
+        core = _core(seed)
+        move = next(m for m in a.moves if m.power)
+        field = FieldState()
+        return lambda: core.calc_damage(a, b, move, field)
+    return setup
+
+def _calc_damage_memo(seed: int):
+    def setup():
+        (a, _), (b, _) = _teams()
+        core = _core(seed)
+        core.damage_memo = DamageMemo()
+        move = next(m for m in a.moves if m.power)
+        field = FieldState()
+        return lambda: core.calc_damage(a, b, move, field)
+    return setup
+
+def _single_turn(seed: int):
+    def setup():
+        (a, _), (b, _) = _teams()
+        core = _core(seed)
+        field = FieldState()
+        return _rewinding(core, (a, b), field, lambda: core.single_turn(a, a.moves[0], b, b.moves[0], field))
+    return setup
+
+def _end_of_turn(seed: int):
+    def setup():
+        (a, _), (b, _) = _teams()
+        a.status, b.status = "psn", "brn"
+        core = _core(seed)
+        field = FieldState(weather="hail")
+        return _rewinding(core, (a, b), field, lambda: core.end_of_turn([a, b], field))
+    return setup
+
+def _multi_turn(seed: int, per_side: int):
+    def setup():
+        player, enemy = _teams()
+        sides = (player[:per_side], enemy[:per_side])
+        core = _core(seed)
+        field = FieldState()
+        actions = [(b, b.moves[0], 0) for side in sides for b in side]
+        return _rewinding(core, sides[0] + sides[1], field, lambda: core.multi_turn(actions, sides, field))
+    return setup
+
+def _session(seed: int) -> BattleSession:
+    player, enemy = _teams()
+    session = BattleSession(Party(player), Party(enemy), core=_core(seed), is_wild=False, record_log=False)
+    session.step(0, 0)
+    return session
+
+def _session_snapshot(seed: int):
+    def setup():
+        session = _session(seed)
+        return lambda: session.restore(session.snapshot(include_rng=False))
+    return setup
+
+def _session_deepcopy(seed: int):
+    def setup():
+        session = _session(seed)
+        return lambda: copy.deepcopy((session.player, session.enemy, session.field))
+    return setup
+
+def _battler_from_species(seed: int):
+    def setup():
+        spec = _specs()[1][0]
+        return lambda: battler_from_species(spec.species, spec.level)
+    return setup
+
+def _battler_prefab(seed: int):
+    def setup():
+        spec = _specs()[1][0]
+        cache = PrefabCache()
+        return lambda: cache.battler(spec.species, spec.level)
+    return setup
+
+def _attempt_capture(seed: int):
+    def setup():
+        rng = random.Random(seed)
+        return lambda: attempt_capture(rng, 45, 80, 20, "great-ball", "par")
+    return setup
+
+def _apply_experience(seed: int):
+    def setup():
+        spec = _specs()[0][1]
+        member = PartyMember(species="chimchar", level=spec.level)
+
+        def run():
+            member.level, member.exp, member.moves = spec.level, 0, []
+            return apply_experience(member, 5000, species_id=spec.species)
+        return run
+    return setup
+
+def cases(seed: int = 0) -> List[Case]:
+    return [
+        Case("calc_damage", _calc_damage(seed)),
+        Case("calc_damage_memo", _calc_damage_memo(seed)),
+        Case("single_turn", _single_turn(seed)),
+        Case("end_of_turn", _end_of_turn(seed)),
+        Case("multi_turn_2", _multi_turn(seed, 1)),
+        Case("multi_turn_4", _multi_turn(seed, 2)),
+        Case("session_snapshot", _session_snapshot(seed)),
+        Case("session_deepcopy", _session_deepcopy(seed)),
+        Case("battler_from_species", _battler_from_species(seed)),
+        Case("battler_prefab", _battler_prefab(seed)),
+        Case("attempt_capture", _attempt_capture(seed)),
+        Case("apply_experience", _apply_experience(seed)),
+    ]
+
+__all__ = ["cases"]
@@ -6,6 +6,7 @@ from platinum.dialogue.manager import DialogueManager
 from platinum.events.loader import load_events
 from platinum.events.engine import EventEngine
 from platinum.battle.service import battle_service
+from platinum.battle.roster import PartyRuntime
 from platinum.ui.menu import main_menu, options_submenu
 from platinum.ui.opening import show_opening_sequence
 from platinum.overworld import run_overworld
@@ -20,6 +21,8 @@ class GameContext:
         self.battle_service = battle_service
         # Primary game state
         self.state = GameState()
+        # Live battlers for state.party, synced back before saves
+        self.party_runtime = PartyRuntime()
         self._session_start_ts: float | None = None
         self._autosave_suspended: bool = False
         # Early backrefs for dialogue placeholder substitution
@@ -66,6 +69,7 @@ class GameContext:
         if self._autosave_suspended:
             return
         self._accumulate_play_time()
+        self.sync_party()
         # Write to temporary save only; master is updated only on explicit Save
         save_temp(self.state)
 
@@ -85,6 +89,15 @@ class GameContext:
         if self.settings.data.autosave:
             self._autosave()
 
+    # --- Party battlers ---
+    def party_battlers(self) -> list:
+        """Live battlers for the party (see platinum.battle.roster)."""
+        return self.party_runtime.battlers(self.state.party)
+
+    def sync_party(self) -> int:
+        """Write battle HP/status/PP back to the party members."""
+        return self.party_runtime.sync()
+
     # --- Party management (enforce 1..6) ---
     def add_party_member(self, member):
         """Add a PartyMember respecting party size limit (max 6).
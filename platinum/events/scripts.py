@@ -276,60 +276,20 @@ def handle_start_battle(ctx, action: dict):
                 print(str(bid))
         except Exception:
             pass
-        from platinum.battle.factory import battler_from_species
+        from platinum.battle.prefab import prefab_battler
         from platinum.data.species_lookup import species_id
         from platinum.ui.battle import run_battle_ui
+        from platinum.battle.ai import trainer_ai
         from platinum.battle.session import Party, BattleSession
         from platinum.battle.experience import exp_gain, apply_experience
 
-        # Build player's battlers from saved party (preserving HP/Status/PP)
-        player_battlers: list[Any] = []
-        for pm in ctx.state.party:
-            try:
-                sid = species_id(pm.species) if isinstance(pm.species, str) else int(pm.species)
-            except Exception:
-                continue
-            b = battler_from_species(sid, pm.level, nickname=str(pm.species).capitalize())
-            try:
-                b.current_hp = max(0, min(int(getattr(pm, 'hp', b.stats['hp'])), int(b.stats['hp'])))
-            except Exception:
-                b.current_hp = b.stats['hp']
-            b.status = (pm.status or 'none') if hasattr(pm, 'status') else 'none'
-            # Seed moves and PP
-            try:
-                from platinum.data.moves import get_move as _get_move
-                from platinum.battle.core import Move as _BCMove
-                pm_moves = list(getattr(pm, 'moves', []) or [])
-                pm_pp = dict(getattr(pm, 'move_pp', {}) or {})
-                new_moves = []
-                for m_internal in pm_moves[:4]:
-                    md = _get_move(m_internal)
-                    _dr = md.get("drain"); drain_ratio = tuple(_dr) if isinstance(_dr, (list, tuple)) else None
-                    _rr = md.get("recoil"); recoil_ratio = tuple(_rr) if isinstance(_rr, (list, tuple)) else None
-                    _mh = md.get("multi_hit"); hits = tuple(_mh) if isinstance(_mh, (list, tuple)) else None
-                    multi_turn = md.get("multi_turn")
-                    if multi_turn is not None and not isinstance(multi_turn, (list, tuple)):
-                        multi_turn = None
-                    new_moves.append(_BCMove(
-                        name=md["display_name"], type=md.get("type") or b.types[0], category=md.get("category") or "status",
-                        power=md.get("power") or 0, accuracy=md.get("accuracy"), priority=md.get("priority", 0),
-                        crit_rate_stage=md.get("crit_rate_stage", 0), hits=hits, drain_ratio=drain_ratio, recoil_ratio=recoil_ratio,
-                        flinch_chance=md.get("flinch_chance", 0), ailment=md.get("ailment"), ailment_chance=md.get("ailment_chance", 0),
-                        stat_changes=[{"stat": sc.get("stat"), "change": sc.get("change"), "chance": sc.get("chance", 0)} for sc in md.get("stat_changes", [])],
-                        target=md.get("targets") or "selected-pokemon", flags={"internal": m_internal} | (md.get("flags", {}) or {}),
-                        multi_turn=tuple(multi_turn) if multi_turn else None, max_pp=md.get("pp", 0) or 0,
-                        pp=pm_pp.get(m_internal, md.get("pp", 0) or 0),
-                    ))
-                if new_moves:
-                    b.moves = new_moves
-            except Exception:
-                pass
-            player_battlers.append(b)
+        # Live party battlers (HP/Status/PP carried over; rebuilt only on species/level/move changes)
+        player_battlers: list[Any] = ctx.party_battlers()
 
         # Obedience badge count hint
         badge_count = len(getattr(ctx.state, 'badges', []))
         for b in player_battlers:
-            setattr(b, 'badge_count', badge_count)
+            b.badge_count = badge_count
 
         # Enemy battlers (Rival special-case -> type-advantage starter; else from config or single)
         enemy_battlers: list[Any] = []
@@ -376,7 +336,7 @@ def handle_start_battle(ctx, action: dict):
                     e_name = _get_species(sid)["name"].capitalize() if _get_species else str(sp).capitalize()
                 except Exception:
                     e_name = str(sp).capitalize()
-                enemy_battlers.append(battler_from_species(sid, lvl, nickname=e_name))
+                enemy_battlers.append(prefab_battler(sid, lvl, nickname=e_name))
             # Fallback trainer label
             if is_trainer and not trainer_label:
                 lab = cfg.get("trainer")
@@ -397,7 +357,7 @@ def handle_start_battle(ctx, action: dict):
                     e_name = _get_species(enemy_sid)["name"].capitalize()
                 except Exception:
                     e_name = str(enemy_species).capitalize()
-                enemy_battlers.append(battler_from_species(enemy_sid, enemy_level, nickname=e_name))
+                enemy_battlers.append(prefab_battler(enemy_sid, enemy_level, nickname=e_name))
         if not enemy_battlers:
             # Ultimate fallback: demo battle service
             try:
@@ -430,10 +390,14 @@ def handle_start_battle(ctx, action: dict):
                 except Exception:
                     flags_sorted = []
                 print(f"[DEBUG] Starting rival battle 1. Trainer label: {trainer_label}. Flags: {flags_sorted}")
-            outcome = run_battle_ui(session, is_trainer=is_trainer, trainer_label=trainer_label)
+            ai = trainer_ai(bid) if is_trainer else None
+            outcome = run_battle_ui(session, is_trainer=is_trainer, trainer_label=trainer_label, ai=ai)
         except TypeError:
             outcome = run_battle_ui(session, is_trainer=is_trainer)
 
+        # Carry HP/Status/PP back before the post-battle flows edit the party
+        ctx.sync_party()
+
         # Record flags
         if outcome == 'PLAYER_WIN':
             ctx.set_flag(f"battle_{bid}_won")
@@ -771,41 +735,6 @@ def handle_start_battle(ctx, action: dict):
                 except Exception:
                     pass
 
-        # Sync back party HP/Status/PP
-        try:
-            for idx, b in enumerate(getattr(session.player, 'members', []) or []):
-                if idx >= len(ctx.state.party):
-                    break
-                pm = ctx.state.party[idx]
-                try:
-                    pm.max_hp = int(b.stats.get('hp', getattr(pm, 'max_hp', 0)))
-                except Exception:
-                    pass
-                try:
-                    pm.hp = max(0, int(getattr(b, 'current_hp', getattr(pm, 'hp', 0)) or 0))
-                except Exception:
-                    pass
-                try:
-                    pm.status = getattr(b, 'status', getattr(pm, 'status', 'none'))
-                except Exception:
-                    pass
-                try:
-                    move_pp = {}
-                    for mv in getattr(b, 'moves', []) or []:
-                        key = None
-                        try:
-                            key = mv.flags.get('internal') if hasattr(mv, 'flags') else None
-                        except Exception:
-                            key = None
-                        if not key:
-                            continue
-                        move_pp[str(key)] = int(getattr(mv, 'pp', 0) or 0)
-                    if move_pp:
-                        pm.move_pp = move_pp
-                except Exception:
-                    pass
-        except Exception:
-            pass
         return
 
     # Non-interactive path (legacy service)
@@ -770,8 +770,7 @@ def run_overworld(ctx):
                 # Roll a wild encounter from tables and start an interactive battle
                 try:
                     from platinum.encounters.loader import roll_encounter, current_time_of_day
-                    from platinum.data.species_lookup import species_id
-                    from platinum.battle.factory import battler_from_species
+                    from platinum.battle.prefab import prefab_battler
                     from platinum.battle.session import Party, BattleSession
                     from platinum.ui.battle import run_battle_ui
                 except Exception:
@@ -806,16 +805,11 @@ def run_overworld(ctx):
                     else:
                         spc, lvl = res
                         # Build battlers
-                        player_battlers = []
-                        for pm in ctx.state.party:
-                            try:
-                                sid = species_id(pm.species) if isinstance(pm.species, str) else int(pm.species)
-                            except Exception:
-                                continue
-                            player_battlers.append(battler_from_species(sid, pm.level, nickname=pm.species.capitalize()))
-                        enemy = battler_from_species(int(spc), int(lvl))
+                        player_battlers = ctx.party_battlers()
+                        enemy = prefab_battler(int(spc), int(lvl))
                         session = BattleSession(Party(player_battlers), Party([enemy]), is_wild=True)
                         outcome = run_battle_ui(session, is_trainer=False, ctx=ctx)
+                        ctx.sync_party()
                         
                         # Wild victory processing is now handled in run_battle_ui
                         # No additional XP or music processing needed here
@@ -1262,6 +1256,7 @@ def _menu_save_and_exit(ctx) -> None:
     except Exception:
         pass
     try:
+        ctx.sync_party()
         path = save_game(ctx.state)
         delete_temp()
         tw.type_out("Game saved.", Settings.load().data.text_speed if hasattr(Settings.load(), 'data') else 2)
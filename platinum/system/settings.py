@@ -14,6 +14,7 @@ class SettingsData:
     autosave: bool = True          # Automatically save after key progression changes
     debug: bool = False            # Verbose battle/debug prints
     menu_color: str = "bright_white"  # Menu border and highlight color
+    battle_speed: str = "normal"   # normal / fast / instant (battle pauses and animations)
 
     def normalize(self):
         if self.text_speed not in {1,2,3}:
@@ -22,6 +23,8 @@ class SettingsData:
             self.log_level = "INFO"
         if self.menu_color not in {"bright_white", "bright_cyan", "bright_yellow", "bright_green", "bright_magenta", "bright_red", "bright_blue"}:
             self.menu_color = "bright_white"
+        if self.battle_speed not in {"normal", "fast", "instant"}:
+            self.battle_speed = "normal"
 
 class Settings:
     def __init__(self, data: SettingsData, path: Path):
@@ -13,14 +13,18 @@ Intentionally minimal (no animations, status messages aggregated). Designed so
 tests can bypass by not setting the interactive flag in event actions.
 """
 from __future__ import annotations
-from typing import Optional, List, Dict
+from typing import Callable, Optional, List, Dict
 import random
 from platinum.ui.menu_nav import Menu, MenuItem
-import re
 from platinum.battle.session import BattleSession, Party
 from platinum.battle.core import Move, Battler
+from platinum.battle.ai import ExpectimaxAI, trainer_ai
+from platinum.battle.events import BattleEvent, HpChange, Message, MoveUsed, StatStage, StatusApplied
 from platinum.core.types import format_types, type_abbreviation, colorize_type_text, TYPE_COLORS_HEX
 from platinum.ui import typewriter as tw
+from platinum.ui.keys import flush_input, key_pending
+from platinum.ui.timeline import run_frames
+from platinum.core.logging import logger
 from platinum.battle.experience import required_exp_for_level, growth_rate
 from platinum.audio.player import audio
 import time
@@ -147,13 +151,49 @@ def _tty_ok() -> bool:
     except Exception:
         return False
 
+# Settings.battle_speed -> multiplier for UI pauses and animation frames
+BATTLE_SPEED_SCALE: Dict[str, float] = {"normal": 1.0, "fast": 0.25, "instant": 0.0}
+_battle_speed = "normal"  # set from Settings at the start of each run_battle_ui
+
+
+def _pause(seconds: float) -> None:
+    """Sleep for ``seconds`` scaled by the battle speed (no sleep at all when instant)."""
+    scaled = seconds * BATTLE_SPEED_SCALE.get(_battle_speed, 1.0)
+    if scaled > 0:
+        time.sleep(scaled)
+
+
+def _animations_on() -> bool:
+    return _tty_ok() and _battle_speed != "instant"
+
+
+def _say(text: str, speed_setting: int = 3) -> None:
+    """Typewriter line; fast uses the quickest speed, instant prints it whole."""
+    if _battle_speed == "instant":
+        print(text)
+        return
+    tw.type_out(text, speed_setting=1 if _battle_speed == "fast" else speed_setting)
+
+
+def _effect_frames(duration: float, fps: float) -> int:
+    return max(1, int(duration * BATTLE_SPEED_SCALE.get(_battle_speed, 1.0) * fps))
+
+
+def _play_effect(name: str, frame: Callable[[int], None], frames: int, fps: float) -> None:
+    """Drive ``frame`` on the frame timeline; a key press skips the rest of the effect."""
+    stats = run_frames(frame, frames, fps, cancel=key_pending)
+    if stats.cancelled:
+        flush_input()
+    logger.debug("BattleEffectFrames", effect=name, target_fps=fps, achieved_fps=round(stats.achieved_fps, 1),
+                 drawn=stats.drawn, dropped=stats.dropped, cancelled=stats.cancelled)
+
 def _intro_effect_trainer(duration: float = 0.9, fps: int = 18):
     """Speed-line style effect for trainer battles (short and simple)."""
-    if not _tty_ok():
+    if not _animations_on():
         return
-    frames = max(1, int(duration * fps))
+    frames = _effect_frames(duration, fps)
     cols = 60
-    for f in range(frames):
+    def frame(f: int):
         try:
             tw.clear_screen()
         except Exception:
@@ -166,13 +206,14 @@ def _intro_effect_trainer(duration: float = 0.9, fps: int = 18):
         print(color + line + Style.RESET_ALL)
         print()
         print(color + line + Style.RESET_ALL)
-        time.sleep(1.0 / fps)
+
+    _play_effect("trainer", frame, frames, fps)
 
 def _intro_effect_wild_grass(duration: float = 1.5, fps: int = 24):
     """Wild encounter effect: rustling grass followed by white flash (DS style)."""
-    if not _tty_ok():
+    if not _animations_on():
         return
-    frames = max(1, int(duration * fps))
+    frames = _effect_frames(duration, fps)
     width = 70
     height = 10
     
@@ -186,7 +227,7 @@ def _intro_effect_wild_grass(duration: float = 1.5, fps: int = 24):
     grass_frames = int(frames * 0.7)
     flash_frames = frames - grass_frames
     
-    for f in range(frames):
+    def frame(f: int):
         try:
             tw.clear_screen()
         except Exception:
@@ -252,17 +293,17 @@ def _intro_effect_wild_grass(duration: float = 1.5, fps: int = 24):
                 flash_line = final_white + "░" * width + Style.RESET_ALL
                 for _ in range(height):
                     print(flash_line)
-        
-        time.sleep(1.0 / fps)
+
+    _play_effect("wild_grass", frame, frames, fps)
 
 def _intro_effect_pokeball_dissolve(duration: float = 1.2, fps: int = 20):
     """Default pre-battle effect: a Poké Ball ASCII that dissolves away.
 
     Inspired by HG/SS Trainer Red intro. Short, subtle, TTY-only.
     """
-    if not _tty_ok():
+    if not _animations_on():
         return
-    frames = max(1, int(duration * fps))
+    frames = _effect_frames(duration, fps)
     W, H = 44, 15
     cx, cy = W // 2, H // 2
     rx, ry = W * 0.32, H * 0.42
@@ -284,7 +325,7 @@ def _intro_effect_pokeball_dissolve(duration: float = 1.2, fps: int = 20):
     BAND = (90, 90, 90)  # dark gray so it shows on dark terminals
     BTN = (250, 250, 250)
     BG = " "
-    for f in range(frames):
+    def frame(f: int):
         try:
             tw.clear_screen()
         except Exception:
@@ -323,7 +364,8 @@ def _intro_effect_pokeball_dissolve(duration: float = 1.2, fps: int = 20):
         # Center on screen a bit with top padding
         pad_top = 2
         print("\n" * pad_top + "\n".join(out_lines))
-        time.sleep(1.0 / fps)
+
+    _play_effect("pokeball_dissolve", frame, frames, fps)
 
 
 def _render_state(session: BattleSession):
@@ -544,7 +586,7 @@ def _animate_hp_change(session: BattleSession, target: Battler, old_hp: int, new
     - < 1.0: slightly slower
     Other causes (status/weather/item/self/recoil/drain): normal speed.
     """
-    if not _tty_ok():
+    if not _animations_on():
         return
     try:
         max_hp = int(target.stats.get('hp', 1))
@@ -581,38 +623,43 @@ def _animate_hp_change(session: BattleSession, target: Battler, old_hp: int, new
     # Determine steps (cap to keep snappy)
     steps = max(6, min(30, total))
     step_size = max(1, math.ceil(total / steps))
-    cur = old_hp
-    # Increment/decrement towards new_hp
-    while (delta < 0 and cur > new_hp) or (delta > 0 and cur < new_hp):
-        cur = cur - step_size if delta < 0 else cur + step_size
-        if delta < 0 and cur < new_hp:
-            cur = new_hp
-        if delta > 0 and cur > new_hp:
-            cur = new_hp
+    frames = math.ceil(total / step_size)
+    sign = -1 if delta < 0 else 1
+
+    def frame(f: int):
         # Temporarily set and render a full state for clarity
         saved = target.current_hp
         try:
-            target.current_hp = cur
+            target.current_hp = old_hp + sign * min(total, (f + 1) * step_size)
             _render_state(session)
         finally:
             target.current_hp = saved
-        time.sleep(base_sleep)
+
+    _play_effect("hp", frame, frames, 1.0 / (base_sleep * BATTLE_SPEED_SCALE.get(_battle_speed, 1.0)))
 
 
-def _attach_hp_animation(session: BattleSession):
-    """Attach hp_change_cb to animate bars during HP changes; returns a restore callable."""
+def _attach_screen_sink(session: BattleSession):
+    """Attach a battle event sink for screen effects; returns a restore callable.
+
+    Move announcements get a wipe + typewriter line + move SFX, HP changes
+    animate the bars, and stat/status/no-effect lines pause for reading.
+    The previous sink (session log) keeps receiving every event. At instant
+    battle speed nothing is attached: the log stays the only sink and the
+    battle menu prints the last turn's lines from it.
+    """
     core = session.core
-    prev = getattr(core, 'hp_change_cb', None)
+    prev = core.sink
+    if _battle_speed == "instant":
+        return lambda: None
+
     def _do_wipe_narration(attacker: str, move_name: str):
-        if not _tty_ok():
-            return
         try:
             tw.clear_screen()
         except Exception:
             pass
         # Typewriter line
         try:
-            tw.type_out(f"{attacker} used {move_name}!", speed_setting=3)
+            _say(f"{attacker} used {move_name}!")
         except Exception:
             print(f"{attacker} used {move_name}!")
         # Try move SFX (non-blocking under pytest handled in audio)
@@ -630,101 +677,39 @@ def _attach_hp_animation(session: BattleSession):
             pass
         _render_state(session)
 
-    def cb(battler: Battler, old_hp: int, new_hp: int, meta: dict):
+    def _show_and_pause(txt: str):
+        try:
+            _say(txt, speed_setting=2)
+        except Exception:
+            print(txt)
         try:
-            m = meta or {}
-            # For damaging moves, narrate before animating HP (once per action)
-            if m.get('cause') == 'move':
-                atk = m.get('attacker') or getattr(battler, 'name', None)
-                mv = m.get('move')
-                # Only narrate on first hit of multi-hit moves
-                if atk and mv and int(m.get('hit_index', 1) or 1) == 1:
-                    key = (str(atk), str(mv))
-                    if getattr(session, '_last_narrated', None) != key:
-                        setattr(session, '_last_narrated', key)
-                        _do_wipe_narration(str(atk), str(mv))
-            _animate_hp_change(session, battler, old_hp, new_hp, m)
+            tw.clear_screen()
         except Exception:
             pass
-    core.hp_change_cb = cb
-    def restore():
-        core.hp_change_cb = prev
-    return restore
-
-def _attach_message_overlay(session: BattleSession):
-    """Attach a message callback that triggers wipe+SFX narration for non-damaging moves.
+        _render_state(session)
 
-    We still chain to previous callback to keep logs for tests.
-    """
-    core = session.core
-    prev = getattr(core, 'message_cb', None)
-    def cb(text: str):
+    def sink(ev: BattleEvent):
+        if prev is not None:
+            try:
+                prev(ev)
+            except Exception:
+                pass
+        if not _tty_ok():
+            return
         try:
-            # Chain to previous logger first
-            if prev:
-                try:
-                    prev(text)
-                except Exception:
-                    pass
-            if _tty_ok():
-                # Detect "<Name> used <Move>!" lines
-                m = re.match(r"^(.+?) used (.+?)!", text)
-                if m:
-                    atk, mv = m.group(1), m.group(2)
-                    key = (atk, mv)
-                    if getattr(session, '_last_narrated', None) != key:
-                        setattr(session, '_last_narrated', key)
-                        # Wipe + SFX, then restore HUD (for status/non-damaging messages)
-                        try:
-                            tw.clear_screen()
-                        except Exception:
-                            pass
-                        try:
-                            tw.type_out(f"{atk} used {mv}!", speed_setting=3)
-                        except Exception:
-                            print(f"{atk} used {mv}!")
-                        try:
-                            from pathlib import Path as _Path
-                            fname = mv.lower().replace(' ', '-').replace("'", "")
-                            sfx = _Path(__file__).resolve().parents[2] / "assets" / "audio" / "sfx" / "moves" / f"{fname}.ogg"
-                            audio.play_sfx_blocking(str(sfx), volume=1.0)
-                        except Exception:
-                            pass
-                        try:
-                            tw.clear_screen()
-                        except Exception:
-                            pass
-                        _render_state(session)
-                else:
-                    # Show important follow-up effect messages and pause to read.
-                    txt = str(text)
-                    show_and_pause = False
-                    try:
-                        # Stat stage changes (e.g., "Defense fell!") or cures/status
-                        if txt.endswith(" fell!") or txt.endswith(" rose!"):
-                            show_and_pause = True
-                        elif txt.startswith("But nothing happened"):
-                            show_and_pause = True
-                        elif "is afflicted with" in txt:
-                            show_and_pause = True
-                    except Exception:
-                        show_and_pause = False
-                    if show_and_pause:
-                        try:
-                            tw.type_out(txt, speed_setting=2)
-                        except Exception:
-                            print(txt)
-                        # Removed manual prompt for smoother battle flow
-                        try:
-                            tw.clear_screen()
-                        except Exception:
-                            pass
-                        _render_state(session)
+            if isinstance(ev, MoveUsed):
+                # Narrate once per action (first hit of multi-hit moves)
+                if ev.hit <= 1:
+                    _do_wipe_narration(ev.user.name, ev.move.name)
+            elif isinstance(ev, HpChange):
+                _animate_hp_change(session, ev.target, ev.old_hp, ev.new_hp, {"cause": ev.cause, **ev.meta})
+            elif isinstance(ev, (StatStage, StatusApplied)) or (isinstance(ev, Message) and ev.key == "nothing"):
+                _show_and_pause(ev.text())
         except Exception:
             pass
-    core.message_cb = cb
+    core.sink = sink
     def restore():
-        core.message_cb = prev
+        core.sink = prev
     return restore
 
 
@@ -734,6 +719,11 @@ def _enemy_move_index(e: Battler, rng: random.Random) -> int:
         return 0
     return rng.choice(usable)
 
+def _enemy_choice(session: BattleSession, rng: random.Random, ai) -> int:
+    if ai is None:
+        return _enemy_move_index(session.enemy.active(), rng)
+    return ai.choose(session)
+
 def _next_available_index(party: Party, skip_index: int | None = None) -> int | None:
     try:
         for i, m in enumerate(party.members):
@@ -769,7 +759,7 @@ def _forced_switch_player(session: BattleSession) -> bool:
     sel = m.run()
     try:
         if sel is not None:
-            session.player.active_index = int(sel)
+            session.switch('player', int(sel))
             print(f"Go! {session.player.active().name}!")
             return True
     except Exception:
@@ -777,7 +767,7 @@ def _forced_switch_player(session: BattleSession) -> bool:
     # Non-interactive fallback: auto switch first available
     nxt = _next_available_index(session.player, skip_index=cur_idx)
     if nxt is not None:
-        session.player.active_index = nxt
+        session.switch('player', nxt)
         print(f"Go! {session.player.active().name}!")
         return True
     return False
@@ -905,9 +895,14 @@ def _choose_move(session: BattleSession) -> int | None:
     return int(res)
 
 
-def run_battle_ui(session: BattleSession, *, is_trainer: bool = False, trainer_label: Optional[str] = None, rng: Optional[random.Random] = None, inventory: Optional[Dict[str,int]] = None, ctx=None) -> str:
+def run_battle_ui(session: BattleSession, *, is_trainer: bool = False, trainer_label: Optional[str] = None, rng: Optional[random.Random] = None, inventory: Optional[Dict[str,int]] = None, ctx=None, ai=None) -> str:
     rng = rng or random.Random()
+    # Trainers search for their moves; wild Pokémon pick at random
+    if ai is None and is_trainer:
+        ai = ExpectimaxAI.for_trainer(None)
     from platinum.system.settings import Settings
+    global _battle_speed
+    _battle_speed = getattr(Settings.load().data, 'battle_speed', 'normal')
     if getattr(Settings.load().data, 'debug', False):
         print(f"[battle] Starting {'trainer' if is_trainer else 'wild'} battle!")
     # Snapshot currently playing music to restore after battle (especially for wild encounters)
@@ -979,14 +974,14 @@ def run_battle_ui(session: BattleSession, *, is_trainer: bool = False, trainer_l
         except Exception:
             pass
         who = trainer_label or "Trainer"
-        tw.type_out(f"You are challenged by {who}!", speed_setting=3)
-        time.sleep(2)
+        _say(f"You are challenged by {who}!")
+        _pause(2)
         try:
             tw.clear_screen()
         except Exception:
             pass
-        tw.type_out(f"Go {session.player.active().name}!", speed_setting=3)
-        time.sleep(2)
+        _say(f"Go {session.player.active().name}!")
+        _pause(2)
     else:
         # Wild intro sequence
         try:
@@ -997,19 +992,22 @@ def run_battle_ui(session: BattleSession, *, is_trainer: bool = False, trainer_l
             wild_name = session.enemy.active().name
         except Exception:
             wild_name = "Pokémon"
-        tw.type_out(f"You encountered a wild {wild_name}!", speed_setting=3)
-        time.sleep(2)
+        _say(f"You encountered a wild {wild_name}!")
+        _pause(2)
         try:
             tw.clear_screen()
         except Exception:
             pass
-        tw.type_out(f"Go {session.player.active().name}!", speed_setting=3)
-        time.sleep(2)
+        _say(f"Go {session.player.active().name}!")
+        _pause(2)
     # Attach HP animation callback for the duration of the battle
-    _restore_hp_cb = _attach_hp_animation(session)
-    _restore_msg_cb = _attach_message_overlay(session)
+    _restore_sink = _attach_screen_sink(session)
+    shown_mark = session.log.mark()
     try:
         while not session.is_over():
+            # Instant speed: lines logged since the menu was last shown
+            recent = session.log.since(shown_mark) if _battle_speed == "instant" and _tty_ok() else []
+            shown_mark = session.log.mark()
             # Menu items for navigation
             main_items = [
                 MenuItem("Fight", "fight"),
@@ -1034,6 +1032,8 @@ def run_battle_ui(session: BattleSession, *, is_trainer: bool = False, trainer_l
                 
                 # Render Pokemon information
                 _render_enhanced_hud_inline(session)
+                for line in recent:
+                    console.print(line, markup=False)
                 
                 # Add spacing between Pokemon info and battle commands
                 console.print()
@@ -1110,12 +1110,12 @@ def run_battle_ui(session: BattleSession, *, is_trainer: bool = False, trainer_l
                 mv_idx = _choose_move(session)
                 if mv_idx is None:
                     continue  # back out
-                enemy_idx = _enemy_move_index(session.enemy.active(), rng)
-                pre_turn_log_len = len(session.log)
+                enemy_idx = _enemy_choice(session, rng, ai)
+                pre_turn_log_mark = session.log.mark()
                 session.step(player_move_idx=mv_idx, enemy_move_idx=enemy_idx)
                 # For non-TTY (tests), print the new messages.
                 if not _tty_ok():
-                    new_msgs = session.log[pre_turn_log_len:]
+                    new_msgs = session.log.since(pre_turn_log_mark)
                     for msg in new_msgs:
                         print(msg)
                 # Redraw HUD after step
@@ -1179,7 +1179,7 @@ def run_battle_ui(session: BattleSession, *, is_trainer: bool = False, trainer_l
                         if choice_sw == "yes":
                             _forced_switch_player(session)
                         # Send in next enemy Pokémon
-                        session.enemy.active_index = nxt_idx
+                        session.switch('enemy', nxt_idx)
                         print(f"{who} sent out {session.enemy.active().name}!")
             elif choice == "pokemon":
                 # Create menu items for Pokemon team
@@ -1307,9 +1307,9 @@ def run_battle_ui(session: BattleSession, *, is_trainer: bool = False, trainer_l
                     ).run()
                     
                     if sub == "switch":
-                        session.player.active_index = idx
+                        session.switch('player', idx)
                         console.print(f"[green]Go! {session.player.active().name}![/green]")
-                        time.sleep(1)
+                        _pause(1)
                     elif sub == "summary":
                         input(f"\n{pokemon.name} Summary - Press Enter to continue...")
                 continue
@@ -1414,12 +1414,12 @@ def run_battle_ui(session: BattleSession, *, is_trainer: bool = False, trainer_l
                 
                 if "Poke Balls" in psel and not session.is_wild:
                     console.print(f"[red]You can't use that here.[/red]")
-                    time.sleep(1)
+                    _pause(1)
                     continue
                 
                 if not items_in_pocket:
                     console.print(f"[yellow](Nothing here)[/yellow]")
-                    time.sleep(1)
+                    _pause(1)
                     continue
                 
                 # Create item menu
@@ -1498,27 +1498,26 @@ def run_battle_ui(session: BattleSession, *, is_trainer: bool = False, trainer_l
                 
                 # Item usage logic
                 if sel in {"potion", "super-potion"}:
-                    heal_amt = 20 if sel == "potion" else 50
                     target = session.player.active()
-                    if (target.current_hp or 0) >= target.stats['hp']:
+                    before_hp = target.current_hp or 0
+                    if not session.use_item(sel):
                         console.print(f"[yellow]It won't have any effect.[/yellow]")
-                        time.sleep(1)
+                        _pause(1)
                         continue  # Stay in bag menu
                     else:
-                        heal = min(heal_amt, target.stats['hp'] - (target.current_hp or 0))
-                        session.core.apply_heal(target, heal, cause='item', meta={'item': sel})
+                        heal = (target.current_hp or 0) - before_hp
                         inv[sel] -= 1
                         console.print(f"[green]Restored {heal} HP to {target.name}![/green]")
-                        time.sleep(2)
+                        _pause(2)
                         
                         # This counts as the player's turn, so enemy gets to move
-                        enemy_idx = _enemy_move_index(session.enemy.active(), rng)
-                        pre_turn_log_len = len(session.log)
+                        enemy_idx = _enemy_choice(session, rng, ai)
+                        pre_turn_log_mark = session.log.mark()
                         session.step(player_move_idx=0, enemy_move_idx=enemy_idx)
                         
                         # For non-TTY (tests), print the new messages
                         if not _tty_ok():
-                            new_msgs = session.log[pre_turn_log_len:]
+                            new_msgs = session.log.since(pre_turn_log_mark)
                             for msg in new_msgs:
                                 print(msg)
                         
@@ -1529,38 +1528,23 @@ def run_battle_ui(session: BattleSession, *, is_trainer: bool = False, trainer_l
                     target = session.player.active()
                     target_status = getattr(target, 'status', None)
                     
-                    # Check if item can cure the current status
-                    can_cure = False
-                    if sel == "antidote" and target_status == "poison":
-                        can_cure = True
-                    elif sel == "paralyze-heal" and target_status == "paralysis":
-                        can_cure = True
-                    elif sel == "burn-heal" and target_status == "burn":
-                        can_cure = True
-                    elif sel == "ice-heal" and target_status == "freeze":
-                        can_cure = True
-                    elif sel == "awakening" and target_status == "sleep":
-                        can_cure = True
-                    
-                    if not target_status or not can_cure:
+                    if not session.use_item(sel):
                         console.print(f"[yellow]It won't have any effect.[/yellow]")
-                        time.sleep(1)
+                        _pause(1)
                         continue  # Stay in bag menu
                     else:
-                        # Cure the status condition using the core method
-                        session.core._cure_status(target, announce=False)
                         inv[sel] -= 1
                         console.print(f"[green]{target.name} was cured of {target_status}![/green]")
-                        time.sleep(2)
+                        _pause(2)
                         
                         # This counts as the player's turn, so enemy gets to move
-                        enemy_idx = _enemy_move_index(session.enemy.active(), rng)
-                        pre_turn_log_len = len(session.log)
+                        enemy_idx = _enemy_choice(session, rng, ai)
+                        pre_turn_log_mark = session.log.mark()
                         session.step(player_move_idx=0, enemy_move_idx=enemy_idx)
                         
                         # For non-TTY (tests), print the new messages
                         if not _tty_ok():
-                            new_msgs = session.log[pre_turn_log_len:]
+                            new_msgs = session.log.since(pre_turn_log_mark)
                             for msg in new_msgs:
                                 print(msg)
                         
@@ -1585,16 +1569,16 @@ def run_battle_ui(session: BattleSession, *, is_trainer: bool = False, trainer_l
                             return 'PLAYER_WIN'
                         else:
                             console.print(f"[yellow]{result.replace('_', ' ').title()}[/yellow]")
-                            time.sleep(2)
+                            _pause(2)
                             
                             # Failed capture counts as a turn, enemy gets to move
-                            enemy_idx = _enemy_move_index(session.enemy.active(), rng)
-                            pre_turn_log_len = len(session.log)
+                            enemy_idx = _enemy_choice(session, rng, ai)
+                            pre_turn_log_mark = session.log.mark()
                             session.step(player_move_idx=0, enemy_move_idx=enemy_idx)
                             
                             # For non-TTY (tests), print the new messages
                             if not _tty_ok():
-                                new_msgs = session.log[pre_turn_log_len:]
+                                new_msgs = session.log.since(pre_turn_log_mark)
                                 for msg in new_msgs:
                                     print(msg)
                             
@@ -1602,11 +1586,11 @@ def run_battle_ui(session: BattleSession, *, is_trainer: bool = False, trainer_l
                             break
                     else:
                         console.print("[red]You can't use that here.[/red]")
-                        time.sleep(1)
+                        _pause(1)
                         continue  # Stay in bag menu
                 else:
                     console.print("[yellow]Nothing happened.[/yellow]")
-                    time.sleep(1)
+                    _pause(1)
                     continue  # Stay in bag menu
             elif choice == "run":
                 # Enhanced run option with styling
@@ -1635,17 +1619,21 @@ def run_battle_ui(session: BattleSession, *, is_trainer: bool = False, trainer_l
                         return "ESCAPE"
                     else:
                         print(f"{Fore.YELLOW}Couldn't escape!{Style.RESET_ALL}")
-                        enemy_idx = _enemy_move_index(session.enemy.active(), rng)
+                        enemy_idx = _enemy_choice(session, rng, ai)
                         session.step(player_move_idx=0, enemy_move_idx=enemy_idx)
             else:
                 continue
         outcome = session.outcome()
     finally:
-        # Restore previous HP callback (avoid leaking to other battles)
+        # Restore previous event sink (avoid leaking to other battles)
         try:
-            _restore_hp_cb()
+            _restore_sink()
         except Exception:
             pass
+        # Release search worker processes, if the AI owns any
+        close_ai = getattr(ai, 'close', None)
+        if close_ai is not None:
+            close_ai()
         
     # Handle wild battle victory sequence
     if outcome == "PLAYER_WIN" and session.is_wild and not is_trainer:
@@ -1666,7 +1654,7 @@ def run_battle_ui(session: BattleSession, *, is_trainer: bool = False, trainer_l
             # Fallback: just play victory music and stop it
             try:
                 _play_victory_music(is_trainer=False)
-                time.sleep(2)
+                _pause(2)
                 audio.stop_music()
             except Exception:
                 pass
@@ -1726,7 +1714,7 @@ def _wild_battle_victory_sequence(ctx, session, fainted_pokemon_species: int, fa
         # Victory text with typewriter
         try:
             tw.clear_screen()
-            tw.type_out("You won the battle!")
+            _say("You won the battle!", 2)
         except Exception:
             print("You won the battle!")
         
@@ -1751,10 +1739,9 @@ def _wild_battle_victory_sequence(ctx, session, fainted_pokemon_species: int, fa
         # Resume previous music (usually route music)
         if previous_music and previous_music.endswith('.ogg'):
             try:
-                import time
-                time.sleep(0.1)
+                _pause(0.1)
                 audio.stop_music()
-                time.sleep(0.1)
+                _pause(0.1)
                 audio.play_music(previous_music, loop=True)
                 audio.set_music_volume(0.7)
             except Exception:
@@ -1837,7 +1824,6 @@ def _apply_exp_on_faint(ctx, session, fainted_pokemon_species: int, fainted_poke
 
 def _handle_multiple_level_ups(ctx, pokemon, species_id, start_level, pre_stats, levels_gained, *, battle_session=None):
     """Handle multiple level-ups from a single battle, showing proper Pokemon sequence."""
-    import time
     from platinum.battle.factory import derive_stats
     from platinum.data.loader import get_species, level_up_learnset
     from platinum.ui.menu_nav import Menu, MenuItem
@@ -1868,7 +1854,7 @@ def _handle_multiple_level_ups(ctx, pokemon, species_id, start_level, pre_stats,
         # Small delay between levels if multiple
         if level_num < levels_gained - 1:
             try:
-                time.sleep(0.5)
+                _pause(0.5)
             except Exception:
                 pass
 
@@ -2096,14 +2082,14 @@ def _apply_shared_experience(ctx, session, trainer, *, is_trainer: bool = True):
                 cur_exp = min(step_to, cur_exp + steps)
                 print(f"{member.species.capitalize()} gaining EXP... {cur_exp - start_exp}/{gained_exp}")
                 try:
-                    time.sleep(0.02)
+                    _pause(0.02)
                 except Exception:
                     pass
                 if cur_exp >= next_req and cur_level < 100:
                     cur_level += 1
                     print(f"{member.species.capitalize()} leveled up to Lv{cur_level}!")
                     try:
-                        time.sleep(0.05)
+                        _pause(0.05)
                     except Exception:
                         pass
             
@@ -2232,8 +2218,7 @@ def _apply_shared_experience(ctx, session, trainer, *, is_trainer: bool = True):
 def run_trainer_battle(trainer_id: str, ctx, *, rng: Optional[random.Random] = None) -> str:
     """Run a battle using trainer JSON data."""
     from platinum.data.trainers import get_trainer
-    from platinum.battle.factory import battler_from_species
-    from platinum.data.species_lookup import species_id
+    from platinum.battle.prefab import prefab_battler
     from platinum.battle.session import BattleSession, Party
     
     trainer = get_trainer(trainer_id)
@@ -2270,7 +2255,7 @@ def run_trainer_battle(trainer_id: str, ctx, *, rng: Optional[random.Random] = N
             continue
             
         try:
-            battler = battler_from_species(pokemon.species_id, pokemon.level)
+            battler = prefab_battler(pokemon.species_id, pokemon.level)
             enemy_battlers.append(battler)
         except Exception as e:
             print(f"[battle] Failed to create trainer pokemon {pokemon.species_id}: {e}")
@@ -2280,19 +2265,8 @@ def run_trainer_battle(trainer_id: str, ctx, *, rng: Optional[random.Random] = N
         print("[battle] Trainer has no valid Pokemon")
         return "ERROR"
     
-    # Create player's party
-    player_battlers = []
-    for pm in ctx.state.party:
-        try:
-            sid = species_id(pm.species)
-            battler = battler_from_species(sid, pm.level)
-            # Sync HP from save data
-            if hasattr(battler, 'current_hp'):
-                battler.current_hp = pm.hp
-            player_battlers.append(battler)
-        except Exception as e:
-            print(f"[battle] Failed to create player pokemon {pm.species}: {e}")
-            continue
+    # Player's live party battlers (HP/Status/PP carried over)
+    player_battlers = ctx.party_battlers()
     
     if not player_battlers:
         print("[battle] Player has no valid Pokemon")
@@ -2306,7 +2280,9 @@ def run_trainer_battle(trainer_id: str, ctx, *, rng: Optional[random.Random] = N
     )
     
     # For now, use existing battle UI but apply per-faint XP after
-    outcome = run_battle_ui(session, is_trainer=True, trainer_label=trainer.name, rng=rng)
+    outcome = run_battle_ui(session, is_trainer=True, trainer_label=trainer.name, rng=rng,
+                            ai=trainer_ai(trainer_id))
+    ctx.sync_party()
     
     # Apply XP for any Pokemon that fainted during battle
     fainted_enemies = getattr(session, '_fainted_enemies', [])
@@ -2329,7 +2305,7 @@ def run_trainer_battle(trainer_id: str, ctx, *, rng: Optional[random.Random] = N
         
         # Victory sequence with typewriter
         try:
-            tw.type_out(f"You defeated {trainer.name}!")
+            _say(f"You defeated {trainer.name}!", 2)
         except Exception:
             print(f"You defeated {trainer.name}!")
         
@@ -2347,7 +2323,7 @@ def run_trainer_battle(trainer_id: str, ctx, *, rng: Optional[random.Random] = N
         
         # Show trainer's loss dialogue with typewriter
         try:
-            tw.type_out(f"{trainer.name}: {trainer.loss_dialogue}")
+            _say(f"{trainer.name}: {trainer.loss_dialogue}", 2)
         except Exception:
             print(f"{trainer.name}: {trainer.loss_dialogue}")
         
@@ -2366,7 +2342,7 @@ def run_trainer_battle(trainer_id: str, ctx, *, rng: Optional[random.Random] = N
         # Award money
         if trainer.money_won > 0:
             try:
-                tw.type_out(f"You earned ₽{trainer.money_won}!")
+                _say(f"You earned ₽{trainer.money_won}!", 2)
             except Exception:
                 print(f"You earned ₽{trainer.money_won}!")
             
@@ -2401,11 +2377,10 @@ def run_trainer_battle(trainer_id: str, ctx, *, rng: Optional[random.Random] = N
         if previous_music and previous_music.endswith('.ogg'):
             try:
                 # Add a small delay to ensure victory music has stopped
-                import time
-                time.sleep(0.1)
+                _pause(0.1)
                 # Stop any current music first to ensure clean transition
                 audio.stop_music()
-                time.sleep(0.1)
+                _pause(0.1)
                 # Start the route music
                 audio.play_music(previous_music, loop=True)
                 audio.set_music_volume(0.7)  # Set proper volume
@@ -105,6 +105,24 @@ def read_key() -> KeyEvent:
             "b": Key.B, "B": Key.B
         }.get(line, Key.OTHER), line)
 
+def key_pending() -> bool:
+    """True if a key is waiting on stdin; never blocks.
+
+    On a POSIX terminal in cooked mode input only arrives after Enter, so
+    that is the key that registers there.
+    """
+    if sys.platform.startswith("win"):
+        try:
+            import msvcrt  # type: ignore
+            return bool(msvcrt.kbhit())
+        except Exception:
+            return False
+    try:
+        r, _, _ = select.select([sys.stdin], [], [], 0)
+        return bool(r)
+    except Exception:
+        return False
+
 def flush_input():
     """Best-effort flush of pending keyboard buffer for debounce.
 
@@ -28,6 +28,7 @@ def options_submenu(settings) -> None:
                 (f"Text Speed [{settings.data.text_speed}]", "text_speed"),
                 (f"Log Level [{settings.data.log_level}]", "log_level"),
                 (f"Menu Color [{settings.data.menu_color}]", "menu_color"),
+                (f"Battle Speed [{settings.data.battle_speed}]", "battle_speed"),
                 ("Return", "return")
             ],
             footer="↑/↓ or W/S • Enter to edit • Esc to return"
@@ -40,6 +41,8 @@ def options_submenu(settings) -> None:
             _edit_log_level(settings)
         elif choice == "menu_color":
             _edit_menu_color(settings)
+        elif choice == "battle_speed":
+            _edit_battle_speed(settings)
 
 def _edit_text_speed(settings):
     choice = select_menu(
@@ -56,6 +59,21 @@ def _edit_text_speed(settings):
         settings.data.normalize()
         settings.save()
 
+def _edit_battle_speed(settings):
+    choice = select_menu(
+        "BATTLE SPEED",
+        [
+            ("Normal", "normal"),
+            ("Fast", "fast"),
+            ("Instant (no animations)", "instant"),
+            ("Cancel", "cancel")
+        ]
+    )
+    if choice in ("normal", "fast", "instant"):
+        settings.data.battle_speed = choice
+        settings.data.normalize()
+        settings.save()
+
 def _edit_log_level(settings):
     choice = select_menu(
         "LOG LEVEL",
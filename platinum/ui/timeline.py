@@ -0,0 +1,65 @@
+"""Frame timeline for terminal effects.
+
+:func:`run_frames` draws frame ``i`` of an effect at ``start + i / fps`` on
+a monotonic clock instead of sleeping a fixed ``1 / fps`` after each frame,
+so slow renders don't stretch the effect. When a frame finishes after the
+next deadline has passed, the frames that are already late are dropped and
+the timeline jumps to the one due now (the last frame is always drawn). A
+``cancel`` callable (e.g. :func:`platinum.ui.keys.key_pending`) is polled
+before every frame and ends the effect early.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Callable, Optional
+import time
+
+@dataclass
+class TimelineStats:
+    target_fps: float
+    frames: int           # frames in the effect
+    drawn: int = 0
+    dropped: int = 0
+    elapsed: float = 0.0  # seconds, including the wait after the last frame
+    cancelled: bool = False
+
+    @property
+    def achieved_fps(self) -> float:
+        return self.drawn / self.elapsed if self.elapsed > 0 else 0.0
+
+def run_frames(draw: Callable[[int], None], frames: int, fps: float, *,
+               cancel: Optional[Callable[[], bool]] = None,
+               clock: Callable[[], float] = time.monotonic,
+               sleep: Callable[[float], None] = time.sleep) -> TimelineStats:
+    """Call ``draw(i)`` for frame indices ``0 .. frames - 1`` paced at ``fps``."""
+    stats = TimelineStats(fps, frames)
+    if frames <= 0:
+        return stats
+    period = 1.0 / fps
+    start = clock()
+    f = 0
+    while True:
+        if cancel is not None and cancel():
+            stats.cancelled = True
+            break
+        draw(f)
+        stats.drawn += 1
+        if f >= frames - 1:
+            now = clock()
+            end = start + frames * period
+            if now < end:
+                sleep(end - now)
+            break
+        now = clock()
+        deadline = start + (f + 1) * period
+        if now < deadline:
+            sleep(deadline - now)
+            f += 1
+        else:
+            # Behind schedule: skip straight to the frame due now
+            due = min(frames - 1, max(f + 1, int((now - start) / period)))
+            stats.dropped += due - f - 1
+            f = due
+    stats.elapsed = clock() - start
+    return stats
+
+__all__ = ["TimelineStats", "run_frames"]
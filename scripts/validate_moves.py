@@ -127,32 +127,12 @@ def simulate_move(slug: str, md: Dict[str, Any]) -> Tuple[bool, Dict[str, Any]]:
     for _ in range(steps):
         session.step(player_move_idx=0, enemy_move_idx=0)
 
-    # Build logs and split into player's vs enemy's action segments to avoid
-    # attributing the enemy's Splash message ("But nothing happened.") to the player's move.
-    full_lines = list(session.log)
-    log = "\n".join(full_lines).lower()
-    enemy_name = session.enemy.active().name.lower()
-    player_name = session.player.active().name.lower()
-    enemy_used_idx = None
-    player_used_idx = None
-    for i, ln in enumerate(full_lines):
-        low = ln.lower()
-        if enemy_used_idx is None and low.startswith(f"{enemy_name} used "):
-            enemy_used_idx = i
-        if player_used_idx is None and low.startswith(f"{player_name} used "):
-            player_used_idx = i
-        if enemy_used_idx is not None and player_used_idx is not None:
-            break
-    if player_used_idx is None:
-        # Fallback to everything before enemy action
-        player_lines = full_lines if enemy_used_idx is None else full_lines[:enemy_used_idx]
-    else:
-        # Take from player's action to before the opponent's action if it comes after
-        if enemy_used_idx is not None and enemy_used_idx > player_used_idx:
-            player_lines = full_lines[player_used_idx:enemy_used_idx]
-        else:
-            player_lines = full_lines[player_used_idx:]
-    player_log = "\n".join(player_lines).lower()
+    # The structured log files each entry under the acting side, so the enemy's
+    # Splash ("But nothing happened.") is never attributed to the player's move.
+    log = session.log
+    outcomes = [log.outcome("player", turn) for turn in range(1, steps + 1)]
+    player = outcomes[-1]
+    keys = set().union(*(o.keys for o in outcomes))
     e_after_hp = session.enemy.active().current_hp or session.enemy.active().stats["hp"]
     p_after_hp = session.player.active().current_hp or session.player.active().stats["hp"]
     stages_after = asdict(session.enemy.active().stages)
@@ -164,20 +144,14 @@ def simulate_move(slug: str, md: Dict[str, Any]) -> Tuple[bool, Dict[str, Any]]:
     user_healed_or_damaged = int(p_after_hp) != int(p_before_hp)
     stage_changed = stages_before != stages_after or p_stages_before != p_stages_after
     status_changed = status_before != status_after
-    field_changed = any(
-        key in player_log for key in [
-            "sunlight", "rain", "sandstorm", "hail", "reflect", "light screen", "wore off", "started", "kicked up",
-            "veil of water", "aqua ring", "ability was suppressed", "mist shrouded", "levitated",
-            "dimensions were twisted", "the dimensions were twisted", "pointed stones", "stat changes were eliminated"
-        ]
-    )
-    no_effect_msg = "doesn't affect" in player_log
-    nothing_happened_msg = "nothing happened" in player_log
-    failed_msg = "but it failed" in player_log
-    began_charge = "began charging" in log
-    unleashed = "unleashes" in log
-    faint_in_log = "fainted!" in log
-    impact_msg = (" used " in player_log) and ("super effective" in player_log or "not very effective" in player_log or "critical hit" in player_log)
+    field_changed = bool(player.fields) or "effect" in player.keys
+    no_effect_msg = "no-effect" in player.keys
+    nothing_happened_msg = "nothing" in player.keys
+    failed_msg = "failed" in player.keys
+    began_charge = "charging" in keys
+    unleashed = "unleash" in keys
+    faint_in_log = bool(log.entries("faint"))
+    impact_msg = player.used and (player.crit or player.effectiveness != 1.0)
 
     category = md.get("category") or "status"
     power = md.get("power") or 0
@@ -220,7 +194,7 @@ def simulate_move(slug: str, md: Dict[str, Any]) -> Tuple[bool, Dict[str, Any]]:
     "impact_msg": impact_msg,
         "began_charge": began_charge,
         "unleashed": unleashed,
-        "log_tail": "\n".join(session.log[-5:]),
+        "log_tail": "\n".join(log[-5:]),
         "success": success,
         "reasons": reasons,
     }
@@ -3,6 +3,7 @@
 # This file is currently disabled to remove startup banners
 # If you need enhanced terminal features, run setup_requirements.py first
 
+import multiprocessing
 import os
 import sys
 
@@ -13,6 +14,7 @@ def setup_rich_terminal():
         os.system('title Pokemon Platinum')
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     print("Starting Pokemon Platinum...")
     
     setup_rich_terminal()
@@ -0,0 +1,52 @@
+import random
+from platinum.battle.abilities import NO_ABILITY_HOOKS, ability_hooks
+from platinum.battle.core import BattleCore, FieldState, Move
+from platinum.battle.factory import battler_from_species
+from platinum.battle.session import BattleSession, Party
+
+TACKLE = Move(name='Tackle', type='normal', category='physical', power=40, accuracy=None, flags={'contact': True})
+
+
+def test_hooks_resolve_once_and_suppression_swaps_them():
+    assert ability_hooks('keen-eye') is NO_ABILITY_HOOKS
+    assert ability_hooks('Guts') is ability_hooks('guts')
+    b = battler_from_species(390, 10)
+    assert b.ability_hooks.name == 'blaze'
+    b.ability_suppressed = True
+    b.attach_hooks()
+    assert b.ability_hooks is NO_ABILITY_HOOKS
+
+
+def test_damage_calc_hooks():
+    core = BattleCore(rng=random.Random(0))
+    user, target = battler_from_species(399, 20), battler_from_species(396, 20)
+    field = FieldState()
+    plain = core.hit_base(user, target, TACKLE, field, False)
+    user.status = 'brn'
+    assert core.hit_base(user, target, TACKLE, field, False) < plain
+    user.ability = 'guts'
+    user.attach_hooks()
+    assert core.hit_base(user, target, TACKLE, field, False) > plain
+    assert core.stab(user, TACKLE) == 1.5
+    user.ability = 'adaptability'
+    user.attach_hooks()
+    assert core.stab(user, TACKLE) == 2.0
+
+
+def test_contact_and_switch_in_hooks():
+    log = []
+    core = BattleCore(rng=random.Random(2), message_cb=log.append)
+    attacker, defender = battler_from_species(399, 20), battler_from_species(396, 20)
+    defender.ability = 'rough-skin'
+    defender.attach_hooks()
+    core.single_turn(attacker, TACKLE, defender, Move(name='Splash', type='normal', category='status', accuracy=None), FieldState())
+    assert attacker.current_hp == attacker.stats['hp'] - defender.stats['hp'] // 16
+    assert any('Rough Skin' in line for line in log)
+
+    staravia = battler_from_species(397, 20)
+    player = Party([battler_from_species(387, 20), battler_from_species(390, 20)])
+    session = BattleSession(player, Party([staravia]), core=BattleCore(rng=random.Random(1)))
+    assert player.active().stages.attack == -1
+    session.switch('player', 1)
+    assert player.active().stages.attack == 0
+    assert sum("Intimidate" in line for line in session.log) == 1
@@ -0,0 +1,47 @@
+from platinum.battle.ai import _side_vals, AIProfile, ExpectimaxAI, TRAINER_PROFILES, profile_for_trainer
+from platinum.battle.factory import battler_from_species
+from platinum.battle.session import BattleSession, Party
+
+
+def test_profiles_scale_with_trainer_tier():
+    assert profile_for_trainer('gym_leader_roark') is TRAINER_PROFILES['gym_leader']
+    assert profile_for_trainer('rival_barry_1') is TRAINER_PROFILES['rival']
+    assert profile_for_trainer('youngster_logan') is TRAINER_PROFILES['route']
+    assert profile_for_trainer(None) is TRAINER_PROFILES['route']
+    assert TRAINER_PROFILES['gym_leader'].budget_ms > TRAINER_PROFILES['route'].budget_ms
+    assert TRAINER_PROFILES['gym_leader'].max_depth > TRAINER_PROFILES['route'].max_depth
+
+
+def test_picks_super_effective_move():
+    me = battler_from_species(74, 12, moves=['tackle', 'defense-curl', 'rock-throw'])   # Geodude
+    foe = battler_from_species(396, 12)                                                 # Starly
+    ai = ExpectimaxAI(AIProfile(budget_ms=10_000, max_depth=2))
+    assert me.moves[ai.choose_move(me, foe)].name == 'Rock Throw'
+    assert ai.last.depth == 2 and ai.last.nodes > 0 and ai.last.nodes_per_sec > 0
+
+
+def test_skips_moves_without_pp_and_handles_struggle():
+    me = battler_from_species(74, 12, moves=['tackle', 'rock-throw'])
+    foe = battler_from_species(396, 12)
+    me.moves[1].pp = 0
+    s = BattleSession(Party([foe]), Party([me]), record_log=False)
+    assert ExpectimaxAI().choose(s) == 0
+    me.moves[0].pp = 0
+    assert ExpectimaxAI().choose(s) == 0
+
+
+def test_zobrist_hash_is_incremental_and_search_is_deterministic():
+    me = battler_from_species(95, 14, moves=['rock-throw', 'screech', 'bind', 'tackle'])
+    foe = battler_from_species(387, 14)
+    foe.status = 'par'
+    ai = ExpectimaxAI(AIProfile(budget_ms=10_000, max_depth=2))
+    first = ai.choose_move(me, foe)
+    assert ai.tt
+    vals = tuple(_side_vals(me) + _side_vals(foe))
+    h = ai.zobrist.hash(vals)
+    for _, mv0 in ai._moves[0]:
+        for _, mv1 in ai._moves[1]:
+            outcomes = ai._turn(vals, h, mv0, mv1)
+            assert abs(sum(p for p, _, _ in outcomes) - 1.0) < 1e-9
+            assert all(ch == ai.zobrist.hash(cv) for _, cv, ch in outcomes)
+    assert ExpectimaxAI(AIProfile(budget_ms=10_000, max_depth=2)).choose_move(me, foe) == first
@@ -0,0 +1,38 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from platinum.battle.analysis import analyze, route_opponents, trainer_opponents
+from platinum.battle.core import BattleCore, FieldState
+from platinum.battle.sim import MemberSpec
+
+
+def test_expected_damage_matches_core_average():
+    chimchar, starly = MemberSpec(390, 12, ("ember",)), MemberSpec(396, 12, ("tackle",))
+    report = analyze([chimchar], [starly])
+    core = BattleCore(rng=random.Random(7))
+    core.sink = None
+    a, b = chimchar.build(), starly.build()
+    mean = np.mean([core.calc_damage(a, b, a.moves[0], FieldState())["total"] for _ in range(4000)])
+    accuracy = (a.moves[0].accuracy or 100) / 100
+    assert report.damage[0, 0, 0] == pytest.approx(mean * accuracy / b.stats.hp, rel=0.05)
+    assert report.effectiveness[0, 0, 0] == 1.0
+    assert np.isnan(report.effectiveness[0, 1:, 0]).all()
+
+
+def test_gaps_best_attacker_and_threats():
+    party = [MemberSpec(393, 14, ("bubble",)), MemberSpec(396, 14, ("tackle",))]
+    opponents, weights = trainer_opponents("gym_leader_roark")
+    report = analyze(party, opponents, weights)
+    assert report.gaps == []
+    assert all(b.member.startswith("Piplup") and b.move == "Bubble" for b in report.best)
+    assert {t.opponent for t in report.threats} == set(report.opponents)
+    assert report.to_dict()["best_damage"] == report.best_damage().round(4).tolist()
+
+    route, weights = route_opponents("route203")
+    assert sum(weights) == pytest.approx(1.0)
+    report = analyze(party, route, weights)
+    scores = [t.damage * t.weight for t in report.threats]
+    assert scores == sorted(scores, reverse=True)
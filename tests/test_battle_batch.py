@@ -0,0 +1,36 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from platinum.battle.batch import BatchBattle, DRAW, supports_move, validate_against_core
+from platinum.battle.core import Move
+from platinum.battle.sim import MemberSpec
+
+
+def test_supports_move_subset():
+    assert supports_move(Move(name='Ember', type='fire', category='special', power=40, ailment='burn', ailment_chance=10))
+    assert not supports_move(Move(name='Thunder Shock', type='electric', category='special', power=40, ailment='paralysis', ailment_chance=10))
+    assert not supports_move(Move(name='Rock Blast', type='rock', category='physical', power=25, hits=(2, 5)))
+    assert not supports_move(Move(name='Growl', type='normal', category='status'))
+
+
+def test_batch_rejects_unsupported_moves():
+    with pytest.raises(ValueError):
+        BatchBattle.replicate(MemberSpec(399, 5).build(), MemberSpec(396, 5, ("growl",)).build(), 4)
+
+
+def test_batch_runs_all_battles_to_completion():
+    res = BatchBattle.replicate(MemberSpec(390, 10, ("ember", "scratch")).build(),
+                                MemberSpec(396, 10, ("tackle",)).build(), 500, seed=1).run()
+    assert res.battles == 500
+    assert set(np.unique(res.winner)) <= {0, 1, DRAW}
+    assert (res.turns > 0).all()
+
+
+@pytest.mark.parametrize("player,enemy,seed", [
+    (MemberSpec(390, 10, ("ember", "scratch")), MemberSpec(396, 11, ("tackle", "quick-attack", "wing-attack")), 3),
+    (MemberSpec(393, 12, ("bubble", "pound")), MemberSpec(13, 12, ("poison-sting",)), 5),
+])
+def test_batch_matches_core_distributions(player, enemy, seed):
+    report = validate_against_core(player, enemy, core_battles=400, batch_battles=10000, seed=seed)
+    assert report.passed, report
@@ -0,0 +1,61 @@
+import random
+from platinum.battle.core import SPREAD_MODIFIER, BattleCore, FieldState
+from platinum.battle.doubles import DoubleBattleSession
+from platinum.battle.factory import battler_from_species, move_from_data
+from platinum.battle.session import Party
+
+
+def _team(*species, level=30):
+    return [battler_from_species(s, level) for s in species]
+
+
+def test_targets_follow_move_target_and_spread_moves_are_weakened():
+    core = BattleCore(rng=random.Random(1))
+    user, ally = _team(387, 390)
+    foes = _team(396, 399)
+    sel = lambda slug, chosen=None: core.select_targets(user, move_from_data(slug), [user, ally], foes, chosen)
+    assert sel('earthquake') == foes + [ally]
+    assert sel('growl') == foes and sel('helping-hand') == [ally]
+    assert sel('tackle', 1) == [foes[1]] and sel('tackle') == [foes[0]]
+    foes[1].current_hp = 0
+    # A fainted target is replaced by the other foe
+    assert sel('tackle', 1) == [foes[0]] and sel('growl') == [foes[0]]
+    tackle = move_from_data('tackle')
+    base = core.hit_base(user, foes[0], tackle, FieldState(), False)
+    core.spread = SPREAD_MODIFIER
+    assert core.hit_base(user, foes[0], tackle, FieldState(), False) == base * SPREAD_MODIFIER
+
+
+def test_double_battle_orders_all_actors_and_refills_slots():
+    player = Party(_team(387, 390, 393))
+    enemy = Party(_team(396, 399, level=12))
+    s = DoubleBattleSession(player, enemy, core=BattleCore(rng=random.Random(4)))
+    assert [b.name for b in s.actives(0)] == [m.name for m in player.members[:2]]
+    s.step([(0, 1), (0, 1)], [(0, 0), (0, 0)])
+    acted = [e.actor for e in s.log.entries('action', turn=1)]
+    by_speed = sorted(s.actives(0) + s.actives(1), key=lambda b: b.effective_speed(), reverse=True)
+    assert acted == [b.name for b in by_speed if b.name in acted]
+    assert s.run_auto() == "PLAYER_WIN"
+    # Faints are filed under the action that caused them
+    faints = s.log.entries('faint')
+    assert {e.payload['target'] for e in faints} == {m.name for m in enemy.members}
+    assert {e.side for e in faints} == {'player'}
+
+
+def test_tag_battle_takes_one_slot_from_each_party():
+    player = Party(_team(387))
+    partner = Party(_team(390))
+    enemy = Party(_team(396, 399, 403))
+    s = DoubleBattleSession(player, enemy, core=BattleCore(rng=random.Random(2)), partner=partner)
+    assert s.actives(0) == [player.members[0], partner.members[0]]
+    assert s._side_of(partner.members[0]) == 'player'
+    s.step([(0, None), (0, None)])
+    assert s.log.outcome('player', 1).used
+    enemy.members[0].current_hp = 0
+    s.replace_fainted()
+    assert s.actives(1) == [enemy.members[2], enemy.members[1]]
+
+
+def test_run_auto_turn_limit_reports_stalemate():
+    s = DoubleBattleSession(Party(_team(387, 390)), Party(_team(396, 399)), core=BattleCore(rng=random.Random(2)))
+    assert s.run_auto(max_turns=1) == "STALEMATE" and s.turn_counter == 1
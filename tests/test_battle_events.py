@@ -0,0 +1,76 @@
+import random
+from types import SimpleNamespace
+from platinum.battle.core import BattleCore, FieldState
+from platinum.battle.events import Damage, Faint, FieldChange, MoveUsed, StatStage, TextSink, tee
+from platinum.battle.factory import battler_from_species
+from platinum.battle.session import BattleSession, Party
+
+
+def test_core_emits_typed_events():
+    events = []
+    core = BattleCore(rng=random.Random(2), sink=events.append)
+    a = battler_from_species(387, 10, moves=['tackle', 'withdraw'])
+    b = battler_from_species(396, 8, moves=['growl', 'sunny-day'])
+    field = FieldState()
+    core.single_turn(a, a.moves[0], b, b.moves[1], field)
+    core.single_turn(a, a.moves[1], b, b.moves[0], field)
+    used = [e for e in events if isinstance(e, MoveUsed)]
+    assert [e.move.name for e in used][:2] in (['Tackle', 'Sunny Day'], ['Sunny Day', 'Tackle'])
+    hits = [e for e in events if isinstance(e, Damage) and e.cause == 'move']
+    assert hits and hits[0].target is b and hits[0].old_hp - hits[0].new_hp > 0
+    assert FieldChange('sun', True) in events
+    assert StatStage(a, 'defense', 1) in events and StatStage(a, 'attack', -1) in events
+
+
+def test_session_log_is_formatted_from_events():
+    a = battler_from_species(387, 30, moves=['tackle'])
+    b = battler_from_species(396, 2, moves=['growl'])
+    s = BattleSession(Party([a]), Party([b]), core=BattleCore(rng=random.Random(1)))
+    s.step(0, 0)
+    assert s.log[0].startswith('Turtwig used Tackle!')
+    assert 'Starly fainted!' in s.log
+
+
+def test_headless_session_has_no_sink():
+    a = battler_from_species(387, 30, moves=['tackle'])
+    b = battler_from_species(396, 2, moves=['growl'])
+    s = BattleSession(Party([a]), Party([b]), record_log=False)
+    assert s.core.sink is None
+    s.step(0, 0)
+    assert s.log == [] and s.outcome() == 'PLAYER_WIN'
+
+
+def test_tee_fans_out_and_text_sink_skips_silent_events():
+    lines, events = [], []
+    sink = tee(None, TextSink(lines.append), events.append)
+    b = battler_from_species(396, 2)
+    sink(Damage(b, 10, 4, 'move'))
+    sink(Faint(b))
+    assert lines == ['Starly fainted!'] and len(events) == 2
+    assert tee(None) is None
+
+
+def test_session_keeps_sink_installed_on_passed_core():
+    events = []
+    a = battler_from_species(387, 30, moves=['tackle'])
+    b = battler_from_species(396, 2, moves=['growl'])
+    s = BattleSession(Party([a]), Party([b]), core=BattleCore(rng=random.Random(1), sink=events.append))
+    s.step(0, 0)
+    assert any(isinstance(e, Faint) for e in events) and 'Starly fainted!' in s.log
+    headless = BattleSession(Party([a]), Party([b]), core=BattleCore(sink=events.append), record_log=False)
+    assert headless.core.sink == events.append
+
+
+def test_service_debug_loop_restores_message_cb(monkeypatch):
+    from platinum.battle.service import BattleService
+    from platinum.system.settings import Settings
+    monkeypatch.setattr(Settings, 'load', classmethod(lambda cls: SimpleNamespace(data=SimpleNamespace(debug=True))))
+    lines = []
+    service = BattleService()
+    service.core.message_cb = lines.append
+    a = battler_from_species(387, 30, moves=['tackle'])
+    b = battler_from_species(396, 2, moves=['growl'])
+    service._loop(a, b, a.moves[0], b.moves[0], 'debug_test')
+    assert service.core.message_cb == lines.append and lines == []
+    service.core.sink(Faint(b))
+    assert lines == ['Starly fainted!']
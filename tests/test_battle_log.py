@@ -0,0 +1,54 @@
+import random
+from platinum.battle.core import BattleCore, Move
+from platinum.battle.factory import battler_from_species, move_from_data
+from platinum.battle.log import BattleLog, read_export
+from platinum.battle.session import BattleSession, Party
+
+SPLASH = Move(name='Splash', type='normal', category='status', accuracy=None)
+
+
+def _session(player_moves, enemy_moves, seed=1, **kw):
+    a, b = battler_from_species(387, 30), battler_from_species(396, 30)
+    a.moves, b.moves = player_moves, enemy_moves
+    return BattleSession(Party([a]), Party([b]), core=BattleCore(rng=random.Random(seed)), is_wild=False, **kw)
+
+
+def test_ring_buffer_keeps_recent_entries_and_reads_as_lines():
+    log = BattleLog(3)
+    for i in range(5):
+        log.append(f"line {i}")
+    assert log == ["line 2", "line 3", "line 4"] and len(log) == 3 and log[-1] == "line 4"
+    mark = log.mark()
+    log.append("line 5")
+    assert log.since(mark) == ["line 5"] and "line 5" in log
+    log.truncate(mark)
+    assert list(log) == ["line 3", "line 4"] and log.mark() == mark
+
+
+def test_outcome_attributes_effects_to_the_acting_side():
+    s = _session([move_from_data('tackle'), move_from_data('growl')], [SPLASH])
+    hp = s.enemy.active().current_hp
+    s.step(0, 0)
+    out = s.log.outcome('player', 1)
+    assert out.used and out.move == 'Tackle' and out.dealt() == hp - s.enemy.active().current_hp > 0
+    assert "nothing" not in out.keys and "nothing" in s.log.outcome('enemy', 1).keys
+    snap = s.snapshot()
+    s.step(1, 0)
+    out = s.log.outcome('player')
+    assert out.turn == 2 and out.stages == [(s.enemy.active().name, 'attack', -1)]
+    s.restore(snap)
+    assert not s.log.entries(turn=2) and s.log.outcome('player').turn == 1
+
+
+def test_export_streams_gzip_jsonl(tmp_path):
+    path = tmp_path / "battle.jsonl.gz"
+    s = _session([move_from_data('ember')], [move_from_data('tackle')], log_capacity=4, log_export=path)
+    for _ in range(3):
+        s.step(0, 0)
+    s.close_log()
+    entries = read_export(path)
+    assert len(s.log.entries()) == 4 < len(entries)
+    assert [e.seq for e in entries] == list(range(len(entries)))
+    assert entries[-4:] == s.log.entries()
+    moves = [e for e in entries if e.kind == 'move']
+    assert {e.side for e in moves} == {'player', 'enemy'} and all(e.turn >= 1 for e in moves)
@@ -0,0 +1,55 @@
+import sys
+
+from platinum.battle import mcts
+from platinum.battle.ai import ExpectimaxAI, trainer_ai
+from platinum.battle.factory import battler_from_species
+from platinum.battle.mcts import MCTSAI, MCTSProfile
+from platinum.battle.session import BattleSession, Party
+
+
+def _session():
+    player = Party([battler_from_species(396, 14), battler_from_species(399, 13)])      # Starly, Bidoof
+    enemy = Party([battler_from_species(74, 14, moves=['tackle', 'defense-curl', 'rock-throw'])])
+    return BattleSession(player, enemy, is_wild=False, record_log=False)
+
+
+def test_mcts_is_reproducible_from_seed():
+    profile = MCTSProfile(iterations=150, workers=2, rollout_turns=10)
+    s = _session()
+    with MCTSAI(profile, seed=4) as a, MCTSAI(profile, seed=4) as b:
+        assert a.choose(s) == b.choose(s)
+        assert a.root_stats == b.root_stats
+        assert a.last.iterations == 300 and a.last.nodes >= 300 and a.last.nodes_per_sec > 0
+    assert s.turn_counter == 0 and s.enemy.active().current_hp == s.enemy.active().stats['hp']
+
+
+def test_mcts_prefers_super_effective_move():
+    ai = MCTSAI(MCTSProfile(iterations=300, workers=1, rollout_turns=10), seed=1)
+    s = _session()
+    assert s.enemy.active().moves[ai.choose(s)].name == 'Rock Throw'
+
+
+def test_trainer_ai_uses_mcts_for_late_game_tiers():
+    ai = trainer_ai('elite_four_aaron')
+    assert isinstance(ai, MCTSAI)
+    ai.close()
+    assert isinstance(trainer_ai('gym_leader_roark'), ExpectimaxAI)
+
+
+def test_mcts_searches_in_process_when_frozen_or_pool_fails(monkeypatch):
+    profile = MCTSProfile(iterations=100, workers=2, rollout_turns=10)
+    s = _session()
+    with MCTSAI(profile, seed=4) as reference:
+        expected = reference.choose(s), reference.root_stats
+
+    def no_pool(*args, **kwargs):
+        raise OSError("no process pool here")
+    monkeypatch.setattr(mcts, "ProcessPoolExecutor", no_pool)
+    monkeypatch.setattr(mcts.os, "cpu_count", lambda: 4)
+    broken = MCTSAI(profile, seed=4)
+    assert (broken.choose(s), broken.root_stats) == expected
+    assert broken.last.workers == 1 and broken._serial
+
+    monkeypatch.setattr(sys, "frozen", True, raising=False)
+    frozen = MCTSAI(profile, seed=4)
+    assert (frozen.choose(s), frozen.root_stats) == expected and not frozen._serial
@@ -0,0 +1,28 @@
+from platinum.battle.factory import battler_from_species
+from platinum.battle.prefab import PrefabCache
+
+
+def test_prefab_clones_match_a_fresh_build_and_are_independent():
+    cache = PrefabCache()
+    a = cache.battler(396, 12)
+    b = cache.battler(396, 12, nickname="Wild Starly")
+    assert a == battler_from_species(396, 12)
+    assert b.name == "Wild Starly" and cache.hits == 1 and cache.misses == 1
+    a.moves[0].pp -= 1
+    a.stats.hp += 5
+    a.current_hp = 1
+    c = cache.battler(396, 12)
+    assert c.moves[0].pp == c.moves[0].max_pp and c == battler_from_species(396, 12)
+    assert all(m is not n for m, n in zip(a.moves, c.moves))
+
+
+def test_prefab_keys_on_moveset_and_evicts_least_recently_used():
+    cache = PrefabCache(capacity=2)
+    custom = cache.battler(387, 10, moves=["tackle", "withdraw"])
+    assert [m.slug for m in custom.moves] == ["tackle", "withdraw"]
+    cache.battler(387, 10)
+    cache.battler(387, 10, moves=["tackle", "withdraw"])
+    cache.battler(390, 10)
+    assert len(cache) == 2 and cache.evictions == 1
+    cache.battler(387, 10)
+    assert cache.stats()["misses"] == 4
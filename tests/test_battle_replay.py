@@ -0,0 +1,61 @@
+import random
+import pytest
+from platinum.battle.core import BattleCore
+from platinum.battle.factory import battler_from_species
+from platinum.battle.replay import Replay, ReplayMismatch, ReplayRecorder
+from platinum.battle.session import BattleSession, Party
+
+
+def _session(seed=3, is_wild=True):
+    player = Party([battler_from_species(387, 14), battler_from_species(390, 12)])
+    enemy = Party([battler_from_species(396, 13), battler_from_species(399, 12)])
+    return BattleSession(player, enemy, core=BattleCore(rng=random.Random(seed)), is_wild=is_wild)
+
+
+def _drive(session, seed=11):
+    rng = random.Random(seed)
+    session.attempt_flee()
+    session.switch('player', 1)
+    session.step(0, 1)
+    session.step(0, 0)
+    assert session.use_item('potion')
+    session.attempt_capture('poke-ball')
+    while not session.is_over() and session.turn_counter < 40:
+        session.step(rng.randrange(4), rng.randrange(4))
+
+
+def test_replay_roundtrip_reproduces_battle():
+    session = _session()
+    rec = ReplayRecorder(session, seed=1234)
+    _drive(session)
+    data = rec.to_bytes()
+    assert len(data) < 1024
+    replay = Replay.from_bytes(data)
+    assert replay == rec.replay
+    replayed = replay.play(record_log=True)
+    assert replayed.outcome() == session.outcome()
+    assert replayed.log == session.log
+    assert [b.current_hp for b in replayed.enemy.members] == [b.current_hp for b in session.enemy.members]
+
+
+def test_replay_without_seed_captures_rng_state():
+    session = _session(seed=99, is_wild=False)
+    session.core.rng.random()
+    rec = ReplayRecorder(session)
+    for i in range(6):
+        session.step(i % 2, (i + 1) % 2)
+    replay = Replay.from_bytes(rec.to_bytes())
+    assert isinstance(replay.rng, tuple) and not replay.is_wild
+    replay.play()
+
+
+def test_replay_detects_divergence():
+    session = _session()
+    rec = ReplayRecorder(session, seed=5)
+    for _ in range(4):
+        session.step(0, 0)
+    replay = Replay.from_bytes(rec.to_bytes())
+    replay.rng = 6
+    with pytest.raises(ReplayMismatch) as exc:
+        replay.play()
+    assert exc.value.index == 0
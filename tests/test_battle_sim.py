@@ -0,0 +1,29 @@
+from platinum.battle.sim import MemberSpec, parse_member, simulate, trainer_party, wilson_interval
+
+
+def test_parse_member_by_name_and_moves():
+    spec = parse_member("turtwig:12:tackle,withdraw")
+    assert spec == MemberSpec(387, 12, ("tackle", "withdraw"))
+    assert [m.name for m in spec.build().moves] == ["Tackle", "Withdraw"]
+
+
+def test_trainer_party_respects_flags():
+    party = trainer_party("rival_barry_1", flags=["rival_starter_piplup"])
+    assert [m.species for m in party] == [393]
+
+
+def test_simulation_is_reproducible_across_worker_counts():
+    player = [MemberSpec(387, 8)]
+    enemy = [MemberSpec(396, 6), MemberSpec(399, 6)]
+    serial = simulate(player, enemy, 24, seed=7, workers=1)
+    pooled = simulate(player, enemy, 24, seed=7, workers=2, chunk_size=5)
+    assert serial == pooled
+    assert serial.battles == 24 == serial.wins + serial.losses + serial.stalemates
+    assert serial.win_ci[0] <= serial.win_rate <= serial.win_ci[1]
+    assert sum(u.uses for u in serial.player_moves.values()) == sum(k * v for k, v in serial.turn_histogram.items())
+
+
+def test_wilson_interval_bounds():
+    lo, hi = wilson_interval(50, 100)
+    assert 0.40 < lo < 0.5 < hi < 0.60
+    assert wilson_interval(0, 0) == (0.0, 0.0)
@@ -0,0 +1,32 @@
+import pickle
+import pytest
+from platinum.battle.core import Battler, Move, Stages, Stats, FieldState
+from platinum.battle.factory import battler_from_species
+
+
+def test_battle_objects_are_slotted():
+    b = battler_from_species(387, 5)
+    for obj in (b, b.stats, b.stages, b.moves[0], FieldState()):
+        assert not hasattr(obj, '__dict__')
+    with pytest.raises(AttributeError):
+        b._made_up_attr = 1  # type: ignore[attr-defined]
+
+
+def test_stats_mapping_access_and_dict_coercion():
+    b = Battler(species_id=1, name='T', level=5, types=('normal',),
+                stats={'hp': 20, 'atk': 11, 'def': 12, 'sp_atk': 13, 'sp_def': 14, 'speed': 15})
+    assert isinstance(b.stats, Stats)
+    assert b.stats['def'] == b.stats.def_ == 12
+    assert b.stats.get('speed') == 15 and b.stats.get('missing', 7) == 7
+    assert b.stats == {'hp': 20, 'atk': 11, 'def': 12, 'sp_atk': 13, 'sp_def': 14, 'speed': 15}
+    b.stats['atk'] = 30
+    assert b.stats.atk == 30
+    assert b.current_hp == 20 and b.badge_count is None and not b.trick_room_active
+
+
+def test_slotted_battler_pickles():
+    b = battler_from_species(396, 7)
+    b.stages.speed = 2
+    clone = pickle.loads(pickle.dumps(b))
+    assert clone == b and clone.stats == b.stats and clone.stages == Stages(speed=2)
+    assert isinstance(clone.moves[0], Move)
@@ -0,0 +1,31 @@
+from platinum.system.settings import SettingsData
+from platinum.ui import battle as ui
+
+
+def test_battle_speed_setting_is_validated():
+    data = SettingsData(battle_speed="ludicrous")
+    data.normalize()
+    assert data.battle_speed == "normal"
+
+
+def test_pauses_scale_with_battle_speed(monkeypatch):
+    slept = []
+    monkeypatch.setattr(ui.time, "sleep", slept.append)
+    for speed in ("normal", "fast", "instant"):
+        monkeypatch.setattr(ui, "_battle_speed", speed)
+        ui._pause(2)
+    assert slept == [2.0, 0.5]
+    # Instant never animates, even on a terminal
+    monkeypatch.setattr(ui, "_tty_ok", lambda: True)
+    assert not ui._animations_on()
+
+
+def test_say_prints_whole_lines_at_instant_speed(monkeypatch, capsys):
+    typed = []
+    monkeypatch.setattr(ui.tw, "type_out", lambda text, speed_setting=2: typed.append((text, speed_setting)))
+    monkeypatch.setattr(ui, "_battle_speed", "instant")
+    ui._say("You won the battle!", 2)
+    monkeypatch.setattr(ui, "_battle_speed", "fast")
+    ui._say("You earned 100!", 2)
+    assert capsys.readouterr().out == "You won the battle!\n"
+    assert typed == [("You earned 100!", 1)]
@@ -0,0 +1,68 @@
+import random
+from platinum.battle import timers
+from platinum.battle.core import BattleCore, FieldState, Move
+from platinum.battle.factory import battler_from_species, move_from_data
+
+SPLASH = Move(name='Splash', type='normal', category='status', accuracy=None)
+
+
+def _pair():
+    return battler_from_species(387, 20), battler_from_species(396, 20)
+
+
+def test_field_effects_expire_from_the_heap():
+    a, b = _pair()
+    log = []
+    core = BattleCore(rng=random.Random(1), message_cb=log.append)
+    field = FieldState()
+    core.single_turn(a, move_from_data('reflect'), b, move_from_data('rain-dance'), field)
+    assert field.reflect and field.weather == 'rain'
+    assert field.remaining('reflect') == 4 and field.remaining('weather') == 4
+    # Re-starting leaves a stale heap entry that is skipped when it surfaces
+    timers.start(core, field, 'weather', 2, field)
+    for _ in range(2):
+        core.end_of_turn([a, b], field)
+    assert field.weather is None and "The rain stopped." in log
+    assert field.reflect and len(field.timer_heap) == 2
+    for _ in range(2):
+        core.end_of_turn([a, b], field)
+    assert not field.reflect and not field.timers and not field.timer_heap
+    assert "Reflect wore off!" in log
+
+
+def test_battler_timers_tailwind_taunt_and_safeguard():
+    a, b = _pair()
+    log = []
+    core = BattleCore(rng=random.Random(2), message_cb=log.append)
+    field = FieldState()
+    speed = a.effective_speed()
+    core.single_turn(a, move_from_data('tailwind'), b, move_from_data('safeguard'), field)
+    assert a.tailwind and a.effective_speed() == speed * 2
+    assert 'safeguard' in b.timers
+    wave = move_from_data('thunder-wave')
+    assert not core._apply_status(b, 'par', move_type=wave.type)
+    core.single_turn(b, move_from_data('taunt'), a, SPLASH, field)
+    assert 'taunt' in a.timers
+    core.single_turn(a, move_from_data('growl'), b, SPLASH, field)
+    assert any("after the taunt" in line for line in log)
+    # Tailwind (3 turns) has run out; switching clears what is left
+    assert not a.tailwind and a.effective_speed() == speed
+    core.switch_in(a, b, field)
+    assert not a.timers and not a.timer_heap
+
+
+def test_timers_survive_snapshot_restore():
+    a, b = _pair()
+    core = BattleCore(rng=random.Random(3))
+    field = FieldState()
+    core.single_turn(a, move_from_data('trick-room'), b, move_from_data('magnet-rise'), field)
+    f_snap, b_snap = field.snapshot(), b.snapshot()
+    assert a.trick_room_active and b.trick_room_active
+    for _ in range(5):
+        core.end_of_turn([a, b], field)
+    assert not field.timers and not b.timers and not a.trick_room_active
+    field.restore(f_snap)
+    b.restore(b_snap)
+    assert field.remaining('trick-room') == 4 and 'magnet-rise' in b.timers
+    core.end_of_turn([a, b], field)
+    assert field.remaining('trick-room') == 3
@@ -0,0 +1,34 @@
+from platinum.bench import compare, load, run_suite, save
+from platinum.bench.battle import cases
+
+
+def test_battle_suite_runs_and_reports_every_case(tmp_path):
+    doc = run_suite("battle", min_time=0.002, repeat=1, alloc_calls=2)
+    assert set(doc["results"]) == {c.name for c in cases()}
+    r = doc["results"]["single_turn"]
+    assert r["ops_per_sec"] > 0 and r["ns_per_op"] > 0 and r["kib_per_op"] >= 0
+    path = tmp_path / "baseline.json"
+    save(doc, path)
+    assert load(path) == doc
+
+
+def test_compare_flags_slowdowns_beyond_threshold():
+    base = {"results": {"a": {"ops_per_sec": 100.0}, "b": {"ops_per_sec": 100.0}, "gone": {"ops_per_sec": 1.0}}}
+    cur = {"results": {"a": {"ops_per_sec": 95.0}, "b": {"ops_per_sec": 80.0}, "new": {"ops_per_sec": 1.0}}}
+    deltas = {d.name: d for d in compare(base, cur, threshold=0.1)}
+    assert set(deltas) == {"a", "b"}
+    assert not deltas["a"].regressed and deltas["b"].regressed
+    assert round(deltas["b"].change, 2) == -0.2
+
+
+def test_rewinding_replays_the_same_turn():
+    from platinum.battle.core import FieldState
+    from platinum.bench.battle import _core, _rewinding, _teams
+    (a, _), (b, _) = _teams()
+    core, field = _core(3), FieldState()
+
+    def turn():
+        core.single_turn(a, a.moves[0], b, b.moves[0], field)
+        return a.current_hp, b.current_hp, core.rng.random()
+    run = _rewinding(core, (a, b), field, turn)
+    assert len({run() for _ in range(5)}) == 1
@@ -0,0 +1,43 @@
+import copy
+import random
+from platinum.battle.core import BattleCore, FieldState
+from platinum.battle.factory import battler_from_species, move_from_data
+from platinum.battle.memo import DamageMemo
+
+
+def _rolls(core, a, b, move, field, n=40):
+    return [core.calc_damage(a, b, move, field)["total"] for _ in range(n)]
+
+
+def test_memo_returns_the_same_damage_and_counts_hits():
+    a, b = battler_from_species(390, 20), battler_from_species(387, 20)
+    ember, field = move_from_data('ember'), FieldState()
+    plain = _rolls(BattleCore(rng=random.Random(7)), a, b, ember, field)
+    core = BattleCore(rng=random.Random(7))
+    core.damage_memo = memo = DamageMemo()
+    assert _rolls(core, a, b, ember, field) == plain
+    # One entry per crit branch at most; everything else is a hit
+    assert memo.misses <= 2 and memo.hits == 40 - memo.misses and memo.hit_rate > 0.9
+    # Rebuilt battlers (snapshots, pickles) share entries; any state the formula reads does not
+    before = memo.misses
+    core.calc_damage(copy.deepcopy(a), copy.deepcopy(b), ember, field)
+    assert memo.misses == before
+    b.stages.sp_def = 1
+    core.calc_damage(a, b, ember, FieldState(weather='sun'))
+    assert memo.misses == before + 1
+
+
+def test_memo_stays_within_its_budget():
+    a, b = battler_from_species(390, 20), battler_from_species(387, 20)
+    core = BattleCore(rng=random.Random(1))
+    core.damage_memo = memo = DamageMemo(max_bytes=4096)
+    tackle = move_from_data('tackle')
+    for stage in range(-6, 7):
+        a.stages.attack = stage
+        for level in range(5, 25):
+            a.level = level
+            core.calc_damage(a, b, tackle, FieldState())
+    assert 0 < memo.capacity < 20 and len(memo) == memo.capacity
+    assert memo.evictions == memo.misses - memo.capacity
+    memo.clear()
+    assert len(memo) == 0 and memo.stats()["hits"] == 0
@@ -0,0 +1,45 @@
+import random
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from platinum.battle.core import BattleCore, FieldState, Move
+from platinum.battle.factory import battler_from_species
+from platinum.battle.damage import damage_range, damage_table
+
+
+def _quiet_core(seed):
+    return BattleCore(rng=random.Random(seed), message_cb=lambda _m: None)
+
+
+def test_damage_range_matches_sampled_calc_damage():
+    user = battler_from_species(408, 14, moves=['headbutt', 'rock-blast'])
+    target = battler_from_species(390, 12)
+    core = _quiet_core(11)
+    for mv in user.moves:
+        rng_ = damage_range(user, target, mv)
+        assert abs(rng_.total.sum() - 1.0) < 1e-9
+        samples = [core.calc_damage(user, target, mv, FieldState())['total'] for _ in range(20000)]
+        assert min(samples) >= rng_.total.nonzero()[0][0]
+        assert max(samples) <= len(rng_.total) - 1
+        assert abs(np.mean(samples) - rng_.expected) < 0.02 * rng_.expected
+
+
+def test_rock_blast_hit_counts_and_crit_branch():
+    user = battler_from_species(408, 14, moves=['rock-blast'])
+    r = damage_range(user, battler_from_species(396, 10), user.moves[0])
+    assert r.hit_counts == [2, 3, 4, 5]
+    assert r.hit_probs == pytest.approx([0.25] * 4)
+    assert r.crit_chance == pytest.approx(1 / 16)
+    assert min(r.crit_rolls) > max(r.rolls) // 2
+
+
+def test_immune_and_status_moves_deal_nothing():
+    user = battler_from_species(399, 10)
+    ghost = battler_from_species(92, 10)  # Gastly
+    tackle = Move(name='Tackle', type='normal', category='physical', power=40)
+    growl = Move(name='Growl', type='normal', category='status')
+    tbl = damage_table(user, [ghost], [tackle, growl])
+    assert tbl.effectiveness[0, 0] == 0.0
+    assert tbl.per_hit[0, :, 0] == pytest.approx([1.0, 1.0])
+    assert tbl.expected_total.tolist() == [[0.0, 0.0]]
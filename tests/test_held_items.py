@@ -0,0 +1,53 @@
+import pickle
+import random
+from platinum.battle.core import BattleCore, FieldState
+from platinum.battle.factory import battler_from_species
+from platinum.battle.held_items import NO_ITEM_HOOKS, item_hooks
+from platinum.battle.session import BattleSession, Party
+
+
+def test_item_hooks_compile_from_registry_and_asset_data():
+    assert item_hooks(None) is NO_ITEM_HOOKS
+    assert item_hooks('poke-ball') is NO_ITEM_HOOKS
+    assert item_hooks('Leftovers').end_of_turn
+    assert item_hooks('charcoal').damage and item_hooks('flame-plate').damage
+    assert item_hooks('liechi-berry').hp_drop
+    assert item_hooks('power-anklet').speed == 0.5
+    assert item_hooks('choice-scarf').choice_lock and item_hooks('choice-scarf').speed == 1.5
+    b = battler_from_species(390, 10)
+    b.item = 'charcoal'
+    b.attach_hooks()
+    assert pickle.loads(pickle.dumps(b)).item_hooks is b.item_hooks
+
+
+def test_leftovers_and_sitrus_berry():
+    core = BattleCore(rng=random.Random(0))
+    b = battler_from_species(387, 30)
+    b.item = 'leftovers'
+    b.attach_hooks()
+    b.current_hp = b.stats['hp'] - 20
+    core.end_of_turn([b], FieldState())
+    assert b.current_hp == b.stats['hp'] - 20 + b.stats['hp'] // 16
+
+    b.item = 'sitrus-berry'
+    b.attach_hooks()
+    b.current_hp = b.stats['hp']
+    core.apply_damage(b, b.stats['hp'] // 2 + 1)
+    assert b.item is None and b.item_hooks is NO_ITEM_HOOKS
+    assert b.current_hp == b.stats['hp'] - (b.stats['hp'] // 2 + 1) + b.stats['hp'] // 4
+
+
+def test_choice_item_locks_first_move_until_switch():
+    player = Party([battler_from_species(390, 20, moves=['scratch', 'ember']), battler_from_species(387, 20)])
+    enemy = Party([battler_from_species(399, 40)])
+    lead = player.active()
+    lead.item = 'choice-specs'
+    session = BattleSession(player, enemy, core=BattleCore(rng=random.Random(4)))
+    session.step(1, 0)
+    assert lead.choice_lock is lead.moves[1]
+    pp = lead.moves[0].pp
+    session.step(0, 0)
+    assert lead.moves[0].pp == pp
+    session.switch('player', 1)
+    session.switch('player', 0)
+    assert lead.choice_lock is None
@@ -0,0 +1,53 @@
+import random
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from platinum.battle.core import BattleCore, FieldState, Move
+from platinum.battle.factory import battler_from_species
+from platinum.battle.ko import ko_probability, ko_table
+
+SPLASH = Move(name='Splash', type='normal', category='status', accuracy=None)
+
+
+def _matchup():
+    user = battler_from_species(74, 12, moves=['rock-blast', 'tackle'])  # Geodude
+    target = battler_from_species(396, 16)                              # Starly
+    target.moves = [SPLASH]
+    target.status = 'psn'
+    target.item = 'leftovers'
+    return user, target
+
+
+def test_ko_probability_matches_simulated_core():
+    user, target = _matchup()
+    exact = ko_probability(user, target, user.moves[1], turns=4, field=FieldState(weather='hail', timers={'weather': 2}))
+    assert np.all(np.diff(exact) >= -1e-12)
+    core = BattleCore(rng=random.Random(5), message_cb=lambda _m: None)
+    n, ko = 4000, np.zeros(4)
+    for _ in range(n):
+        u, t = _matchup()
+        field = FieldState(weather='hail', timers={'weather': 2})
+        for k in range(4):
+            core.single_turn(u, u.moves[1], t, SPLASH, field)
+            if t.current_hp <= 0:
+                ko[k:] += 1
+                break
+    assert np.abs(ko / n - exact).max() < 0.03
+
+
+def test_ko_table_shape_and_immunity():
+    user = battler_from_species(399, 10, moves=['tackle'])
+    targets = [battler_from_species(92, 10), battler_from_species(396, 3)]  # Gastly is immune to Tackle
+    table = ko_table(user, targets, turns=3)
+    assert table.shape == (2, 1, 3)
+    assert table[0, 0].tolist() == [0.0, 0.0, 0.0]
+    assert table[1, 0, -1] == pytest.approx(1.0)
+
+
+def test_accuracy_and_paralysis_scale_first_turn_ko():
+    user = battler_from_species(74, 30, moves=['rock-throw'])
+    target = battler_from_species(396, 3)
+    assert ko_probability(user, target, user.moves[0], turns=1)[0] == pytest.approx(0.9)
+    user.status = 'par'
+    assert ko_probability(user, target, user.moves[0], turns=1)[0] == pytest.approx(0.9 * 0.75)
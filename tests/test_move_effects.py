@@ -0,0 +1,43 @@
+import pickle
+import random
+from platinum.battle.core import BattleCore, FieldState, Move
+from platinum.battle.effects import EFFECTS, MOVE_EFFECTS, compile_move, effect_kind, register_effect
+from platinum.battle.factory import battler_from_species, move_from_data
+
+
+def test_moves_compile_to_effect_kinds():
+    assert effect_kind(move_from_data('dragon-rage')) == 'fixed-damage'
+    assert effect_kind(move_from_data('counter')) == 'fail'
+    assert effect_kind(move_from_data('sunny-day')) == 'weather'
+    assert effect_kind(move_from_data('growl')) == 'status'
+    assert effect_kind(move_from_data('tackle')) == 'damage'
+    hb = Move(name='Hyper Beam', type='normal', category='special', power=150)
+    assert hb.slug == 'hyper-beam' and hb.effect.keywords['recharge']
+    clone = pickle.loads(pickle.dumps(hb))
+    assert clone == hb and clone.effect.func is hb.effect.func
+
+
+def test_registered_effect_runs_without_core_changes():
+    calls = []
+
+    @register_effect("test-splash")
+    def _splash(core, user, move, target, field):
+        calls.append(move.slug)
+        core._msg("But nothing happened!")
+        return True
+
+    MOVE_EFFECTS['splash'] = ("test-splash", {})
+    try:
+        splash = Move(name='Splash', type='normal', category='status', accuracy=None, max_pp=40, pp=40)
+        a, b = battler_from_species(387, 10), battler_from_species(396, 10)
+        log = []
+        core = BattleCore(rng=random.Random(1), message_cb=log.append)
+        core.single_turn(a, splash, b, Move(name='Splash', type='normal', category='status', accuracy=None), FieldState())
+        assert calls == ['splash', 'splash']
+        assert splash.pp == 39
+        assert "But nothing happened." not in log
+    finally:
+        del MOVE_EFFECTS['splash']
+        del EFFECTS['test-splash']
+    compile_move(splash)
+    assert effect_kind(splash) == 'status'
@@ -0,0 +1,53 @@
+from platinum.battle.roster import PartyRuntime
+from platinum.system.save import PartyMember
+
+
+def _party():
+    return [PartyMember(species='turtwig', level=10, hp=15, max_hp=31, moves=['tackle', 'withdraw'],
+                        move_pp={'tackle': 30, 'withdraw': 40}),
+            PartyMember(species='starly', level=8, hp=20, max_hp=20)]
+
+
+def test_battlers_persist_and_only_dirty_members_sync():
+    party = _party()
+    rt = PartyRuntime()
+    turtwig, starly = rt.battlers(party)
+    assert turtwig.current_hp == 15 and [m.pp for m in turtwig.moves] == [30, 40]
+    turtwig.current_hp = 4
+    turtwig.status = 'psn'
+    turtwig.moves[0].pp -= 1
+    turtwig.stages.attack = 2
+    assert rt.dirty() == [party[0]] and rt.sync() == 1 and rt.sync() == 0
+    assert (party[0].hp, party[0].status, party[0].move_pp['tackle']) == (4, 'psn', 29)
+    # Same objects next battle, with battle-only state cleared
+    again = rt.battlers(party)
+    assert again[0] is turtwig and again[1] is starly and turtwig.stages.attack == 0
+    # Healing on the save model is picked up; a level change rebuilds
+    party[0].hp, party[0].status = 31, 'none'
+    party[1].level = 9
+    turtwig2, starly2 = rt.battlers(party)
+    assert turtwig2 is turtwig and turtwig.current_hp == 31 and turtwig.status == 'none'
+    assert starly2 is not starly and starly2.level == 9
+
+
+def test_sync_merges_hp_when_the_member_changed_during_battle():
+    party = _party()
+    rt = PartyRuntime()
+    turtwig = rt.battlers(party)[0]
+    turtwig.current_hp -= 5
+    # Level-up during the battle screen raised the member's HP
+    party[0].level, party[0].max_hp, party[0].hp = 11, 33, 17
+    rt.sync()
+    assert (party[0].hp, party[0].max_hp) == (12, 33)
+    assert rt.battlers(party)[0].level == 11
+
+
+def test_unknown_saved_move_falls_back_to_learnset_and_counters_reset():
+    party = [PartyMember(species='turtwig', level=12, hp=20, max_hp=35, moves=['not-a-move', 'tackle'])]
+    rt = PartyRuntime()
+    turtwig = rt.battlers(party)[0]
+    assert turtwig.moves and 'not-a-move' not in {m.slug for m in turtwig.moves}
+    turtwig.status, turtwig.toxic_stage, turtwig.sleep_turns = 'tox', 5, 2
+    rt.sync()
+    assert rt.battlers(party)[0] is turtwig
+    assert (turtwig.status, turtwig.toxic_stage, turtwig.sleep_turns) == ('tox', 0, 0)
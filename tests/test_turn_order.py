@@ -0,0 +1,46 @@
+import random
+from platinum.battle.core import BattleCore, Battler, Move
+
+
+def _b(name, speed, status='none', item=None):
+    return Battler(species_id=1, name=name, level=50, types=('normal',), status=status, item=item,
+                   stats={'hp': 100, 'atk': 50, 'def': 50, 'sp_atk': 50, 'sp_def': 50, 'speed': speed})
+
+
+def test_effective_speed_tracks_stages_status_and_item():
+    b = _b('A', 100)
+    assert b.effective_speed() == 100
+    b.stages.speed = 2
+    assert b.effective_speed() == 200
+    b.status = 'par'
+    assert b.effective_speed() == 50
+    b.status = 'none'
+    b.item = 'choice-scarf'
+    b.attach_hooks()
+    assert b.effective_speed() == 300
+    cached = b._speed_cache
+    b.effective_speed()
+    assert b._speed_cache is cached
+
+
+def test_action_order_sorts_n_actors_by_priority_speed_and_trick_room():
+    core = BattleCore(rng=random.Random(1))
+    tackle = Move('Tackle', 'normal', 'physical', 40, 100)
+    quick = Move('Quick Attack', 'normal', 'physical', 40, 100, priority=1)
+    a, b, c, d = _b('A', 50), _b('B', 120), _b('C', 80), _b('D', 10)
+    order = core.action_order([(a, tackle), (b, tackle), (c, tackle), (d, quick)])
+    assert [x.name for x, _ in order] == ['D', 'B', 'C', 'A']
+    a.trick_room_active = True
+    order = core.action_order([(a, tackle), (b, tackle), (c, tackle), (d, quick)])
+    assert [x.name for x, _ in order] == ['D', 'A', 'C', 'B']
+    assert core.turn_order(b, c, tackle, tackle)[0][0] is b
+    c.trick_room_active = True
+    assert core.turn_order(b, c, tackle, tackle)[0][0] is c
+
+
+def test_speed_ties_are_broken_randomly():
+    core = BattleCore(rng=random.Random(3))
+    tackle = Move('Tackle', 'normal', 'physical', 40, 100)
+    a, b = _b('A', 60), _b('B', 60)
+    firsts = {core.turn_order(a, b, tackle, tackle)[0][0].name for _ in range(40)}
+    assert firsts == {'A', 'B'}
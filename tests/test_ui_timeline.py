@@ -0,0 +1,35 @@
+from platinum.ui.timeline import run_frames
+
+
+class FakeClock:
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self):
+        return self.t
+
+    def sleep(self, dt):
+        self.t += dt
+
+
+def test_frames_keep_their_deadlines_and_drop_when_behind():
+    clock = FakeClock()
+    drawn = []
+
+    def draw(f):
+        drawn.append(f)
+        # Frame 2 takes three periods to render
+        clock.t += 0.25 if f == 2 else 0.01
+
+    stats = run_frames(draw, 8, 10, clock=clock, sleep=clock.sleep)
+    assert drawn == [0, 1, 2, 4, 5, 6, 7]
+    assert stats.dropped == 1 and stats.drawn == 7
+    assert abs(stats.elapsed - 0.8) < 1e-9
+    assert abs(stats.achieved_fps - 7 / 0.8) < 1e-9
+
+
+def test_cancel_stops_before_the_next_frame():
+    clock = FakeClock()
+    drawn = []
+    stats = run_frames(drawn.append, 10, 20, cancel=lambda: len(drawn) == 3, clock=clock, sleep=clock.sleep)
+    assert drawn == [0, 1, 2] and stats.cancelled